@@ -0,0 +1,275 @@
+# assembly_slice.py
+# slices an assembly of extruded figures in the three directions X, Y and Z without FreeCAD
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+assembly_slice.py computes the slices of export_2d.export_xyz_to_dxf() directly from the figures of a 3D assembly configuration.
+Each part of the assembly is a format-B figure extruded along Z and placed by positioning.place_plank(),
+so the transformation of a part is a signed permutation of the axes plus a translation:
+a slice parallel to the plane of a part is the placed figure itself,
+a slice perpendicular to it is a set of rectangles: the intervals of the figure on the cut line times the part height.
+The slices and the gauges are written in a DXF file with the layout of export_xyz_to_dxf().
+"""
+
+################################################################
+# import
+################################################################
+
+import sys, argparse
+import six
+import numpy
+#
+from . import design_help # just for get_effective_args()
+from . import outline_array
+from . import outline_backends # just for write_figure_in_dxf()
+from . import positioning # just for place_plank_matrix()
+from . import stl_backend # just for outline_polygon()
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+# maximal distance between an arc and its polyline when the cut lines cross the arcs
+slice_chord_tolerance = 0.01 # mm
+
+# for each slice direction: (depth axis, drawing x axis, drawing y axis)
+slice_axes = {'xy':(2, 0, 1), 'xz':(1, 0, 2), 'yz':(0, 1, 2)}
+
+################################################################
+# placed part
+################################################################
+
+class Placed_Part(object):
+  """ a format-B figure extruded on ai_height and placed with the transformation (matrix, vector)
+  """
+  def __init__(self, ai_figure, ai_height, ai_matrix, ai_vector):
+    self.figure = [outline_array.outline_to_list(ol) for ol in ai_figure]
+    self.height = ai_height
+    self.matrix = ai_matrix
+    self.vector = ai_vector
+    self.polygons = None # computed only for the perpendicular slices
+
+  def place(self, ai_points):
+    """ return the placed coordinates of the (n,3) array ai_points of the part frame
+    """
+    r_points = ai_points.dot(self.matrix.T)+self.vector
+    return(r_points)
+
+  def local_axis(self, ai_axis):
+    """ return the tuple (local axis, sign) of the part frame that is placed on the axis ai_axis
+    """
+    j = int(numpy.argmax(numpy.abs(self.matrix[ai_axis])))
+    r_axis = (j, self.matrix[ai_axis, j])
+    return(r_axis)
+
+  def cut_intervals(self, ai_axis, ai_value):
+    """ return the intervals [v1, v2] of the figure on the line local_axis(ai_axis)==ai_value
+        The figure is filled with the even-odd rule, so the holes are removed
+    """
+    if(self.polygons is None):
+      self.polygons = [stl_backend.outline_polygon(ol, slice_chord_tolerance) for ol in self.figure]
+    other = 1-ai_axis
+    crossings = []
+    for polygon in self.polygons:
+      a = polygon
+      b = numpy.roll(polygon, -1, axis=0)
+      au = a[:,ai_axis]
+      bu = b[:,ai_axis]
+      crossing = ((au<=ai_value)&(bu>ai_value))|((bu<=ai_value)&(au>ai_value)) # half-open edges: a vertex is counted once
+      du = numpy.where(crossing, bu-au, 1.0)
+      v = a[:,other]+(ai_value-au)*(b[:,other]-a[:,other])/du
+      crossings.extend(v[crossing].tolist())
+    crossings.sort()
+    r_intervals = [(crossings[i], crossings[i+1]) for i in range(0, len(crossings)-1, 2)]
+    return(r_intervals)
+
+  def slice_figure(self, ai_depth_axis, ai_depth, ai_draw_axes, ai_offset):
+    """ return the slice of the placed part at the coordinate ai_depth of the axis ai_depth_axis
+        as a list of format-B outlines drawn on the axes ai_draw_axes and shifted by ai_offset
+    """
+    (j, sign) = self.local_axis(ai_depth_axis)
+    local_depth = (ai_depth-self.vector[ai_depth_axis])/sign
+    (da, db) = ai_draw_axes
+    def draw(ai_local_points):
+      placed = self.place(numpy.array(ai_local_points, dtype=float))
+      return([(p[da]+ai_offset[0], p[db]+ai_offset[1]) for p in placed.tolist()])
+    r_figure = []
+    if(j==2): # the slice plane is the plane of the figure
+      if((local_depth<0)or(local_depth>self.height)):
+        return(r_figure)
+      for ol in self.figure:
+        if(isinstance(ol[0], (list, tuple))): # general outline
+          new_ol = []
+          for segment in ol:
+            points = draw([(segment[i], segment[i+1], local_depth) for i in range(0, len(segment), 2)])
+            new_ol.append([v for pt in points for v in pt])
+          new_ol[-1][-2:] = new_ol[0][0:2] # keep the outline exactly closed
+          r_figure.append(new_ol)
+        else: # circle
+          (cx, cy) = draw([(ol[0], ol[1], local_depth)])[0]
+          r_figure.append((cx, cy, ol[2]))
+    else: # the slice plane is perpendicular to the figure: one rectangle per interval
+      for (v1, v2) in self.cut_intervals(j, local_depth):
+        corners = []
+        for (v, z) in ((v1, 0), (v2, 0), (v2, self.height), (v1, self.height)):
+          pt = [0, 0, z]
+          pt[j] = local_depth
+          pt[1-j] = v
+          corners.append(pt)
+        points = draw(corners)
+        r_figure.append([list(pt) for pt in points]+[list(points[0])])
+    return(r_figure)
+
+def placed_parts(ai_3d_conf, ai_zero_x=0, ai_zero_y=0, ai_zero_z=0):
+  """ return the list of Placed_Part of a 3D assembly configuration (list of (format-B figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z))
+      the assembly is shifted by (-ai_zero_x, -ai_zero_y, -ai_zero_z)
+  """
+  r_parts = []
+  for conf in ai_3d_conf:
+    if(len(conf)!=11):
+      six.print_(("ERR681: Error len of the 3d-conf {:d} must be 11".format(len(conf))))
+      sys.exit(2)
+    (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z) = conf
+    (matrix, vector) = positioning.place_plank_matrix(size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z)
+    # the figure is zeroed like in design_output.figures_to_freecad_assembly()
+    vector = vector-matrix.dot((zero_x, zero_y, 0))-numpy.array((ai_zero_x, ai_zero_y, ai_zero_z), dtype=float)
+    r_parts.append(Placed_Part(part_figure, size_z, matrix, vector))
+  return(r_parts)
+
+################################################################
+# slice layout
+################################################################
+
+def rectangle_outline(ai_position_x, ai_position_y, ai_size_x, ai_size_y):
+  """ format-B outline of a rectangle, like export_2d.draw_rectangle()
+  """
+  (x0, y0, x1, y1) = (ai_position_x, ai_position_y, ai_position_x+ai_size_x, ai_position_y+ai_size_y)
+  r_outline = [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+  return(r_outline)
+
+def gauge_figure(ai_drawing_length, ai_drawing_height, ai_representation_max, ai_representation_value, ai_position_x, ai_position_y):
+  """ format-B outlines of the gauge of export_2d.draw_gauge()
+  """
+  l_gauge_value = ai_drawing_length*ai_representation_value/float(ai_representation_max)
+  r_gauge = []
+  r_gauge.append(rectangle_outline(ai_position_x-ai_drawing_height/2.0, ai_position_y, ai_drawing_length+ai_drawing_height, ai_drawing_height))
+  if(l_gauge_value!=0):
+    r_gauge.append(rectangle_outline(ai_position_x, ai_position_y+ai_drawing_height/4.0, l_gauge_value, ai_drawing_height/2.0))
+  return(r_gauge)
+
+def assembly_xyz_slice_figure(ai_3d_conf, ai_size_x, ai_size_y, ai_size_z, ai_zero_x, ai_zero_y, ai_zero_z, ai_xy_slice_list, ai_xz_slice_list, ai_yz_slice_list):
+  """ return the figure (list of format-B outlines) with the slices of the 3D assembly configuration ai_3d_conf
+      in the three directions X, Y and Z with the layout of export_2d.export_xyz_to_dxf()
+  """
+  parts = placed_parts(ai_3d_conf, ai_zero_x, ai_zero_y, ai_zero_z)
+  # calculate the space between two drawings
+  l_space = max(ai_size_x/5.0, ai_size_y/5.0, ai_size_z/5.0)
+  r_figure = []
+  for lo in ['xy','xz','yz']:
+    if(lo=='xy'):
+      (l_draw_y, l_pos_y, l_depth_list, l_shift_x, l_gauge_max) = (2*ai_size_z+7*l_space, 2*ai_size_z+6*l_space, ai_xy_slice_list, ai_size_x, ai_size_z)
+    elif(lo=='xz'):
+      (l_draw_y, l_pos_y, l_depth_list, l_shift_x, l_gauge_max) = (1*ai_size_z+4*l_space, 1*ai_size_z+3*l_space, ai_xz_slice_list, ai_size_x, ai_size_y)
+    elif(lo=='yz'):
+      (l_draw_y, l_pos_y, l_depth_list, l_shift_x, l_gauge_max) = (l_space, 0, ai_yz_slice_list, ai_size_y, ai_size_x)
+    (depth_axis, draw_axis_x, draw_axis_y) = slice_axes[lo]
+    l_pos_x = 0
+    for l_depth in l_depth_list:
+      r_figure.extend(gauge_figure(l_shift_x, l_space/2.0, l_gauge_max, l_depth, l_pos_x, l_pos_y))
+      for part in parts:
+        r_figure.extend(part.slice_figure(depth_axis, l_depth, (draw_axis_x, draw_axis_y), (l_pos_x, l_draw_y)))
+      l_pos_x += l_shift_x+2*l_space
+  return(r_figure)
+
+def assembly_xyz_to_dxf(ai_3d_conf, ai_slice_xyz, ai_output_file):
+  """ write in the DXF file ai_output_file the slices of the 3D assembly configuration ai_3d_conf
+      ai_slice_xyz is the slice3d-configuration [size_x, size_y, size_z, zero_x, zero_y, zero_z, xy_slice_list, xz_slice_list, yz_slice_list]
+  """
+  if(len(ai_slice_xyz)!=9):
+    six.print_(("ERR682: Error, len(ai_slice_xyz) {:d} must be 9".format(len(ai_slice_xyz))))
+    sys.exit(2)
+  (size_x, size_y, size_z, zero_x, zero_y, zero_z, slice_x, slice_y, slice_z) = ai_slice_xyz
+  slice_figure = assembly_xyz_slice_figure(ai_3d_conf, size_x, size_y, size_z, zero_x, zero_y, zero_z, slice_x, slice_y, slice_z)
+  outline_backends.write_figure_in_dxf(slice_figure, ai_output_file)
+  return(slice_figure)
+
+################################################################
+# assembly_slice testing
+################################################################
+
+def assembly_slice_test1(ai_output_dir='test_output'):
+  """ slice a box of six planks with holes and check the slices
+  """
+  r_test = 1
+  design_help.mkdir_p(ai_output_dir)
+  (sx, sy, sz, t) = (100.0, 80.0, 60.0, 5.0)
+  def plank(ai_length, ai_width):
+    return([rectangle_outline(0, 0, ai_length, ai_width), (ai_length/2.0, ai_width/2.0, min(ai_length, ai_width)/4.0)])
+  conf = [
+    (plank(sx, sy), 0, 0, sx, sy, t, 'i', 'xy', 0, 0, 0),
+    (plank(sx, sy), 0, 0, sx, sy, t, 'i', 'xy', 0, 0, sz-t),
+    (plank(sx, sz), 0, 0, sx, sz, t, 'i', 'xz', 0, 0, 0),
+    (plank(sx, sz), 0, 0, sx, sz, t, 'x', 'xz', 0, sy-t, 0),
+    (plank(sy, sz), 0, 0, sy, sz, t, 'i', 'yz', 0, 0, 0),
+    (plank(sy, sz), 0, 0, sy, sz, t, 'i', 'yz', sx-t, 0, 0)]
+  slice_xyz = [sx, sy, sz, 0, 0, 0, [sz/2], [sy/2], [sx/2, t/2]]
+  t0 = time.time()
+  slice_figure = assembly_xyz_to_dxf(conf, slice_xyz, "{:s}/assembly_slice_test1.dxf".format(ai_output_dir))
+  t1 = time.time()
+  # expected outlines: xy at z=sz/2: 4 walls with a hole each -> 4 rectangles per wall side: 2*2+2*2=8 rectangles
+  # xz at y=sy/2: 2 planks cut in 2 rectangles (hole) + 2 yz planks cut in 2 rectangles = 8 rectangles
+  # yz at x=sx/2: 4 planks cut in 2 rectangles = 8; yz at x=t/2: the yz plank itself (outline and hole) + 2 xy and 2 xz planks = 2+4 outlines
+  gauge_nb = 2*4
+  expected_nb = gauge_nb+8+8+8+6
+  six.print_(("assembly_slice: {:d} outlines (expected {:d}) in {:0.4f} s".format(len(slice_figure), expected_nb, t1-t0)))
+  if(len(slice_figure)!=expected_nb):
+    six.print_(("ERR683: Error, the slices contain {:d} outlines instead of {:d}".format(len(slice_figure), expected_nb)))
+    r_test = 0
+  return(r_test)
+
+################################################################
+# assembly_slice command line interface
+################################################################
+
+def assembly_slice_cli(ai_args=""):
+  """ command line interface of assembly_slice.py when it is used in standalone
+  """
+  as_parser = argparse.ArgumentParser(description='Test the analytic slicer of assembly_slice.py.')
+  as_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It slices a box of six planks and checks the number of outlines.')
+  as_parser.add_argument('--output_dir','--od', action='store', default='test_output', dest='sw_output_dir',
+    help='Directory of the generated DXF file. Default: test_output')
+  effective_args = design_help.get_effective_args(ai_args)
+  as_args = as_parser.parse_args(effective_args)
+  r_as = 1
+  if(as_args.sw_test1):
+    r_as = assembly_slice_test1(as_args.sw_output_dir)
+  return(r_as)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  assembly_slice_cli("--test1")
+
@@ -31,7 +31,6 @@ The main function displays in a Tk-interface the bagel parts, or generates the d
 
 from . import cnc25d_api
 import six
-cnc25d_api.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -47,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from .lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -37,6 +37,8 @@ import os
 from . import outline_backends
 from . import design_help
 from . import design_output
+from . import figure_pool
+from . import brep_cache
 import six
 
 ################################################################
@@ -348,7 +350,7 @@ class bare_design:
       d_info = "display_{:s}".format(f)
       #print("dbg218: fig:", fig)
       six.print_(("{:s}".format(d_info)))
-      outline_backends.figure_simple_display(design_output.cnc_cut_figure(fig, d_info), design_output.ideal_figure(fig, d_info), d_info)
+      outline_backends.figure_simple_display(design_output.cnc_cut_figure(fig, d_info, True), design_output.ideal_figure(fig, d_info), d_info)
 
   def apply_3d_constructor(self):
     """ internal method that execute the f_3d_constructor function
@@ -378,19 +380,22 @@ class bare_design:
     self.apply_2d_constructor()
     #print("dbg243: partial_conf:", partial_conf)
     r_assembly_conf = []
+    fig_B_dict = {} # a figure used by several parts of the assembly is computed once
     for i in range(len(partial_conf)):
       one_figure_conf = list(partial_conf[i])
       fig_name = one_figure_conf[0]
       #print("dbg352: fig_name:", fig_name)
-      fig_B = design_output.cnc_cut_figure(self.A_figures[fig_name], "complete_assembly_conf_{:s}".format(fig_name))
-      one_figure_conf[0] = fig_B
+      if(not fig_name in fig_B_dict):
+        fig_B_dict[fig_name] = design_output.cnc_cut_figure(self.A_figures[fig_name], "complete_assembly_conf_{:s}".format(fig_name))
+      one_figure_conf[0] = fig_B_dict[fig_name]
       r_assembly_conf.append(one_figure_conf)
     return(r_assembly_conf)
 
-  def get_fc_obj_3dconf(self, assembly_name=""):
+  def get_fc_obj_3dconf(self, assembly_name="", ai_assembly_mode=None):
     """ generate on freecad-object according to the 3d-assembly-configuration
         assembly_name selects the 3d-assembly-configuration
         if assembly_name is empty, the first 3d-assembly-configuration is selected
+        ai_assembly_mode selects how the parts are combined: fuse, multifuse or compound (default: design_output.assembly_mode)
     """
     self.apply_3d_constructor()
     if(assembly_name==""):
@@ -400,7 +405,7 @@ class bare_design:
       sys.exit(2)
     #print("dbg245: self.assembly_configurations:", self.assembly_configurations)
     #print("dbg246: assembly_name:", assembly_name)
-    r_fc_obj = design_output.figures_to_freecad_assembly(self.complete_assembly_conf(self.assembly_configurations[assembly_name]))
+    r_fc_obj = design_output.figures_to_freecad_assembly(self.complete_assembly_conf(self.assembly_configurations[assembly_name]), ai_assembly_mode)
     return(r_fc_obj)
 
   def get_fc_obj_function(self, function_id=""):
@@ -455,7 +460,7 @@ class bare_design:
     txt_info = self.get_info()
     figs = self.get_write_2d_figure_list()
     for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_svg_{:s}".format(f)), "{:s}_{:s}.svg".format(output_file_basename, f), self.figure_heights[f], txt_info)
+      design_output.generate_output_file(figure_pool.cnc_cut_figure_pool(self.A_figures[f], "generate_svg_{:s}".format(f), True), "{:s}_{:s}.svg".format(output_file_basename, f), self.figure_heights[f], txt_info)
 
   def write_figure_dxf(self, output_file_basename):
     """ write all 2d-figures in dxf files
@@ -464,7 +469,7 @@ class bare_design:
     txt_info = self.get_info()
     figs = self.get_write_2d_figure_list()
     for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_dxf_{:s}".format(f)), "{:s}_{:s}.dxf".format(output_file_basename, f), self.figure_heights[f], txt_info)
+      design_output.generate_output_file(figure_pool.cnc_cut_figure_pool(self.A_figures[f], "generate_dxf_{:s}".format(f), True), "{:s}_{:s}.dxf".format(output_file_basename, f), self.figure_heights[f], txt_info)
 
   def get_write_3d_figure_list(self):
     """ generate the list of 2d_figures to be written according to self.write_3d_figure_list
@@ -483,14 +488,15 @@ class bare_design:
           sys.exit(2)
     return(r_list)
 
-  def write_figure_brep(self, output_file_basename, suffix='brep'):
+  def write_figure_brep(self, output_file_basename, suffix='brep', ai_stl_native=None):
     """ write all 2d-figures in brep files
         output_file_basename contains the directory path and the file-basename
+        ai_stl_native selects the STL writer if suffix is stl (default: design_output.stl_native)
     """
     txt_info = self.get_info()
     figs = self.get_write_3d_figure_list()
     for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_brep_{:s}".format(f)), "{:s}_{:s}.{:s}".format(output_file_basename, f, suffix), self.figure_heights[f], txt_info)
+      design_output.generate_output_file(figure_pool.cnc_cut_figure_pool(self.A_figures[f], "generate_brep_{:s}".format(f)), "{:s}_{:s}.{:s}".format(output_file_basename, f, suffix), self.figure_heights[f], txt_info, ai_stl_native)
 
   def get_write_3d_conf_list(self):
     """ generate the list of 3d-assembly-configurations to be written according to self.write_3d_conf_list
@@ -509,15 +515,16 @@ class bare_design:
           sys.exit(2)
     return(r_list)
 
-  def write_assembly_brep(self, output_file_basename, ai_brep=True, ai_stl=False):
+  def write_assembly_brep(self, output_file_basename, ai_brep=True, ai_stl=False, ai_assembly_mode=None):
     """ write all 3d-assembly-configurations in brep files
         output_file_basename contains the directory path and the file-basename
+        ai_assembly_mode selects how the parts are combined: fuse, multifuse or compound (default: design_output.assembly_mode)
     """
     confs = self.get_write_3d_conf_list()
     for a in confs:
       six.print_(("write_assembly_brep: {:s}".format(a)))
       # (ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[])
-      design_output.generate_3d_assembly_output_file(self.complete_assembly_conf(self.assembly_configurations[a]), "{:s}_{:s}".format(output_file_basename, a), ai_brep=ai_brep, ai_stl=ai_stl, ai_slice_xyz=self.slice3d_configurations[a]) 
+      design_output.generate_3d_assembly_output_file(self.complete_assembly_conf(self.assembly_configurations[a]), "{:s}_{:s}".format(output_file_basename, a), ai_brep=ai_brep, ai_stl=ai_stl, ai_slice_xyz=self.slice3d_configurations[a], ai_assembly_mode=ai_assembly_mode)
 
   def get_write_3d_freecad_list(self):
     """ generate the list of 3d-freecad_objects to be written according to self.write_3d_freecad_list
@@ -553,7 +560,9 @@ class bare_design:
       six.print_(("ERR268: Error, no simulation function is provided. Can't run 2d-simulate {:s}".format(sim_id)))
       sys.exit(2)
     if(sim_id==''):
-      sim_id = self.simulation_2d_pts.keys()[0]
+      sim_id = self.default_simulation
+    if(sim_id==''):
+      sim_id = list(self.simulation_2d_pts.keys())[0]
     if(not sim_id in self.simulation_2d_pts.keys()):
       six.print_(("ERR382: Error, the simulation id {:s} does not exist in the list {:s}".format(sim_id, ' '.join(self.simulation_2d_pts.keys()))))
       sys.exit(2)
@@ -642,8 +651,10 @@ class bare_design:
     """
     # default simulation ID
     default_sim_id = None
-    if(len(self.simulation_2d_pts)>0):
-      default_sim_id = self.simulation_2d_pts.keys()[0]
+    if(self.default_simulation!=''):
+      default_sim_id = self.default_simulation
+    elif(len(self.simulation_2d_pts)>0):
+      default_sim_id = list(self.simulation_2d_pts.keys())[0]
       #print("dbg438: default_sim_id:", default_sim_id)
     #
     effective_args = cli_str.split()
@@ -657,6 +668,12 @@ class bare_design:
       help="Display in Tk-window all the 2D-figures of the design")
     cwoo_parser.add_argument('--return_type', '--rt', action='store', default='', dest='sw_return_type',
       help="Select the object to be returned by the method cli. Depreciated! Use rather the appropriate methods")
+    cwoo_parser.add_argument('--assembly_mode','--am', action='store', choices=design_output.assembly_modes, default=None, dest='sw_assembly_mode',
+      help="Select how the parts of the 3D assemblies are combined: fuse (pairwise), multifuse (one n-ary fuse) or compound (no boolean operation, for visualization and STL)")
+    cwoo_parser.add_argument('--brep_cache_dir','--bcd', action='store', nargs='?', const=brep_cache.brep_cache_default_directory, default='', dest='sw_brep_cache_dir',
+      help="Reuse the extruded parts of the .brep and .stl outputs stored in this directory. Default directory: {:s}".format(brep_cache.brep_cache_default_directory))
+    cwoo_parser.add_argument('--stl_native','--sn', action='store_true', default=False, dest='sw_stl_native',
+      help="Write the STL files of the 2D-figures without FreeCAD. The 3D assemblies and the FreeCAD objects, which require FreeCAD, are not written")
     cwoo_parser.add_argument('--view_design_configuration','--vdc', action='store_true', default=False, dest='sw_view_design_configuration',
       help="View the design configuration (2D-figures, 2D-simulations, assembly_3dconfs, displayed_figures ...)")
     #print("dbg363: effective_args:", effective_args)
@@ -670,6 +687,8 @@ class bare_design:
     self.apply_cli(' '.join(remaining_args))
     self.cli_str = effective_args_in_txt # must be set after apply_constraint()
     # generate output files
+    if(oo_args.sw_brep_cache_dir!=''):
+      brep_cache.brep_cache_enable(oo_args.sw_brep_cache_dir)
     if(oo_args.sw_output_file_basename!=''):
       if(re.search('\.svg$', oo_args.sw_output_file_basename)):
         output_file_basename = re.sub('\.svg$', '', oo_args.sw_output_file_basename)
@@ -683,17 +702,23 @@ class bare_design:
         output_file_basename = re.sub('\.brep$', '', oo_args.sw_output_file_basename)
         self.write_info_txt(output_file_basename) # write info in test file
         self.write_figure_brep(output_file_basename)
-        self.write_assembly_brep(output_file_basename)
+        self.write_assembly_brep(output_file_basename, ai_assembly_mode=oo_args.sw_assembly_mode)
         self.write_freecad_brep(output_file_basename)
       elif(re.search('\.stl$', oo_args.sw_output_file_basename)):
         output_file_basename = re.sub('\.stl$', '', oo_args.sw_output_file_basename)
         self.write_info_txt(output_file_basename) # write info in test file
-        self.write_figure_brep(output_file_basename, suffix='stl')
-        self.write_assembly_brep(output_file_basename, ai_brep=False, ai_stl=True)
-        self.write_freecad_brep(output_file_basename, ai_brep=False, ai_stl=True)
+        if(oo_args.sw_stl_native):
+          self.write_figure_brep(output_file_basename, suffix='stl', ai_stl_native=True)
+        else:
+          self.write_figure_brep(output_file_basename, suffix='stl')
+          self.write_assembly_brep(output_file_basename, ai_brep=False, ai_stl=True, ai_assembly_mode=oo_args.sw_assembly_mode)
+          self.write_freecad_brep(output_file_basename, ai_brep=False, ai_stl=True)
       else:
         print("ERR698: Error, no output format extension provided! Try suffix: .dxf, .svg, .brep or .stl")
         sys.exit(2)
+    if(oo_args.sw_brep_cache_dir!=''):
+      six.print_(brep_cache.brep_cache_info_txt())
+      brep_cache.brep_cache_disable()
     # run simulation
     if(oo_args.sw_simulate_2d==None):
       print("ERR510: no simualtion has been set")
@@ -808,8 +833,6 @@ class bare_design:
 
 # import for testing bare_design
 #import cnc25d_api # cannot import cnc25d_api because cnc25d_api import bare_design
-from . import importing_freecad
-importing_freecad.importing_freecad()
 from . import cnc_outline
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -817,8 +840,8 @@ from . import cnc_outline
 import math
 import sys, argparse
 #
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 # end of import for testing bare_design
 
 def bare_design_test1():
@@ -32,7 +32,6 @@ It's a rewrite of the script box_wood_frame_ng.py using bare_design.py
 #import importing_freecad
 #importing_freecad.importing_freecad()
 from . import cnc25d_api
-cnc25d_api.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -49,7 +48,7 @@ import sys, argparse
 #
 from .box_wood_frame_outline import *
 #
-import Part
+from .lazy_import import Part
 #from FreeCAD import Base
 
 
@@ -35,7 +35,6 @@ The function return a FreeCAD Part object of the assembled object.
 #importing_freecad.importing_freecad()
 from . import cnc25d_api
 import six
-cnc25d_api.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -54,8 +53,8 @@ import os
 #import cnc_cut_outline
 #import export_2d
 #
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 
 ################################################################
 # box_wood_frame dictionary-constraint-arguments default values
@@ -31,7 +31,6 @@ sub-module of box_wood_frame.py
 #import importing_freecad
 #importing_freecad.importing_freecad()
 from . import cnc25d_api
-cnc25d_api.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -0,0 +1,338 @@
+# brep_cache.py
+# an on-disk cache of the extruded parts generated by outline_backends.figure_to_freecad_25d_part()
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+brep_cache.py stores the extruded parts of figure_to_freecad_25d_part() as BRep files in a directory.
+The file name is a hash of the format-B figure, of the extrusion height and of the Cnc25D version
+(or of the Python files of the package when Cnc25D is used from the source tree),
+so a part is rebuilt only if its figure, its height or Cnc25D have changed.
+The least recently used files are removed when the directory exceeds its maximal size.
+The cache is disabled by default.
+"""
+
+################################################################
+# header for Python / FreeCAD compatibility
+################################################################
+
+import six
+
+################################################################
+# import
+################################################################
+
+from .lazy_import import Part
+import os
+import sys, argparse
+import hashlib
+#
+from . import design_help # just for get_effective_args() and mkdir_p()
+from . import outline_array
+from . import outline_backends
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+brep_cache_default_directory = os.path.join(os.path.expanduser('~'), '.cache', 'cnc25d', 'brep')
+brep_cache_default_max_size = 512*1024*1024 # bytes
+
+################################################################
+# cache key
+################################################################
+
+cnc25d_version_txt = None # set by the first call of cnc25d_version()
+
+def source_hash():
+  """ return the hash of the content of all the Python files of the package
+      figure_to_freecad_25d_part() depends on several modules (outline_backends, cnc_outline, small_geometry, ...)
+  """
+  h = hashlib.sha1()
+  source_dir = os.path.dirname(os.path.abspath(__file__))
+  for f in sorted(os.listdir(source_dir)):
+    if(not f.endswith('.py')):
+      continue
+    h.update(f.encode('utf-8'))
+    with open(os.path.join(source_dir, f), 'rb') as fh:
+      h.update(fh.read())
+  r_hash = h.hexdigest()[:12]
+  return(r_hash)
+
+def cnc25d_version():
+  """ return the version of the installed Cnc25D package
+      or 'dev-' followed by the hash of the source files if Cnc25D is used from the source tree
+  """
+  global cnc25d_version_txt
+  if(cnc25d_version_txt is None):
+    cnc25d_version_txt = ''
+    try:
+      try:
+        from importlib import metadata # python 3.8 and later
+        cnc25d_version_txt = metadata.version('Cnc25D')
+      except ImportError:
+        import pkg_resources
+        cnc25d_version_txt = pkg_resources.get_distribution('Cnc25D').version
+    except Exception: # Cnc25D is not installed
+      pass
+    # a source tree (not installed or installed in develop mode) changes without a new version number
+    package_dir = os.path.abspath(__file__)
+    if((cnc25d_version_txt=='')or(('site-packages' not in package_dir)and('dist-packages' not in package_dir))):
+      cnc25d_version_txt = "dev-{:s}".format(source_hash())
+  return(cnc25d_version_txt)
+
+def figure_key(ai_figure, ai_height):
+  """ return the hash of a format-B figure, its extrusion height and the Cnc25D version
+      The floats are hashed with repr(), so the key changes with any modification of the figure
+  """
+  h = hashlib.sha1()
+  h.update("cnc25d {:s} height {!r}\n".format(cnc25d_version(), float(ai_height)).encode('ascii'))
+  for ol in ai_figure:
+    ol = outline_array.outline_to_list(ol)
+    if(isinstance(ol[0], (list, tuple))): # general outline
+      txt = repr(tuple(tuple(float(v) for v in segment) for segment in ol))
+    else: # circle
+      txt = repr(tuple(float(v) for v in ol))
+    h.update(txt.encode('ascii'))
+    h.update(b'\n')
+  r_key = h.hexdigest()
+  return(r_key)
+
+################################################################
+# Brep_Cache
+################################################################
+
+class Brep_Cache(object):
+  """ directory of BRep files with a least recently used size limit and hit and miss counters
+  """
+  def __init__(self, ai_directory=None, ai_max_size=None):
+    """ ai_directory: directory of the BRep files (default: brep_cache_default_directory)
+        ai_max_size: maximal size of the directory in bytes (default: brep_cache_default_max_size)
+    """
+    self.directory = ai_directory
+    if(self.directory is None):
+      self.directory = brep_cache_default_directory
+    self.max_size = ai_max_size
+    if(self.max_size is None):
+      self.max_size = brep_cache_default_max_size
+    design_help.mkdir_p(self.directory)
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def filename(self, ai_key):
+    """ return the path of the BRep file of the key ai_key
+    """
+    r_filename = os.path.join(self.directory, "{:s}.brep".format(ai_key))
+    return(r_filename)
+
+  def entries(self):
+    """ return the list of (modification_time, size, filename) of the BRep files of the directory
+    """
+    r_entries = []
+    for f in os.listdir(self.directory):
+      if(f.endswith('.brep')):
+        filename = os.path.join(self.directory, f)
+        try:
+          st = os.stat(filename)
+        except OSError: # removed by an other process
+          continue
+        r_entries.append((st.st_mtime, st.st_size, filename))
+    return(r_entries)
+
+  def info(self):
+    """ return a dictionary with the counters of the cache
+    """
+    entries = self.entries()
+    r_info = {'hits':self.hits, 'misses':self.misses, 'evictions':self.evictions, 'files':len(entries),
+      'size':sum([e[1] for e in entries]), 'max_size':self.max_size, 'directory':self.directory}
+    return(r_info)
+
+  def clear(self):
+    """ remove all BRep files and reset the counters
+    """
+    for (mtime, size, filename) in self.entries():
+      os.remove(filename)
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def get(self, ai_key):
+    """ return the part stored with ai_key or None
+        The modification time of the file is updated to mark it as recently used
+    """
+    filename = self.filename(ai_key)
+    r_part = None
+    if(os.path.isfile(filename)):
+      r_part = Part.read(filename)
+      os.utime(filename, None)
+      self.hits += 1
+    else:
+      self.misses += 1
+    return(r_part)
+
+  def put(self, ai_key, ai_part):
+    """ store the part ai_part and remove the least recently used files if the directory is too large
+        The file is written under a temporary name and renamed, so a concurrent reader never gets a partial file
+    """
+    filename = self.filename(ai_key)
+    tmp_filename = "{:s}.{:d}.tmp".format(filename, os.getpid())
+    ai_part.exportBrep(tmp_filename)
+    os.rename(tmp_filename, filename)
+    entries = sorted(self.entries())
+    total_size = sum([e[1] for e in entries])
+    for (mtime, size, old_filename) in entries:
+      if(total_size<=self.max_size):
+        break
+      if(old_filename==filename): # keep the new part even if it is larger than max_size
+        continue
+      try:
+        os.remove(old_filename)
+      except OSError:
+        continue
+      total_size -= size
+      self.evictions += 1
+
+################################################################
+# cached computation
+################################################################
+
+brep_cache = None # the active Brep_Cache. None if the cache is disabled
+
+def brep_cache_enable(ai_directory=None, ai_max_size=None):
+  """ enable the BRep cache used by cached_figure_to_freecad_25d_part()
+  """
+  global brep_cache
+  brep_cache = Brep_Cache(ai_directory, ai_max_size)
+  return(brep_cache)
+
+def brep_cache_disable():
+  """ disable the BRep cache
+  """
+  global brep_cache
+  brep_cache = None
+
+def brep_cache_info():
+  """ return the counters of the BRep cache or None if it is disabled
+  """
+  r_info = None
+  if(brep_cache is not None):
+    r_info = brep_cache.info()
+  return(r_info)
+
+def brep_cache_info_txt():
+  """ return the counters of the BRep cache as a text line
+  """
+  info = brep_cache_info()
+  r_txt = "brep cache: disabled"
+  if(info is not None):
+    r_txt = "brep cache: hits {:d}  misses {:d}  evictions {:d}  files {:d}  size {:0.1f} MB / {:0.1f} MB  in {:s}".format(
+      info['hits'], info['misses'], info['evictions'], info['files'], info['size']/1e6, info['max_size']/1e6, info['directory'])
+  return(r_txt)
+
+def cached_figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
+  """ return outline_backends.figure_to_freecad_25d_part(ai_figure, ai_extrude_height)
+      or the part read from the BRep cache if it is enabled
+  """
+  if(brep_cache is None):
+    return(outline_backends.figure_to_freecad_25d_part(ai_figure, ai_extrude_height))
+  key = figure_key(ai_figure, ai_extrude_height)
+  r_part = brep_cache.get(key)
+  if(r_part is None):
+    r_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_extrude_height)
+    brep_cache.put(key, r_part)
+  return(r_part)
+
+################################################################
+# brep_cache testing
+################################################################
+
+def brep_cache_test1(ai_directory='test_output/brep_cache'):
+  """ extrude figures with and without the BRep cache and compare the volumes
+  """
+  r_test = 1
+  figures = []
+  for i in range(4):
+    figures.append([[[0,0], [100+10*i,0], [100+10*i,60], [0,60], [0,0]], (30, 30, 10+i), (70, 30, 10)])
+  brep_cache_enable(ai_directory)
+  brep_cache.clear()
+  for (pass_name, expected_hits) in (('first pass', 0), ('second pass', len(figures))):
+    t0 = time.time()
+    parts = [cached_figure_to_freecad_25d_part(fig, 20.0) for fig in figures]
+    t1 = time.time()
+    six.print_(("{:s}: {:d} parts in {:0.3f} s  {:s}".format(pass_name, len(parts), t1-t0, brep_cache_info_txt())))
+    if(brep_cache.hits!=expected_hits):
+      six.print_(("ERR691: Error, the {:s} gets {:d} hits instead of {:d}".format(pass_name, brep_cache.hits, expected_hits)))
+      r_test = 0
+  for (fig, part) in zip(figures, parts):
+    ref_volume = outline_backends.figure_to_freecad_25d_part(fig, 20.0).Volume
+    if(abs(part.Volume-ref_volume)>1e-6*ref_volume):
+      six.print_(("ERR692: Error, the cached part has the volume {:0.3f} instead of {:0.3f}".format(part.Volume, ref_volume)))
+      r_test = 0
+  # a tiny cache keeps only the last part
+  brep_cache_enable(ai_directory, 1)
+  cached_figure_to_freecad_25d_part(figures[0], 25.0)
+  info = brep_cache_info()
+  six.print_(brep_cache_info_txt())
+  if(info['files']!=1):
+    six.print_(("ERR693: Error, the size limited cache contains {:d} files".format(info['files'])))
+    r_test = 0
+  brep_cache.clear()
+  brep_cache_disable()
+  return(r_test)
+
+################################################################
+# brep_cache command line interface
+################################################################
+
+def brep_cache_cli(ai_args=""):
+  """ command line interface of brep_cache.py when it is used in standalone
+  """
+  bc_parser = argparse.ArgumentParser(description='Test and manage the BRep cache of figure_to_freecad_25d_part().')
+  bc_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It extrudes figures with and without the BRep cache.')
+  bc_parser.add_argument('--info','--i', action='store_true', default=False, dest='sw_info',
+    help='It prints the statistics of the cache directory.')
+  bc_parser.add_argument('--clear','--c', action='store_true', default=False, dest='sw_clear',
+    help='It removes the files of the cache directory.')
+  bc_parser.add_argument('--directory','--d', action='store', default=None, dest='sw_directory',
+    help='The cache directory. Default: {:s}'.format(brep_cache_default_directory))
+  effective_args = design_help.get_effective_args(ai_args)
+  bc_args = bc_parser.parse_args(effective_args)
+  r_bc = 1
+  if(bc_args.sw_test1):
+    r_bc = brep_cache_test1()
+  if(bc_args.sw_info or bc_args.sw_clear):
+    brep_cache_enable(bc_args.sw_directory)
+    if(bc_args.sw_clear):
+      brep_cache.clear()
+    six.print_(brep_cache_info_txt())
+    brep_cache_disable()
+  return(r_bc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  brep_cache_cli("--test1")
+
@@ -31,8 +31,16 @@ to be used by the design examples or external scripts
 
 from . import importing_freecad
 from . import cnc_outline
+from . import cnc_outline_batch
+from . import outline_array
+from . import corner_cache
+from . import figure_pool
+from . import brep_cache
 from . import outline_backends
+from . import offscreen_backend
+from . import stl_backend
 from . import positioning
+from . import assembly_slice
 from . import export_2d
 from . import design_output
 from . import design_help
@@ -59,17 +67,56 @@ smooth_outline_c_curve = cnc_outline.smooth_outline_c_curve
 smooth_outline_b_curve = cnc_outline.smooth_outline_b_curve
 ideal_outline = cnc_outline.ideal_outline
 
+# from cnc_outline_batch
+cnc_cut_figure_batch = cnc_outline_batch.cnc_cut_figure_batch
+
+# from outline_array
+OutlineArray = outline_array.OutlineArray
+outline_to_array = outline_array.outline_to_array
+outline_to_list = outline_array.outline_to_list
+figure_to_array = outline_array.figure_to_array
+TransformedOutline = outline_array.TransformedOutline
+
+# from corner_cache
+corner_cache_enable = corner_cache.corner_cache_enable
+corner_cache_disable = corner_cache.corner_cache_disable
+corner_cache_info = corner_cache.corner_cache_info
+
+# from figure_pool
+cnc_cut_figure_pool = figure_pool.cnc_cut_figure_pool
+ideal_figure_pool = figure_pool.ideal_figure_pool
+
+# from brep_cache
+brep_cache_enable = brep_cache.brep_cache_enable
+brep_cache_disable = brep_cache.brep_cache_disable
+brep_cache_info = brep_cache.brep_cache_info
+
 # from outline_backends
 outline_arc_line = outline_backends.outline_arc_line
 #outline_circle = outline_backends.outline_circle # included now in outline_arc_line()
 Two_Canvas =  outline_backends.Two_Canvas
+Frame_Cache = outline_backends.Frame_Cache
+Curve_Table = outline_backends.Curve_Table
 figure_simple_display = outline_backends.figure_simple_display
 write_figure_in_svg = outline_backends.write_figure_in_svg
+write_figure_in_svg_stream = outline_backends.write_figure_in_svg_stream
 write_figure_in_dxf = outline_backends.write_figure_in_dxf
+write_figure_in_dxf_stream = outline_backends.write_figure_in_dxf_stream
 figure_to_freecad_25d_part =  outline_backends.figure_to_freecad_25d_part
 
+# from offscreen_backend
+offscreen_render = offscreen_backend.offscreen_render
+
+# from stl_backend
+figure_to_stl_triangles = stl_backend.figure_to_stl_triangles
+write_figure_in_stl = stl_backend.write_figure_in_stl
+
 # from positioning
 place_plank = positioning.place_plank
+place_plank_matrix = positioning.place_plank_matrix
+
+# from assembly_slice
+assembly_xyz_to_dxf = assembly_slice.assembly_xyz_to_dxf
 
 # from export_2d
 export_to_dxf = export_2d.export_to_dxf
@@ -56,8 +56,22 @@ import sys, argparse
 #
 from . import design_help # just for get_effective_args()
 from .small_geometry import *
+from .outline_array import OutlineArray, TransformedOutline
+from . import vector_geometry
+from . import corner_cache
+import numpy
 import six
 
+################################################################
+# global variable
+################################################################
+
+# below this number of points, smooth_outline_c_curve() uses the scalar loop because the numpy overhead is bigger than the gain
+smooth_curve_array_threshold = 24
+# epsilons of arc_3_points_to_radius_center_angles()
+arc_epsilon_length = math.pi/1000
+arc_epsilon_angle = math.pi/10000
+
 ################################################################
 # ******** Sub-functions for the API ***********
 ################################################################
@@ -67,6 +81,9 @@ def check_outline_format(ai_outline):
       0: format-B circle,  1: format-B general outline (all outline except circle), 2: format-A
   """
   r_outline_type = -1
+  # an OutlineArray or a TransformedOutline knows its format
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.outline_format)
   # check if it is a format-B circle
   if(not isinstance(ai_outline, (tuple, list))):
     print("ERR937: Error, ai_outline must be a list or a tuple")
@@ -105,6 +122,8 @@ def reverse_outline(ai_outline):
       ai_outline can be list of segments with the input format of cnc_cut_outline.cnc_cut_outline() or with the input format of outline_backends.outline_arc_line()
       the output format is the input format
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.reverse())
   # check the ai_outline format
   outline_type = check_outline_format(ai_outline)
   #print("dbg553: outline_type:", outline_type)
@@ -452,6 +471,19 @@ def enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai_pos
 def cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx):
   """ Compute the open outline of a corner defined by two segemts (lines or arcs)
       The output outline has the same format as the input format of outline_backends.outline_arc_line()
+      If the corner cache is enabled (corner_cache.corner_cache_enable()), the congruent corners are computed only once
+  """
+  if((corner_cache.corner_cache is None)or(ai_router_bit_request==0)):
+    (r_outline, corner_status) = sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx)
+  else:
+    r_outline = corner_cache.cached_corner(lambda: sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx),
+      ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request)
+  return(r_outline)
+
+def sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx):
+  """ computation of cnc_cut_corner() without cache
+      It returns the tuple (corner outline, status). The status is 1 if the router_bit request has been applied,
+      0 if the corner is left unchanged (angular corner or warning printed)
   """
   #print("dbg107: ai_error_msg_id: {:s}  ai_error_msg_idx: {:d}".format(ai_error_msg_id, ai_error_msg_idx))
   #error_msg_id = "error_msg_id: {:s}.{:d}".format(ai_error_msg_id, ai_error_msg_idx)
@@ -489,7 +521,12 @@ def cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle
     elif((ai_pre_middle!=None)and(ai_post_middle!=None)):
       r_outline = enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, abs(ai_router_bit_request), error_msg_id)
   #print("dbg578: r_outline:", r_outline)
-  return(r_outline)
+  # the smooth and enlarge functions return the corner point alone when they print a warning
+  corner_status = 0
+  if(len(r_outline)>1):
+    corner_status = 1
+  r_sub_cnc_cut_corner = (r_outline, corner_status)
+  return(r_sub_cnc_cut_corner)
 
 def arc_middle(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_new_end1, ai_new_end2, ai_error_msg_id, ai_error_msg_idx):
   """ Compute the middle point of an arc with new end points
@@ -591,6 +628,8 @@ def general_outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_off
   """ For each point of the list, add the offset and multiply by coefficient the coordinates
       ai_outline can be list of segments with the format-A or format-B except circle
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.shift_xy(ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient))
   # check the parameters
   if((ai_x_coefficient==0)or(ai_y_coefficient==0)):
     six.print_(("ERR439: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient)))
@@ -658,6 +697,8 @@ def general_outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
   """ For each point of the list, apply a rotation of angle ai_rotation_angle and rotation center (ai_ox, ai_oy)
       ai_outline can be list of segments with the format-A or with the format-B except circle
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.rotate(ai_ox, ai_oy, ai_rotation_angle))
   # check the ai_outline format
   outline_type = check_outline_format(ai_outline)
   #print("dbg453: outline_type:", outline_type)
@@ -712,6 +753,243 @@ def general_outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
     r_outline.append(tuple(new_segment))
   return(r_outline)
 
+def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
+  """ From three points (A,B,C: equivalent to 6 floats) computes the radius, the center (I) and the angles ((Ix,IA), (Ix,IB), (Ix,IC)) of the arc passing through A, B and C
+  """
+  # interpretation of the three points
+  ptax = ai_start[0]
+  ptay = ai_start[1]
+  ptbx = ai_middle[0]
+  ptby = ai_middle[1]
+  ptcx = ai_end[0]
+  ptcy = ai_end[1]
+  #print("dbg501: pta: {:6.01f}  {:6.01f}".format(ptax, ptay))
+  #print("dbg502: ptb: {:6.01f}  {:6.01f}".format(ptbx, ptby))
+  #print("dbg503: ptc: {:6.01f}  {:6.01f}".format(ptcx, ptcy))
+  # epsilon definiton to be tolerant to calculation imprecision
+  #epsilon = math.pi/1000 # can be used to compare radian and sine
+  length_epsilon = arc_epsilon_length # to speed up run time
+  angle_epsilon = arc_epsilon_angle # to speed up run time
+  #print("dbg747: length_epsilon:", length_epsilon)
+  # check
+  if((ptax==ptbx)and(ptay==ptby)):
+    print("ERR807: Error, point_A and point_B are identical!")
+    sys.exit(2)
+  if((ptbx==ptcx)and(ptby==ptcy)):
+    print("ERR808: Error, point_B and point_C are identical!")
+    sys.exit(2)
+  if((ptax==ptcx)and(ptay==ptcy)):
+    print("ERR809: Error, point_A and point_C are identical!")
+    sys.exit(2)
+  ## check the documentation for the explanation of the following calculation
+  # length of [AB] and [BC]
+  lab = math.sqrt((ptbx-ptax)**2+(ptby-ptay)**2)
+  lbc = math.sqrt((ptcx-ptbx)**2+(ptcy-ptby)**2)
+  if(lab<length_epsilon):
+    print("ERR811: Error, A and B are almost identical")
+    six.print_(("dbg559: pta={:0.2f} {:0.2f}  ptb={:0.2f} {:0.2f}  ptc={:0.2f} {:0.2f}".format(ptax, ptay, ptbx, ptby, ptcx, ptcy)))
+    sys.exit(2)
+  if(lbc<length_epsilon):
+    print("ERR812: Error, B and C are almost identical")
+    sys.exit(2)
+  # calculation of cos(e), cos(f), sin(e) and sin(f)
+  cos_e = (ptbx-ptax)/lab
+  cos_f = (ptcx-ptbx)/lbc
+  sin_e = (ptby-ptay)/lab
+  sin_f = (ptcy-ptby)/lbc
+  #print("dbg304: cos_e: ", cos_e)
+  #print("dbg305: sin_e: ", sin_e)
+  #print("dbg306: cos_f: ", cos_f)
+  #print("dbg307: sin_f: ", sin_f)
+  is_colinear = (math.copysign(1, sin_e)*cos_e)-(math.copysign(1,sin_f)*cos_f)
+  #print("dbg556: is_colinear:", is_colinear)
+  if(abs(is_colinear)<angle_epsilon):
+    #print("ERR810: Error, A, B, C are colinear. Arc can not be created!")
+    #sys.exit(2)
+    if(lab>100*length_epsilon):
+      pass # to let comment the following warning
+      #print("WARN810: Arc ABC is replaced by the line AC, because A,B,C are colinear!")
+      #print("dbg559: A= {:0.2f} {:0.2f}  B= {:0.2f} {:0.2f}  C= {:0.2f} {:0.2f}".format(ptax, ptay, ptbx, ptby, ptcx, ptcy))
+      #print("dbg558: is_colinear:", is_colinear)
+      #print("dbg557: lab:", lab)
+    r_a3ptrca = (0, 0, 0, 0, 0, 0, 0, 0, 0)
+    return(r_a3ptrca)
+  # Calculation of M and N
+  ptmx = (ptax+ptbx)/2
+  ptmy = (ptay+ptby)/2
+  ptnx = (ptbx+ptcx)/2
+  ptny = (ptby+ptcy)/2
+  #print("dbg134: ptmx:", ptmx)
+  #print("dbg135: ptmy:", ptmy)
+  #print("dbg136: ptnx:", ptnx)
+  #print("dbg137: ptny:", ptny)
+  # calculation of I
+  lix = cos_e*sin_f-cos_f*sin_e
+  kix = sin_f*(cos_e*ptmx+sin_e*ptmy)-sin_e*(cos_f*ptnx+sin_f*ptny)
+  liy = sin_e*cos_f-sin_f*cos_e
+  kiy = cos_f*(cos_e*ptmx+sin_e*ptmy)-cos_e*(cos_f*ptnx+sin_f*ptny)
+  if(abs(lix)<angle_epsilon):
+    print("ERR813: Error, A, B and C are almost colinear. Arc can not be created!")
+    sys.exit(2)
+  if(abs(liy)<angle_epsilon):
+    print("ERR814: Error, A, B and C are almost colinear. Arc can not be created!")
+    sys.exit(2)
+  #print("dbg124: lix:", lix)
+  #print("dbg125: kix:", kix)
+  #print("dbg126: liy:", liy)
+  #print("dbg127: kiy:", kiy)
+  ptix = kix / lix
+  ptiy = kiy / liy
+  #print("dbg505: pti: {:6.02f}  {:6.02f}".format(ptix, ptiy))
+  # length of [IA], [IB] and [IC]
+  lia = math.sqrt((ptax-ptix)**2+(ptay-ptiy)**2)
+  lib = math.sqrt((ptbx-ptix)**2+(ptby-ptiy)**2)
+  lic = math.sqrt((ptcx-ptix)**2+(ptcy-ptiy)**2)
+  if(abs(lib-lia)>length_epsilon):
+    #print("dbg404: lia:", lia)
+    #print("dbg405: lib:", lib)
+    print("ERR815: I is not equidistant from A and B!")
+    sys.exit(2)
+  if(abs(lic-lib)>length_epsilon):
+    #print("dbg402: lib:", lib)
+    #print("dbg403: lic:", lic)
+    print("ERR816: I is not equidistant from B and C!")
+    sys.exit(2)
+  # calculation of the angle u=(Ix, IA) , v=(Ix, IB) and w=(Ix, IC)
+  u = math.atan2(ptay-ptiy, ptax-ptix)
+  v = math.atan2(ptby-ptiy, ptbx-ptix)
+  w = math.atan2(ptcy-ptiy, ptcx-ptix)
+  # calculation of the angle uv=(IA, IB), uw=(IA, IC) vw=(IB, IC)
+  uv = math.fmod(v-u+4*math.pi, 2*math.pi)
+  uw = math.fmod(w-u+4*math.pi, 2*math.pi)
+  vw = math.fmod(w-v+4*math.pi, 2*math.pi)
+  # check arc direction
+  ccw_ncw = 1
+  if(uw>uv):
+    #print("dbg874: arc of circle direction: counter clock wise (CCW)")
+    ccw_ncw = 1
+  else:
+    #print("dbg875: arc of circle direction: clock wise (CW)")
+    ccw_ncw = 0
+    uv = uv - 2*math.pi
+    vw = vw - 2*math.pi
+    uw = uw - 2*math.pi
+  r_a3ptrca = (lia, ptix, ptiy, u, v, w, uv, vw, uw)
+  return(r_a3ptrca)
+
+class Arc_Geometry_Outline(list):
+  """ format-B outline (list of segments) carrying the geometry of its arcs
+      arc_geometry[i] is the tuple (lia, ptix, ptiy, u, v, w, uv, vw, uw) of arc_3_points_to_radius_center_angles() for the arc segment i
+      It is a list, so it can be used by all the functions expecting a format-B outline.
+      The backends read the arc geometry instead of solving again the circle passing through the three points of each arc.
+      Any modification of the list drops the arc geometry, so the backends solve again the arcs of a modified outline.
+  """
+  def __init__(self, ai_outline, ai_arc_geometry):
+    list.__init__(self, ai_outline)
+    self.arc_geometry = ai_arc_geometry
+
+  def __reduce__(self):
+    # pickle the arc geometry with the segments (for example for figure_pool)
+    return((Arc_Geometry_Outline, (list(self), self.arc_geometry)))
+
+  def drop_arc_geometry(self):
+    """ forget the arc geometry after a modification of the segments
+    """
+    self.arc_geometry = {}
+
+  def __setitem__(self, ai_idx, ai_value):
+    self.drop_arc_geometry()
+    list.__setitem__(self, ai_idx, ai_value)
+
+  def __delitem__(self, ai_idx):
+    self.drop_arc_geometry()
+    list.__delitem__(self, ai_idx)
+
+  def __iadd__(self, ai_other):
+    self.drop_arc_geometry()
+    return(list.__iadd__(self, ai_other))
+
+  def __imul__(self, ai_nb):
+    self.drop_arc_geometry()
+    return(list.__imul__(self, ai_nb))
+
+  def append(self, ai_segment):
+    self.drop_arc_geometry()
+    list.append(self, ai_segment)
+
+  def extend(self, ai_segments):
+    self.drop_arc_geometry()
+    list.extend(self, ai_segments)
+
+  def insert(self, ai_idx, ai_segment):
+    self.drop_arc_geometry()
+    list.insert(self, ai_idx, ai_segment)
+
+  def pop(self, *ai_idx):
+    self.drop_arc_geometry()
+    return(list.pop(self, *ai_idx))
+
+  def remove(self, ai_segment):
+    self.drop_arc_geometry()
+    list.remove(self, ai_segment)
+
+  def reverse(self):
+    self.drop_arc_geometry()
+    list.reverse(self)
+
+  def sort(self, *ai_args, **ai_kwargs):
+    self.drop_arc_geometry()
+    list.sort(self, *ai_args, **ai_kwargs)
+
+  def clear(self):
+    self.drop_arc_geometry()
+    del self[:]
+
+def outline_arc_geometry(ai_outline):
+  """ Return the Arc_Geometry_Outline of the format-B outline ai_outline
+  """
+  arc_geometry = {}
+  for i in range(1, len(ai_outline)):
+    if(len(ai_outline[i])==4):
+      arc_geometry[i] = arc_3_points_to_radius_center_angles(ai_outline[i-1][-2:], ai_outline[i][0:2], ai_outline[i][2:4])
+  r_outline = Arc_Geometry_Outline(ai_outline, arc_geometry)
+  return(r_outline)
+
+def segment_arc_geometry(ai_outline, ai_idx, ai_start, ai_middle, ai_end):
+  """ Return the arc geometry of the segment ai_idx of ai_outline. It is solved only if ai_outline doesn't carry it
+  """
+  r_geometry = None
+  if(isinstance(ai_outline, Arc_Geometry_Outline)):
+    r_geometry = ai_outline.arc_geometry.get(ai_idx)
+  if(r_geometry is None):
+    r_geometry = arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end)
+  return(r_geometry)
+
+def normalize_angle(ai_angle):
+  """ Return the angle in the range ]-pi, pi] like math.atan2()
+  """
+  r_angle = math.atan2(math.sin(ai_angle), math.cos(ai_angle))
+  return(r_angle)
+
+def arc_geometry_transform(ai_outline, ai_new_outline, ai_ox, ai_oy, ai_rotation_angle, ai_x_offset, ai_y_offset):
+  """ Return ai_new_outline (ai_outline rotated around (ai_ox, ai_oy) and then shifted) with the transformed arc geometry of ai_outline
+      If ai_outline doesn't carry the arc geometry, ai_new_outline is returned unchanged
+  """
+  r_outline = ai_new_outline
+  if(isinstance(ai_outline, Arc_Geometry_Outline)):
+    cos_a = math.cos(ai_rotation_angle)
+    sin_a = math.sin(ai_rotation_angle)
+    arc_geometry = {}
+    for (idx, (lia, ptix, ptiy, u, v, w, uv, vw, uw)) in ai_outline.arc_geometry.items():
+      if(lia==0): # colinear points
+        arc_geometry[idx] = (lia, ptix, ptiy, u, v, w, uv, vw, uw)
+      else:
+        new_ix = ai_ox+(ptix-ai_ox)*cos_a-(ptiy-ai_oy)*sin_a+ai_x_offset
+        new_iy = ai_oy+(ptix-ai_ox)*sin_a+(ptiy-ai_oy)*cos_a+ai_y_offset
+        arc_geometry[idx] = (lia, new_ix, new_iy, normalize_angle(u+ai_rotation_angle), normalize_angle(v+ai_rotation_angle), normalize_angle(w+ai_rotation_angle), uv, vw, uw)
+    r_outline = Arc_Geometry_Outline(ai_new_outline, arc_geometry)
+  return(r_outline)
+
 ################################################################
 # ******** API function for outline creation ***********
 ################################################################
@@ -720,6 +998,8 @@ def outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_
   """ For each point of the list, add the offset and multiply by coefficient the coordinates
       ai_outline can be list of segments with the format-A (input of cnc_cut_outline.cnc_cut_outline()) or format-B (input of outline_backends.outline_arc_line())
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.shift_xy(ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient))
   outline_type = check_outline_format(ai_outline)
   if(outline_type==0): # it's a format-B circle
     if(abs(ai_x_coefficient)!=abs(ai_y_coefficient)):
@@ -730,6 +1010,8 @@ def outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_
     r_outline = (ai_x_offset+ai_x_coefficient*circle_center_x, ai_y_offset+ai_y_coefficient*circle_center_y, circle_radius)
   else: # format-A or format-A general outline
     r_outline = general_outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient)
+    if((ai_x_coefficient==1)and(ai_y_coefficient==1)): # a translation keeps the arc geometry
+      r_outline = arc_geometry_transform(ai_outline, r_outline, 0, 0, 0, ai_x_offset, ai_y_offset)
   return(r_outline)
 
 def outline_shift_x(ai_outline, ai_x_offset, ai_x_coefficient):
@@ -751,6 +1033,8 @@ def outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
   """ For each point of the list, apply a rotation of angle ai_rotation_angle and rotation center (ai_ox, ai_oy)
       ai_outline can be list of segments with the format-A or with the format-B
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.rotate(ai_ox, ai_oy, ai_rotation_angle))
   outline_type = check_outline_format(ai_outline)
   if(outline_type==0): # it's a format-B circle
     circle_center_x = ai_outline[0]
@@ -760,13 +1044,17 @@ def outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
     r_outline = (rotated_circle_center[0], rotated_circle_center[1], circle_radius)
   else: # format-A or format-A general outline
     r_outline = general_outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle)
+    r_outline = arc_geometry_transform(ai_outline, r_outline, ai_ox, ai_oy, ai_rotation_angle, 0, 0)
   return(r_outline)
 
 def outline_close(ai_outline):
   """ close the input outline and return it
       The output outline format is the input outline format.
       It works with the format-A or the format-B
+      An OutlineArray can not be extended, so a new OutlineArray is returned
   """
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    return(ai_outline.close())
   # check the ai_outline format
   outline_type = check_outline_format(ai_outline)
   r_outline = ai_outline
@@ -800,25 +1088,12 @@ def outline_reverse(ai_outline):
     r_outline = reverse_outline(ai_outline)
   return(r_outline)
 
-def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
-  """
-  This function converts a list of segments (lines and arcs) into a list of segments (lines and arcs) compatible with a CNC cut.
-  For each input segment, you must provide:
-  - the end point (X,Y) for a line 
-      or a middle point (X,Y) and the end point (X,Y) for an arc 
-  - and the router_bit radius R.
-  The start point of a line or an arc is the last point of the previous segment
-  If R=0, the point is an angular corner.
-  If R>0, the point is smoothed to fit the constraints of a router_bit radius R.
-  If R<0, the point is enlarged to fit the constraints of a router_bit radius R.
-  eg: ai_segment_list = [ [x1,y1,r1], .. [x2,y2,r2], .. [x3,y3,x4,y4,r4], .. ]
-  You can use equally lists or tuples for segment description or segment_list description.
-  The first element is the start point of the outline. It must be a tuple of three floats.
-  If the last point of the last segment is equal to the start point, the outline is closed. Otherwise the outline is open.
-  If the outline is closed, the router_bit request of the start point is used and the router_bit request of the end point of the last segment is ignore.
-  From a programming point of view, ai_segment_list is a tuple of 3-tulpes and/or 5-tuples.
-  The returned list of segments has the same format as the input list of segment of outline_backends.outline_arc_line()
+def cnc_cut_outline_data(ai_segment_list, ai_error_msg_id):
+  """ check a format-A outline and extract its data for cnc_cut_outline()
+      It returns the tuple (outline_closed, pt_end, pt_mid, pt_request)
   """
+  if(isinstance(ai_segment_list, (OutlineArray, TransformedOutline))):
+    ai_segment_list = ai_segment_list.to_list()
   # is the outline closed or open?
   #precision_epsilon = 1/1000.0
   outline_closed = False
@@ -872,6 +1147,33 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   if(pt_request[-1]!=0):
     six.print_(("WARN947: Warning, in {:s}, the router_bit request of the last point of the outline is not zero: {:0.2f}".format(ai_error_msg_id, pt_request[-1])))
     pt_request[-1]=0
+  # return
+  r_data = (outline_closed, pt_end, pt_mid, pt_request)
+  return(r_data)
+
+def cnc_cut_outline(ai_segment_list, ai_error_msg_id, ai_arc_geometry=False):
+  """
+  This function converts a list of segments (lines and arcs) into a list of segments (lines and arcs) compatible with a CNC cut.
+  For each input segment, you must provide:
+  - the end point (X,Y) for a line 
+      or a middle point (X,Y) and the end point (X,Y) for an arc 
+  - and the router_bit radius R.
+  The start point of a line or an arc is the last point of the previous segment
+  If R=0, the point is an angular corner.
+  If R>0, the point is smoothed to fit the constraints of a router_bit radius R.
+  If R<0, the point is enlarged to fit the constraints of a router_bit radius R.
+  eg: ai_segment_list = [ [x1,y1,r1], .. [x2,y2,r2], .. [x3,y3,x4,y4,r4], .. ]
+  You can use equally lists or tuples for segment description or segment_list description.
+  The first element is the start point of the outline. It must be a tuple of three floats.
+  If the last point of the last segment is equal to the start point, the outline is closed. Otherwise the outline is open.
+  If the outline is closed, the router_bit request of the start point is used and the router_bit request of the end point of the last segment is ignore.
+  From a programming point of view, ai_segment_list is a tuple of 3-tulpes and/or 5-tuples.
+  The returned list of segments has the same format as the input list of segment of outline_backends.outline_arc_line()
+  If ai_arc_geometry is True, the returned outline is an Arc_Geometry_Outline carrying the center, radius and angles of its arcs.
+  """
+  (outline_closed, pt_end, pt_mid, pt_request) = cnc_cut_outline_data(ai_segment_list, ai_error_msg_id)
+  # number of corners
+  point_nb = len(pt_end)
   # build outline
   r_outline = []
   # start point
@@ -927,6 +1229,9 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   else:
     last_segment = (next_point[0], next_point[1])
   r_outline.append(last_segment)
+  # arc geometry for the backends
+  if(ai_arc_geometry):
+    r_outline = outline_arc_geometry(r_outline)
   # function return
   return(r_outline)
 
@@ -972,15 +1277,14 @@ def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
       sys.exit(2)
     tangent_inclination = math.fmod(tangent_inclination-1*tangent_inclination2_diff/2 + 5*math.pi, 2*math.pi) - math.pi
   r_outline.append((ai_polyline[0][0], ai_polyline[0][1], tangent_inclination)) # first-point
-  # processing incrementation
-  for i in range(point_nb-2):
-    # error message
-    i_error_msg_id = "{:s}.{:d}".format(ai_error_msg_id, i)
-    pre_point = ai_polyline[i]
-    post_point = ai_polyline[i+2]
-    segment_length = math.sqrt((post_point[0]-pre_point[0])**2+(post_point[1]-pre_point[1])**2)
-    tangent_inclination = math.atan2((post_point[1]-pre_point[1])/segment_length, (post_point[0]-pre_point[0])/segment_length)
-    r_outline.append((ai_polyline[i+1][0], ai_polyline[i+1][1], tangent_inclination)) # point
+  # processing incrementation: the tangent of the middle points are computed all together
+  if(point_nb>2):
+    polyline = numpy.array(ai_polyline, dtype=float)
+    pre_post_x = polyline[2:,0]-polyline[:-2,0]
+    pre_post_y = polyline[2:,1]-polyline[:-2,1]
+    segment_length = numpy.sqrt(pre_post_x**2+pre_post_y**2)
+    tangent_inclination = numpy.arctan2(pre_post_y/segment_length, pre_post_x/segment_length)
+    r_outline.extend([(p[0], p[1], t) for (p, t) in zip(ai_polyline[1:-1], tangent_inclination.tolist())]) # points
   # processing ending
   pre_point = ai_polyline[-2]
   post_point = ai_polyline[-1]
@@ -1001,6 +1305,39 @@ def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
   # return
   return(r_outline)
 
+def sub_smooth_outline_c_curve_array(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id):
+  """ numpy version of small_geometry.sub_smooth_outline_c_curve()
+      The tangents, the junction points and the arc middles of all segments are computed together.
+      The segments that raise an other warning than the line generation or an error are recomputed with small_geometry.smooth_segment_c_curve()
+  """
+  point_nb = len(ai_polyline)
+  if((point_nb<2)or(len(ai_polyline[0])!=3)):
+    return(sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id)) # to get the error message
+  polyline = numpy.array([p if(len(p)==3) else (numpy.nan, numpy.nan, numpy.nan) for p in ai_polyline], dtype=float)
+  A = polyline[:-1]
+  E = polyline[1:]
+  with numpy.errstate(all='ignore'):
+    (BX, BY, CX, CY, DX, DY, xAC, xEC, line, segment_ok) = vector_geometry.smooth_c_curve(A[:,0], A[:,1], A[:,2], E[:,0], E[:,1], E[:,2], ai_precision, ai_router_bit_request)
+  segment_ok &= ~numpy.isnan(E[:,0]) # invalid segment
+  r_outline = []
+  r_outline.append((ai_polyline[0][0], ai_polyline[0][1])) # first-point
+  for (i, (bx, by, cx, cy, dx, dy, seg_line, seg_ok)) in enumerate(zip(BX.tolist(), BY.tolist(), CX.tolist(), CY.tolist(), DX.tolist(), DY.tolist(), line.tolist(), segment_ok.tolist())):
+    (xAt, EX, EY, xEt) = (ai_polyline[i][2], ai_polyline[i+1][0], ai_polyline[i+1][1], ai_polyline[i+1][2])
+    if(seg_ok and (seg_line==0)):
+      r_outline.append((bx, by, cx, cy)) # create the first arc-segment
+      r_outline.append((dx, dy, EX, EY)) # create the second arc-segment
+    elif(seg_ok):
+      # same warnings as small_geometry.smooth_segment_c_curve()
+      if(seg_line==1):
+        six.print_(("WARN659: Warning in {:s}.{:d}, (xAC, xAt) or (xEC, xEt) are almost identical. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f}  xEt={:0.2f} ".format(ai_error_msg_id, i, xAC[i], xAt, xEC[i], xEt)))
+      else:
+        six.print_(("WARN669: Warning in {:s}.{:d}, xAt and xEt are not one the side of (AE). It look like an inflexion. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f} xEt={:0.2f} ".format(ai_error_msg_id, i, xAC[i], xAt, xEC[i], xEt)))
+      r_outline.append((EX, EY)) # create a line-segment
+    else:
+      r_outline.extend(smooth_segment_c_curve(ai_polyline, i, ai_precision, ai_router_bit_request, ai_error_msg_id))
+  # return
+  return(r_outline)
+
 def smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id):
   """
   This function computes a serie of 2N arcs that pass through the (N+1) points defined by the N line-segments of ai_polyline.
@@ -1010,7 +1347,10 @@ def smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_
   ai_error_msg_id is a string, that can help you to track bugs and erros.
   The function returns an outline of format B containing only arcs
   """
-  r_outline = sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id)
+  if(len(ai_polyline)<smooth_curve_array_threshold):
+    r_outline = sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id)
+  else:
+    r_outline = sub_smooth_outline_c_curve_array(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id)
   #for i in range(len(r_outline)):
   #  print("dbg339: i r_outline[i]:", i, r_outline[i])
   # return
@@ -1065,13 +1405,11 @@ def ideal_outline(ai_outline, ai_error_msg_id):
 # addition import for the tests
 ################################################################
 
-from . import importing_freecad 
-importing_freecad.importing_freecad()
 #
-import Part
-from FreeCAD import Base 
+from .lazy_import import Part
+from .lazy_import import Base 
 #
-from six.moves import tkinter
+from .lazy_import import tkinter
 from . import outline_backends
 #
 #import timeit
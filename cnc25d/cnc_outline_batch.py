@@ -0,0 +1,854 @@
+# cnc_outline_batch.py
+# numpy batch engine for cnc_cut_outline() working on complete figures
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+cnc_outline_batch.py provides cnc_cut_figure_batch(), a drop-in replacement of design_output.cnc_cut_figure().
+All the corners of all the outlines of a figure are packed into numpy arrays and computed at once.
+The chaining checks, the arc middle points and the packing of the returned segments are also computed on these arrays.
+An outline with a corner that would print a warning or an error with cnc_cut_outline() is assembled corner by corner
+and this corner is recomputed with the scalar functions of cnc_outline.py.
+So the warnings and errors are the same, only their order might differ.
+The returned figure has the same format-B as design_output.cnc_cut_figure(). The coordinates are equal within batch_tolerance.
+The packing of the arrays has a fixed cost, so the batch path only pays off on figures with thousands of corners:
+on the figures of a few hundred corners of box_wood_frame or bell, cnc_cut_outline() is about twice faster,
+and on the 20000 corners of benchmark_figure(), cnc_cut_figure_batch() is about twice faster.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+ # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import sys, argparse
+import six
+import numpy
+#
+from . import design_help # just for get_effective_args()
+from . import cnc_outline
+from . import vector_geometry
+from .vector_geometry import length, radian_epsilon
+from .outline_array import OutlineArray, TransformedOutline
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+# the numpy trigonometric functions and the scalar math functions might differ on the last bits.
+# Moreover, a corner computed with the original neighbour points instead of the previous corner output gets the same geometry with a different rounding.
+# With coordinates in mm, the difference between cnc_cut_figure_batch() and cnc_cut_figure() stays below batch_tolerance.
+batch_tolerance = 1e-9
+# margin used to check that a shortened arc is still large enough for the scalar recipe
+arc_margin = 10*radian_epsilon
+# maximal number of segments of a corner outline
+corner_segment_max = 4
+
+################################################################
+# corner functions working on arrays
+################################################################
+
+def corner_segments(ai_ok, ai_columns, ai_shape):
+  """ pack the corner outlines in an array of segments (middle x, middle y, end x, end y) built from the arrays of coordinates
+      ai_shape is a list of segment lengths (1 for a point, 2 for an arc). The middle of a point is nan.
+      It returns the segment array and the number of segments of each corner. The corners with ai_ok==False get no segment.
+  """
+  r_segment = numpy.full((len(ai_ok), corner_segment_max, 4), numpy.nan)
+  j = 0
+  for (i, s) in enumerate(ai_shape):
+    if(s==2):
+      r_segment[:,i,0] = ai_columns[j]
+      r_segment[:,i,1] = ai_columns[j+1]
+    r_segment[:,i,2] = ai_columns[j+2*s-2]
+    r_segment[:,i,3] = ai_columns[j+2*s-1]
+    j += 2*s
+  r_count = numpy.where(ai_ok, len(ai_shape), 0)
+  return(r_segment, r_count)
+
+def select_corner(ai_selection, ai_corner_1, ai_corner_2):
+  """ take the corners of ai_corner_1 where ai_selection is True and the corners of ai_corner_2 elsewhere
+  """
+  r_corner = (numpy.where(ai_selection[:,None,None], ai_corner_1[0], ai_corner_2[0]), numpy.where(ai_selection, ai_corner_1[1], ai_corner_2[1]))
+  return(r_corner)
+
+def reverse_corner(ai_corner):
+  """ array version of cnc_outline.reverse_outline() for the corner outlines of corner_segments()
+  """
+  (segment, count) = ai_corner
+  r_segment = numpy.full(segment.shape, numpy.nan)
+  for c in range(1, corner_segment_max+1):
+    sel = (count==c)
+    r_segment[sel,0,2:4] = segment[sel,c-1,2:4]
+    for t in range(1, c):
+      r_segment[sel,t,0:2] = segment[sel,c-t,0:2]
+      r_segment[sel,t,2:4] = segment[sel,c-t-1,2:4]
+  r_corner = (r_segment, count)
+  return(r_corner)
+
+def smooth_corner_line_line_batch(GX, GY, AX, AY, HX, HY, R):
+  """ array version of cnc_outline.smooth_corner_line_line()
+      It returns the ok mask, the length cut on each segment and the corner outlines
+  """
+  AG = length(GX-AX, GY-AY)
+  AH = length(HX-AX, HY-AY)
+  GH = length(HX-GX, HY-GY)
+  r_ok = (AG>=radian_epsilon)&(AH>=radian_epsilon)&(GH>=radian_epsilon)
+  corner_cos = (AG**2+AH**2-GH**2)/(2*AH*AG)
+  r_ok &= (numpy.abs(corner_cos)<=1+radian_epsilon)
+  corner_angle = numpy.arccos(numpy.clip(corner_cos, -1, 1))
+  r_ok &= (corner_angle<=math.pi-radian_epsilon)&(corner_angle>=radian_epsilon)
+  AE = R/numpy.tan(corner_angle/2)
+  r_ok &= (AG>=AE)&(AH>=AE)
+  EX = AX+(GX-AX)*AE/AG
+  EY = AY+(GY-AY)*AE/AG
+  FX = AX+(HX-AX)*AE/AH
+  FY = AY+(HY-AY)*AE/AH
+  AK = R*(1-numpy.sin(corner_angle/2))*2/numpy.sin(corner_angle)
+  KX = AX+(GX-AX)*AK/AG
+  KY = AY+(GY-AY)*AK/AG
+  LX = AX+(HX-AX)*AK/AH
+  LY = AY+(HY-AY)*AK/AH
+  IX = (KX+LX)/2
+  IY = (KY+LY)/2
+  r_corner = corner_segments(r_ok, (EX, EY, IX, IY, FX, FY), (1, 2))
+  return(r_ok, AE, r_corner)
+
+def enlarge_corner_line_line_batch(GX, GY, AX, AY, HX, HY, R):
+  """ array version of cnc_outline.enlarge_corner_line_line()
+      It returns the ok mask, the length cut on each segment and the corner outlines
+  """
+  AG = length(GX-AX, GY-AY)
+  AH = length(HX-AX, HY-AY)
+  GH = length(HX-GX, HY-GY)
+  r_ok = (AG>=radian_epsilon)&(AH>=radian_epsilon)&(GH>=radian_epsilon)
+  corner_cos = (AG**2+AH**2-GH**2)/(2*AH*AG)
+  r_ok &= (numpy.abs(corner_cos)<=1)
+  corner_angle = numpy.arccos(numpy.clip(corner_cos, -1, 1))
+  r_ok &= (corner_angle<=math.pi-radian_epsilon)&(corner_angle>=radian_epsilon)
+  obtuse = (corner_angle>math.pi/2-radian_epsilon)
+  # enlarge obtuse angle
+  AE = 2*R*numpy.cos(corner_angle/2)
+  EX = AX+(GX-AX)*AE/AG
+  EY = AY+(GY-AY)*AE/AG
+  FX = AX+(HX-AX)*AE/AH
+  FY = AY+(HY-AY)*AE/AH
+  # enlarge acute angle
+  AM = R/numpy.sin(corner_angle/2)
+  MX = AX+(GX-AX)*AM/AG
+  MY = AY+(GY-AY)*AM/AG
+  NX = AX+(HX-AX)*AM/AH
+  NY = AY+(HY-AY)*AM/AH
+  AR = AM/2
+  ARX = (GX-AX)*AR/AG
+  ARY = (GY-AY)*AR/AG
+  ASX = (HX-AX)*AR/AH
+  ASY = (HY-AY)*AR/AH
+  AV = R/numpy.cos(corner_angle/2)
+  AVX = (GX-AX)*AV/AG
+  AVY = (GY-AY)*AV/AG
+  AWX = (HX-AX)*AV/AH
+  AWY = (HY-AY)*AV/AH
+  KX = AX+ARX-ASX+(AVX+AWX)/2
+  KY = AY+ARY-ASY+(AVY+AWY)/2
+  LX = AX-ARX+ASX+(AVX+AWX)/2
+  LY = AY-ARY+ASY+(AVY+AWY)/2
+  # segment length check
+  r_cut = numpy.where(obtuse, AE, AM)
+  r_ok &= (AG>=r_cut)&(AH>=r_cut)
+  obtuse_corner = corner_segments(r_ok&obtuse, (EX, EY, AX, AY, FX, FY), (1, 2))
+  acute_corner = corner_segments(r_ok&~obtuse, (MX, MY, KX, KY, AX, AY, LX, LY, NX, NY), (1, 1, 2, 1))
+  r_corner = select_corner(obtuse, obtuse_corner, acute_corner)
+  return(r_ok, r_cut, r_corner)
+
+def smooth_corner_line_arc_batch(AX, AY, CX, CY, DX, DY, EX, EY, R):
+  """ array version of cnc_outline.smooth_corner_line_arc()
+  """
+  (SX, SY, UX, UY, xSU, xSJ, router_bit_arc_uw, r_ok) = vector_geometry.sub_smooth_corner_line_arc(AX, AY, CX, CY, DX, DY, EX, EY, R)
+  pt2x = SX + R*numpy.cos(xSU+router_bit_arc_uw/2)
+  pt2y = SY + R*numpy.sin(xSU+router_bit_arc_uw/2)
+  pt3x = SX + R*numpy.cos(xSJ)
+  pt3y = SY + R*numpy.sin(xSJ)
+  r_corner = corner_segments(r_ok, (UX, UY, pt2x, pt2y, pt3x, pt3y), (1, 2))
+  return(r_ok, r_corner)
+
+def smooth_corner_arc_arc_batch(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, R):
+  """ array version of cnc_outline.smooth_corner_arc_arc()
+  """
+  (SX, SY, xSI, xSJ, router_bit_arc_uw, r_ok) = vector_geometry.sub_smooth_corner_arc_arc(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, R)
+  pt1x = SX + R*numpy.cos(xSI)
+  pt1y = SY + R*numpy.sin(xSI)
+  pt2x = SX + R*numpy.cos(xSI+router_bit_arc_uw/2)
+  pt2y = SY + R*numpy.sin(xSI+router_bit_arc_uw/2)
+  pt3x = SX + R*numpy.cos(xSJ)
+  pt3y = SY + R*numpy.sin(xSJ)
+  r_corner = corner_segments(r_ok, (pt1x, pt1y, pt2x, pt2y, pt3x, pt3y), (1, 2))
+  return(r_ok, r_corner)
+
+def enlarge_corner_segments(ai_enlarge, CX, CY):
+  """ build the corner outlines of enlarged line-arc and arc-arc corners
+  """
+  (MKX, MKY, GX, GY, HX, HY, NLX, NLY, enlarge_type_request_1, enlarge_type_request_2, r_ok) = ai_enlarge
+  type_1 = (enlarge_type_request_1==3)
+  type_2 = (enlarge_type_request_2==3)
+  corner_33 = corner_segments(r_ok, (MKX, MKY, GX, GY, CX, CY, HX, HY, NLX, NLY), (1, 1, 2, 1))
+  corner_32 = corner_segments(r_ok, (MKX, MKY, GX, GY, CX, CY, NLX, NLY), (1, 1, 2))
+  corner_23 = corner_segments(r_ok, (MKX, MKY, CX, CY, HX, HY, NLX, NLY), (1, 2, 1))
+  corner_22 = corner_segments(r_ok, (MKX, MKY, CX, CY, NLX, NLY), (1, 2))
+  r_corner = select_corner(type_1, select_corner(type_2, corner_33, corner_32), select_corner(type_2, corner_23, corner_22))
+  return(r_ok, r_corner)
+
+def enlarge_corner_line_arc_batch(AX, AY, CX, CY, DX, DY, EX, EY, R):
+  """ array version of cnc_outline.enlarge_corner_line_arc()
+  """
+  enlarge = vector_geometry.sub_enlarge_corner_line_arc(AX, AY, CX, CY, DX, DY, EX, EY, R)
+  r_enlarge_corner = enlarge_corner_segments(enlarge, CX, CY)
+  return(r_enlarge_corner)
+
+def enlarge_corner_arc_arc_batch(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, R):
+  """ array version of cnc_outline.enlarge_corner_arc_arc()
+  """
+  enlarge = vector_geometry.sub_enlarge_corner_arc_arc(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, R)
+  r_enlarge_corner = enlarge_corner_segments(enlarge, CX, CY)
+  return(r_enlarge_corner)
+
+################################################################
+# sub-functions of cnc_cut_figure_batch()
+################################################################
+
+def cnc_cut_outline_array(ai_segment_list, ai_error_msg_id):
+  """ array version of cnc_outline.cnc_cut_outline_data()
+      It returns the tuple (outline_closed, end points, middle points, router_bit requests). The middle points of the lines are nan.
+  """
+  if(isinstance(ai_segment_list, (OutlineArray, TransformedOutline))):
+    ai_segment_list = ai_segment_list.to_list()
+  # is the outline closed or open?
+  outline_closed = False
+  if((ai_segment_list[0][0]==ai_segment_list[-1][-3])and(ai_segment_list[0][1]==ai_segment_list[-1][-2])):
+    outline_closed = True
+  # number of corners and segments
+  point_nb = len(ai_segment_list)
+  segment_nb = point_nb-1
+  # check of the outline size
+  if(segment_nb<1):
+    six.print_(("ERR202: Error in {:s}, the number of segments must be bigger than 1. Currently: {:d}".format(ai_error_msg_id, segment_nb)))
+    sys.exit(2)
+  if((segment_nb<2)and(outline_closed)):
+    six.print_(("ERR203: Error in {:s}, the number of segments must be bigger than 2 with a closed outline. Currently: {:d}".format(ai_error_msg_id, point_nb)))
+    sys.exit(2)
+  # check the start point
+  if(len(ai_segment_list[0])!=3):
+    six.print_(("ERR564: the start point is not defined with three floats. {:d}".format(len(ai_segment_list[0]))))
+    sys.exit(2)
+  # extract segment data: an outline of lines is converted in one step
+  try:
+    segment = numpy.array(ai_segment_list, dtype=float)
+  except ValueError:
+    segment = None
+  if(segment is not None):
+    r_mid = numpy.full((point_nb, 2), numpy.nan)
+  else:
+    segment = numpy.full((point_nb, 5), numpy.nan)
+    for pt_idx in range(point_nb):
+      len_segment = len(ai_segment_list[pt_idx])
+      if(len_segment==3):
+        segment[pt_idx,2:5] = ai_segment_list[pt_idx]
+      elif(len_segment==5):
+        segment[pt_idx] = ai_segment_list[pt_idx]
+      else:
+        six.print_(("ERR563: Error, the segment is defined with an unexpected number of float {:d}".format(len_segment)))
+        sys.exit(2)
+    r_mid = segment[:,0:2]
+  r_end = segment[:,-3:-1]
+  r_request = segment[:,-1].copy()
+  # check router_bit request of first and last point
+  if((r_request[0]!=0)and(not outline_closed)):
+    six.print_(("WARN946: Warning, in {:s}, the router_bit request of the start point of the open outline is not zero: {:0.2f}".format(ai_error_msg_id, r_request[0])))
+    r_request[0]=0
+  if(r_request[-1]!=0):
+    six.print_(("WARN947: Warning, in {:s}, the router_bit request of the last point of the outline is not zero: {:0.2f}".format(ai_error_msg_id, r_request[-1])))
+    r_request[-1]=0
+  # return
+  r_data = (outline_closed, r_end, r_mid, r_request)
+  return(r_data)
+
+def outline_data_list(ai_data):
+  """ convert the data of cnc_cut_outline_array() into the data of cnc_outline.cnc_cut_outline_data()
+  """
+  (outline_closed, end, mid, request) = ai_data
+  pt_end = list(zip(end[:,0].tolist(), end[:,1].tolist()))
+  pt_mid = [None if math.isnan(m[0]) else (m[0], m[1]) for m in mid.tolist()]
+  r_data = (outline_closed, pt_end, pt_mid, request.tolist())
+  return(r_data)
+
+def cnc_cut_figure_corners(ai_figure, ai_error_msg_id):
+  """ pack the corners of all the format-A outlines of ai_figure in arrays and compute them with numpy
+      It returns the list of outline data and a dictionary of arrays with one row per corner (the corners without router_bit request included).
+      The corners that must be recomputed with the scalar functions get no segment and an ok flag set to False.
+  """
+  outline_data = []
+  index = {'outline':[], 'k':[], 'pre':[], 'pre_mid':[], 'cur':[], 'post':[]}
+  offset = 0
+  for i in range(len(ai_figure)):
+    if(cnc_outline.check_outline_format(ai_figure[i])==2):
+      data = cnc_cut_outline_array(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i))
+      outline_data.append(data)
+      outline_closed = data[0]
+      point_nb = len(data[1])
+      first_corner = 1
+      if(outline_closed):
+        first_corner = 0
+      k = numpy.arange(first_corner, point_nb-1)
+      pre = k-1
+      pre_mid = k.copy()
+      if(outline_closed): # the first corner is between the last segment and the first segment
+        pre[0] = point_nb-2
+        pre_mid[0] = point_nb-1
+      index['outline'].append(numpy.full(len(k), i))
+      index['k'].append(k)
+      index['pre'].append(offset+pre)
+      index['pre_mid'].append(offset+pre_mid)
+      index['cur'].append(offset+k)
+      index['post'].append(offset+k+1)
+      offset += point_nb
+    else:
+      outline_data.append(None)
+  r_corner = {}
+  for key in index:
+    r_corner[key] = numpy.concatenate(index[key]) if(len(index[key])>0) else numpy.zeros(0, dtype=int)
+  corner_nb = len(r_corner['k'])
+  r_corner['segment'] = numpy.full((corner_nb, corner_segment_max, 4), numpy.nan)
+  r_corner['count'] = numpy.zeros(corner_nb, dtype=int)
+  r_corner['cut'] = numpy.zeros(corner_nb)
+  r_corner['ok'] = numpy.zeros(corner_nb, dtype=bool)
+  end = numpy.concatenate([d[1] for d in outline_data if d!=None]+[numpy.zeros((0, 2))])
+  mid = numpy.concatenate([d[2] for d in outline_data if d!=None]+[numpy.zeros((0, 2))])
+  request = numpy.concatenate([d[3] for d in outline_data if d!=None]+[numpy.zeros(0)])
+  (GX, GY) = (end[r_corner['pre'],0], end[r_corner['pre'],1])
+  (BX, BY) = (mid[r_corner['pre_mid'],0], mid[r_corner['pre_mid'],1])
+  (AX, AY) = (end[r_corner['cur'],0], end[r_corner['cur'],1])
+  (DX, DY) = (mid[r_corner['post'],0], mid[r_corner['post'],1])
+  (HX, HY) = (end[r_corner['post'],0], end[r_corner['post'],1])
+  R = request[r_corner['cur']]
+  r_corner['request'] = R
+  pre_arc = ~numpy.isnan(BX)
+  post_arc = ~numpy.isnan(DX)
+  r_corner['pre_arc'] = pre_arc
+  r_corner['post_arc'] = post_arc
+  # corners without router_bit request
+  angular = (R==0)
+  r_corner['segment'][angular,0,2] = AX[angular]
+  r_corner['segment'][angular,0,3] = AY[angular]
+  r_corner['count'][angular] = 1
+  r_corner['ok'][angular] = True
+  smooth = (R>0)
+  R = numpy.abs(R)
+  # (corner kind, selection)
+  kinds = (
+    ('ll', ~pre_arc&~post_arc),
+    ('la', ~pre_arc&post_arc),
+    ('al', pre_arc&~post_arc),
+    ('aa', pre_arc&post_arc))
+  with numpy.errstate(all='ignore'):
+    for (kind, selection) in kinds:
+      for (smooth_enlarge, sel) in ((True, selection&smooth), (False, selection&~smooth&~angular)):
+        idx = numpy.nonzero(sel)[0]
+        if(len(idx)==0):
+          continue
+        if(kind=='ll'):
+          if(smooth_enlarge):
+            (ok, cut, corners) = smooth_corner_line_line_batch(GX[idx], GY[idx], AX[idx], AY[idx], HX[idx], HY[idx], R[idx])
+          else:
+            (ok, cut, corners) = enlarge_corner_line_line_batch(GX[idx], GY[idx], AX[idx], AY[idx], HX[idx], HY[idx], R[idx])
+          r_corner['cut'][idx] = cut
+        elif(kind=='la'):
+          if(smooth_enlarge):
+            (ok, corners) = smooth_corner_line_arc_batch(GX[idx], GY[idx], AX[idx], AY[idx], DX[idx], DY[idx], HX[idx], HY[idx], R[idx])
+          else:
+            (ok, corners) = enlarge_corner_line_arc_batch(GX[idx], GY[idx], AX[idx], AY[idx], DX[idx], DY[idx], HX[idx], HY[idx], R[idx])
+        elif(kind=='al'):
+          if(smooth_enlarge):
+            (ok, corners) = smooth_corner_line_arc_batch(HX[idx], HY[idx], AX[idx], AY[idx], BX[idx], BY[idx], GX[idx], GY[idx], R[idx])
+          else:
+            (ok, corners) = enlarge_corner_line_arc_batch(HX[idx], HY[idx], AX[idx], AY[idx], BX[idx], BY[idx], GX[idx], GY[idx], R[idx])
+          corners = reverse_corner(corners)
+        elif(kind=='aa'):
+          if(smooth_enlarge):
+            (ok, corners) = smooth_corner_arc_arc_batch(GX[idx], GY[idx], BX[idx], BY[idx], AX[idx], AY[idx], DX[idx], DY[idx], HX[idx], HY[idx], R[idx])
+          else:
+            (ok, corners) = enlarge_corner_arc_arc_batch(GX[idx], GY[idx], BX[idx], BY[idx], AX[idx], AY[idx], DX[idx], DY[idx], HX[idx], HY[idx], R[idx])
+        r_corner['segment'][idx] = corners[0]
+        r_corner['count'][idx] = corners[1]
+        r_corner['ok'][idx] = ok
+    # radius of the arcs before and after each corner
+    r_corner['pre_radius'] = vector_geometry.arc_center_radius(GX, GY, BX, BY, AX, AY)[2]
+    r_corner['post_radius'] = vector_geometry.arc_center_radius(AX, AY, DX, DY, HX, HY)[2]
+  r_corner['G'] = numpy.column_stack((GX, GY))
+  r_corner['B'] = numpy.column_stack((BX, BY))
+  r_corner['A'] = numpy.column_stack((AX, AY))
+  r_corner['D'] = numpy.column_stack((DX, DY))
+  r_corner['H'] = numpy.column_stack((HX, HY))
+  r_corners = (outline_data, r_corner)
+  return(r_corners)
+
+def shortened_segment_fail(ai_end, ai_current, ai_arc, ai_radius, ai_cut):
+  """ array version of the check of cnc_cut_outline_assembly(): a segment starting or ending at ai_end instead of its original end point
+      gets a warning with the scalar recipe. It returns the mask of the failing corners
+  """
+  lCE = length(ai_end[:,0]-ai_current[:,0], ai_end[:,1]-ai_current[:,1])
+  r_fail = numpy.where(ai_arc, (lCE<arc_margin)|(lCE<arc_margin*ai_radius), (lCE<radian_epsilon)|(lCE<ai_cut))
+  return(r_fail)
+
+def cnc_cut_figure_chain(ai_outline_data, ai_corner):
+  """ chain the corners computed by cnc_cut_figure_corners() and check the effective segments like cnc_cut_outline_assembly()
+      It adds to ai_corner the previous point, the following point and the first corner row of each corner,
+      and returns the list of the outlines that can be assembled without the scalar functions
+  """
+  c = ai_corner
+  corner_nb = len(c['k'])
+  rows = numpy.arange(corner_nb)
+  first = c['segment'][:,0,2:4]
+  last = c['segment'][rows,numpy.maximum(c['count']-1, 0),2:4]
+  # first row of each outline
+  first_row = numpy.ones(corner_nb, dtype=bool)
+  first_row[1:] = (c['outline'][1:]!=c['outline'][:-1])
+  c['first_row'] = numpy.maximum.accumulate(numpy.where(first_row, rows, 0))
+  # previous point: the last point of the previous corner
+  c['previous'] = c['G'].copy()
+  c['previous'][~first_row] = last[:-1][~first_row[1:]]
+  # following point: the first point of the first corner for the last corner of a closed outline
+  outline_closed = numpy.array([d!=None and d[0] for d in ai_outline_data], dtype=bool)
+  point_nb = numpy.array([0 if d==None else len(d[1]) for d in ai_outline_data])
+  c['closing'] = outline_closed[c['outline']]&(c['k']==point_nb[c['outline']]-2)
+  c['following'] = numpy.where(c['closing'][:,None], first[c['first_row']], c['H'])
+  # checks of the effective segments
+  checked = c['ok']&(c['request']!=0)&(c['k']>0)
+  with numpy.errstate(all='ignore'):
+    shortened = ~first_row&numpy.any(c['previous']!=c['G'], axis=1)
+    fail = shortened&shortened_segment_fail(c['previous'], c['A'], c['pre_arc'], c['pre_radius'], c['cut'])
+    shortened = c['closing']&numpy.any(c['following']!=c['H'], axis=1)
+    fail |= shortened&shortened_segment_fail(c['following'], c['A'], c['post_arc'], c['post_radius'], c['cut'])
+    fail |= ~c['pre_arc']&~c['post_arc']&(length(c['following'][:,0]-c['previous'][:,0], c['following'][:,1]-c['previous'][:,1])<radian_epsilon)
+  c['ok'] &= ~(checked&fail)
+  # an outline with a rejected corner is assembled with the scalar functions
+  r_clean = numpy.array([d!=None for d in ai_outline_data], dtype=bool)
+  r_clean[c['outline'][~c['ok']]] = False
+  return(r_clean)
+
+def arc_middle_array(ai_points, ai_error_msg):
+  """ compute the arc middle points with numpy
+      ai_points is the tuple of the arrays of points (arc_pt1, arc_pt2, arc_pt3, new_end1, new_end2)
+      ai_error_msg(j) returns the (error_msg_id, error_msg_idx) of the request j
+      The requests that would print a warning or an error are recomputed with cnc_outline.arc_middle()
+  """
+  columns = []
+  for p in ai_points:
+    columns.extend((p[:,0], p[:,1]))
+  with numpy.errstate(all='ignore'):
+    (FX, FY, ok) = vector_geometry.arc_middle(*columns)
+  r_middle = numpy.column_stack((FX, FY))
+  for j in numpy.nonzero(~ok)[0].tolist():
+    r_middle[j] = cnc_outline.arc_middle(*([tuple(p[j].tolist()) for p in ai_points]+list(ai_error_msg(j))))
+  return(r_middle)
+
+def cnc_cut_corner_scalar(ai_data, ai_outline, ai_corner_idx, ai_error_msg_id):
+  """ compute one corner exactly as cnc_outline.cnc_cut_outline() does
+      ai_outline is the outline under construction
+  """
+  (outline_closed, pt_end, pt_mid, pt_request) = ai_data
+  point_nb = len(pt_end)
+  k = ai_corner_idx
+  if(k==0):
+    r_corner = cnc_outline.cnc_cut_corner(pt_end[-2],pt_mid[-1], pt_end[0], pt_mid[1], pt_end[1], pt_request[0], ai_error_msg_id, 0)
+  else:
+    previous_point = (ai_outline[-1][-2], ai_outline[-1][-1])
+    tmp_middle_point = pt_mid[k]
+    if(tmp_middle_point!=None):
+      tmp_middle_point = cnc_outline.arc_middle(pt_end[k-1], pt_mid[k], pt_end[k], previous_point, pt_end[k], "{:s}.am1".format(ai_error_msg_id), k)
+    following_point = pt_end[k+1]
+    following_middle_point =  pt_mid[k+1]
+    if(outline_closed and (k==point_nb-2)):
+      following_point = ai_outline[0]
+      if(following_middle_point!=None):
+        following_middle_point = cnc_outline.arc_middle(pt_end[-2], pt_mid[-1], pt_end[-1], pt_end[-2], following_point, "{:s}.am2".format(ai_error_msg_id), -2)
+    r_corner = cnc_outline.cnc_cut_corner(previous_point, tmp_middle_point, pt_end[k], following_middle_point, following_point, pt_request[k], ai_error_msg_id, k)
+  return(r_corner)
+
+def shortened_segment_ok(ai_end, ai_current, ai_radius, ai_cut):
+  """ check that the scalar recipe gets no warning when a segment starts or ends at ai_end instead of its original end point
+      ai_radius is None for a line
+  """
+  r_ok = True
+  lCE = math.sqrt((ai_end[0]-ai_current[0])**2+(ai_end[1]-ai_current[1])**2)
+  if(ai_radius==None):
+    if((lCE<radian_epsilon)or(lCE<ai_cut)):
+      r_ok = False
+  else:
+    if((lCE<arc_margin)or(lCE<arc_margin*ai_radius)):
+      r_ok = False
+  return(r_ok)
+
+def cnc_cut_outline_assembly(ai_data, ai_corner, ai_error_msg_id):
+  """ chain the corners of one outline. The corners that can not be kept are recomputed with the scalar functions
+      It returns the list of corner outlines, the list of corners recomputed with the scalar functions and the list of previous points
+  """
+  (outline_closed, pt_end, pt_mid, pt_request) = ai_data
+  point_nb = len(pt_end)
+  arc_radius = {}
+  def segment_radius(ai_k): # radius of the arc segment ai_k
+    if(pt_mid[ai_k]==None):
+      return(None)
+    if(not ai_k in arc_radius):
+      arc_radius[ai_k] = cnc_outline.arc_center_radius(pt_end[ai_k-1], pt_mid[ai_k], pt_end[ai_k], "{:s}.{:d}".format(ai_error_msg_id, ai_k))[2]
+    return(arc_radius[ai_k])
+  r_corner = []
+  r_scalar = []
+  r_previous = []
+  r_outline = [] # outline under construction, without the arc middle corrections
+  first_corner = 1
+  if(outline_closed):
+    first_corner = 0
+  else:
+    r_outline.append(pt_end[0])
+  for k in range(first_corner, point_nb-1):
+    previous_point = None
+    if(k>0):
+      previous_point = (r_outline[-1][-2], r_outline[-1][-1])
+    r_previous.append(previous_point)
+    if(pt_request[k]==0):
+      corner = [(pt_end[k][0], pt_end[k][1])]
+    else:
+      (corner, cut) = ai_corner[k]
+      if((corner!=None)and(k>0)):
+        # check the effective segments
+        if(previous_point!=pt_end[k-1]):
+          if(not shortened_segment_ok(previous_point, pt_end[k], segment_radius(k), cut)):
+            corner = None
+        if(outline_closed and (k==point_nb-2)and(r_outline[0]!=pt_end[k+1])):
+          if(not shortened_segment_ok(r_outline[0], pt_end[k], segment_radius(k+1), cut)):
+            corner = None
+        if((corner!=None)and(pt_mid[k]==None)and(pt_mid[k+1]==None)):
+          # line-line corner: check also the effective GH length
+          following_point = pt_end[k+1]
+          if(outline_closed and (k==point_nb-2)):
+            following_point = r_outline[0]
+          if(math.sqrt((following_point[0]-previous_point[0])**2+(following_point[1]-previous_point[1])**2)<radian_epsilon):
+            corner = None
+      if(corner==None):
+        corner = cnc_cut_corner_scalar(ai_data, r_outline, k, ai_error_msg_id)
+        r_scalar.append(k)
+    r_corner.append(corner)
+    r_outline.extend(corner)
+  r_assembly = (r_corner, r_scalar, r_previous)
+  return(r_assembly)
+
+def arc_middle_batch(ai_request):
+  """ compute a list of arc middle points with numpy
+      ai_request is a list of (arc_pt1, arc_pt2, arc_pt3, new_end1, new_end2, error_msg_id, error_msg_idx)
+      The requests that would print a warning or an error are recomputed with cnc_outline.arc_middle()
+  """
+  r_middle = []
+  if(len(ai_request)>0):
+    points = [numpy.array([r[i] for r in ai_request], dtype=float) for i in range(5)]
+    middle = arc_middle_array(points, lambda j: ai_request[j][5:7])
+    r_middle = [tuple(m) for m in middle.tolist()]
+  return(r_middle)
+
+def cnc_cut_outline_sequential(ai_data, ai_corner, ai_error_msg_id):
+  """ assemble one outline when some of its corners must be recomputed with the scalar functions
+      ai_corner is the dictionary of the (corner outline, cut length) of each corner index
+      It returns the outline of format-B
+  """
+  (outline_closed, pt_end, pt_mid, pt_request) = ai_data
+  (corner, scalar, previous) = cnc_cut_outline_assembly(ai_data, ai_corner, ai_error_msg_id)
+  # collect the arc middle points
+  check_request = [] # am1 and am2: only the checks are needed
+  middle_request = [] # am3 and am4
+  point_nb = len(pt_end)
+  first_corner = 1
+  if(outline_closed):
+    first_corner = 0
+  for k in range(1, point_nb-1):
+    c = k-first_corner
+    if(pt_mid[k]!=None):
+      if(not k in scalar):
+        check_request.append((pt_end[k-1], pt_mid[k], pt_end[k], previous[c], pt_end[k], "{:s}.am1".format(ai_error_msg_id), k))
+      middle_request.append((pt_end[k-1], pt_mid[k], pt_end[k], previous[c], corner[c][0], "{:s}.am3".format(ai_error_msg_id), k))
+    if(outline_closed and (k==point_nb-2)and(pt_mid[-1]!=None)and(not k in scalar)):
+      check_request.append((pt_end[-2], pt_mid[-1], pt_end[-1], pt_end[-2], corner[0][0], "{:s}.am2".format(ai_error_msg_id), -2))
+  if(len(corner)>0):
+    last_point = (corner[-1][-1][-2], corner[-1][-1][-1])
+  else:
+    last_point = pt_end[0]
+  if(outline_closed):
+    next_point = corner[0][0]
+  else:
+    next_point = pt_end[-1]
+  if(pt_mid[-1]!=None):
+    middle_request.append((pt_end[-2], pt_mid[-1], pt_end[-1], last_point, next_point, "{:s}.am4".format(ai_error_msg_id), -1))
+  arc_middle_batch(check_request)
+  middle_point = arc_middle_batch(middle_request)
+  for (request, middle) in zip(middle_request, middle_point):
+    if(request[6]>0):
+      c = request[6]-first_corner
+      corner[c][0] = (middle[0], middle[1], corner[c][0][0], corner[c][0][1])
+  # build the outline
+  r_outline = []
+  if(not outline_closed):
+    r_outline.append(pt_end[0])
+  for c in corner:
+    r_outline.extend(c)
+  if(pt_mid[-1]!=None):
+    r_outline.append((middle_point[-1][0], middle_point[-1][1], next_point[0], next_point[1]))
+  else:
+    r_outline.append((next_point[0], next_point[1]))
+  return(r_outline)
+
+################################################################
+# API function
+################################################################
+
+def cnc_cut_figure_batch(ai_figure, ai_error_msg_id):
+  """ apply the cnc_cut_outline function to all outlines of the input figure using numpy
+      It returns the same figure as design_output.cnc_cut_figure() within batch_tolerance
+  """
+  (outline_data, c) = cnc_cut_figure_corners(ai_figure, ai_error_msg_id)
+  clean = cnc_cut_figure_chain(outline_data, c)
+  def error_msg(ai_rows, ai_suffix):
+    return(lambda j: ("{:s}.ol{:d}.{:s}".format(ai_error_msg_id, c['outline'][ai_rows[j]], ai_suffix), int(c['k'][ai_rows[j]])))
+  # arc middle points of the outlines without scalar corners
+  clean_row = clean[c['outline']]
+  arc_row = numpy.nonzero(clean_row&c['pre_arc']&(c['k']>0))[0]
+  if(len(arc_row)>0): # am1 (check only) and am3
+    arc_middle_array((c['G'][arc_row], c['B'][arc_row], c['A'][arc_row], c['previous'][arc_row], c['A'][arc_row]), error_msg(arc_row, "am1"))
+    first = c['segment'][arc_row,0,2:4]
+    c['segment'][arc_row,0,0:2] = arc_middle_array((c['G'][arc_row], c['B'][arc_row], c['A'][arc_row], c['previous'][arc_row], first), error_msg(arc_row, "am3"))
+  arc_row = numpy.nonzero(clean_row&c['closing']&c['post_arc'])[0]
+  if(len(arc_row)>0): # am2 (check only)
+    arc_middle_array((c['G'][arc_row], c['D'][arc_row], c['H'][arc_row], c['A'][arc_row], c['following'][arc_row]), error_msg(arc_row, "am2"))
+  # convert the corner outlines into segments of format-B
+  segment = c['segment'][numpy.arange(corner_segment_max)[None,:]<c['count'][:,None]]
+  is_point = numpy.isnan(segment[:,0]).tolist()
+  columns = [segment[:,i].tolist() for i in range(4)]
+  segment = [p if s else a for (p, a, s) in zip(zip(columns[2], columns[3]), zip(*columns), is_point)]
+  segment_offset = numpy.concatenate(([0], numpy.cumsum(c['count']))).tolist()
+  row_range = numpy.searchsorted(c['outline'], [numpy.arange(len(ai_figure)), numpy.arange(1, len(ai_figure)+1)]).tolist()
+  # build the figure
+  r_figure = []
+  for i in range(len(ai_figure)):
+    if(outline_data[i]==None): # circle of format-B
+      r_figure.append(ai_figure[i])
+      continue
+    (row_start, row_stop) = (row_range[0][i], row_range[1][i])
+    if(not clean[i]):
+      corner = {}
+      for (j, k) in zip(range(row_start, row_stop), c['k'][row_start:row_stop].tolist()):
+        corner[k] = (segment[segment_offset[j]:segment_offset[j+1]] if c['ok'][j] else None, c['cut'][j])
+      r_figure.append(cnc_cut_outline_sequential(outline_data_list(outline_data[i]), corner, "{:s}.ol{:d}".format(ai_error_msg_id, i)))
+      continue
+    (outline_closed, end, mid, request) = outline_data[i]
+    r_outline = []
+    if(not outline_closed):
+      r_outline.append(tuple(end[0].tolist()))
+    r_outline.extend(segment[segment_offset[row_start]:segment_offset[row_stop]])
+    if(outline_closed):
+      next_point = r_outline[0][-2:]
+    else:
+      next_point = tuple(end[-1].tolist())
+    if(not numpy.isnan(mid[-1,0])):
+      if(row_stop>row_start):
+        last_point = r_outline[-1][-2:]
+      else:
+        last_point = r_outline[0]
+      middle = arc_middle_array(tuple(numpy.array([p], dtype=float) for p in (end[-2], mid[-1], end[-1], last_point, next_point)),
+        lambda j: ("{:s}.ol{:d}.am4".format(ai_error_msg_id, i), -1))[0].tolist()
+      r_outline.append((middle[0], middle[1], next_point[0], next_point[1]))
+    else:
+      r_outline.append(next_point)
+    r_figure.append(r_outline)
+  return(r_figure)
+
+################################################################
+# cnc_outline_batch testing
+################################################################
+
+def figure_difference(ai_figure_1, ai_figure_2):
+  """ return the biggest coordinate difference between two figures of format-B. Return -1 if the figure structures are different
+  """
+  r_diff = 0
+  if(len(ai_figure_1)!=len(ai_figure_2)):
+    return(-1)
+  for (ol1, ol2) in zip(ai_figure_1, ai_figure_2):
+    if(cnc_outline.check_outline_format(ol1)==0):
+      ol1 = [ol1]
+      ol2 = [ol2]
+    if(len(ol1)!=len(ol2)):
+      return(-1)
+    for (s1, s2) in zip(ol1, ol2):
+      if(len(s1)!=len(s2)):
+        return(-1)
+      for (v1, v2) in zip(s1, s2):
+        r_diff = max(r_diff, abs(v1-v2))
+  return(r_diff)
+
+def test_figure(ai_router_bit_radius):
+  """ figure with line-line, line-arc, arc-line and arc-arc corners
+  """
+  rr = ai_router_bit_radius
+  corner_a = [
+    [0,20, rr],
+    [-5,15,0,10,rr],
+    [-5,-5,10,0,rr],
+    [15,-5,20,0,rr]]
+  chichi_horizontal = [
+    [40,0,rr],
+    [45,5,50,0,rr],
+    [60,-20,rr],
+    [70,20,-rr],
+    [80,-20,rr],
+    [90,0,rr],
+    [95,5,100,0,rr]]
+  arc_arc_horizontal = [
+    [150,0,rr],
+    [155, 5,160,18,rr],
+    [165, 5,170, 0,rr],
+    [175,15,180,20,rr],
+    [185, 5,190, 0,rr],
+    [195, 5,200,20,rr],
+    [205,18,210, 0,rr],
+    [214, -5,225,-10,rr],
+    [229, 0,230,10,rr],
+    [235,14,240,20,rr],
+    [241,10,245,0,rr]]
+  line_arc_vertical = [
+    [0,200,rr],
+    [10,198,20,190,rr],
+    [0,190,rr],
+    [10,182,30,180,rr],
+    [30,170,rr],
+    [0,170,rr],
+    [10,167,20,160,rr],
+    [30,160,rr],
+    [32,155,30,150,rr],
+    [20,150,rr],
+    [15,145, 0,140,rr]]
+  closed_square = [
+    [300,0,rr],
+    [400,0,rr],
+    [420,50,400,100,rr],
+    [300,100,-rr],
+    [300,0,0]]
+  r_figure = [corner_a, chichi_horizontal, arc_arc_horizontal, line_arc_vertical, closed_square, (350, 50, 10)]
+  # star with many corners to measure the speed-up
+  star_nb = 100
+  star = []
+  for i in range(2*star_nb):
+    radius = 100 + 5*(i%2)
+    angle = i*math.pi/star_nb
+    star.append([500+radius*math.cos(angle), 300+radius*math.sin(angle), rr])
+  star.append([star[0][0], star[0][1], 0])
+  r_figure.append(star)
+  return(r_figure)
+
+def benchmark_figure(ai_router_bit_radius, ai_outline_nb=50, ai_corner_nb=400):
+  """ figure of ai_outline_nb stars with ai_corner_nb line-line corners each
+  """
+  r_figure = []
+  for j in range(ai_outline_nb):
+    star = []
+    for i in range(ai_corner_nb):
+      radius = 1000 + 50*(i%2)
+      angle = 2*i*math.pi/ai_corner_nb
+      star.append([5000*j+radius*math.cos(angle), radius*math.sin(angle), ai_router_bit_radius])
+    star.append([star[0][0], star[0][1], 0])
+    r_figure.append(star)
+  return(r_figure)
+
+def cnc_outline_batch_test1():
+  """ compare cnc_cut_figure_batch() with cnc_cut_outline() applied to each outline
+      and print the time of cnc_cut_figure_batch() and cnc_cut_outline() on a figure with many corners
+  """
+  r_test = 1
+  for rr in (0, 1.0, 2.0, -2.0):
+    fig = test_figure(rr)
+    t0 = time.time()
+    scalar_figure = []
+    for i in range(len(fig)):
+      if(cnc_outline.check_outline_format(fig[i])==2):
+        scalar_figure.append(cnc_outline.cnc_cut_outline(fig[i], "test1.ol{:d}".format(i)))
+      else:
+        scalar_figure.append(fig[i])
+    t1 = time.time()
+    batch_figure = cnc_cut_figure_batch(fig, "test1")
+    t2 = time.time()
+    diff = figure_difference(scalar_figure, batch_figure)
+    six.print_(("router_bit_radius {:0.2f} : difference {:0.3e}  scalar {:0.4f} s  batch {:0.4f} s".format(rr, diff, t1-t0, t2-t1)))
+    if((diff<0)or(diff>batch_tolerance)):
+      six.print_(("ERR512: Error, cnc_cut_figure_batch() differs from cnc_cut_outline() with router_bit_radius {:0.2f}".format(rr)))
+      r_test = 0
+  # benchmark: the best time of three runs
+  for rr in (0.3, 1.0):
+    fig = benchmark_figure(rr)
+    (scalar_time, batch_time) = (float('inf'), float('inf'))
+    for run in range(3):
+      t0 = time.time()
+      scalar_figure = [cnc_outline.cnc_cut_outline(fig[i], "test1.ol{:d}".format(i)) for i in range(len(fig))]
+      t1 = time.time()
+      batch_figure = cnc_cut_figure_batch(fig, "test1")
+      t2 = time.time()
+      (scalar_time, batch_time) = (min(scalar_time, t1-t0), min(batch_time, t2-t1))
+    diff = figure_difference(scalar_figure, batch_figure)
+    six.print_(("benchmark {:d} corners with router_bit_radius {:0.2f} : difference {:0.3e}  scalar {:0.4f} s  batch {:0.4f} s  speed-up {:0.2f}".format(len(fig)*(len(fig[0])-1), rr, diff, scalar_time, batch_time, scalar_time/batch_time)))
+    if((diff<0)or(diff>batch_tolerance)):
+      six.print_(("ERR512: Error, cnc_cut_figure_batch() differs from cnc_cut_outline() with router_bit_radius {:0.2f}".format(rr)))
+      r_test = 0
+  return(r_test)
+
+################################################################
+# cnc_outline_batch command line interface
+################################################################
+
+def cnc_outline_batch_cli(ai_args=""):
+  """ command line interface of cnc_outline_batch.py when it is used in standalone
+  """
+  cob_parser = argparse.ArgumentParser(description='Run the function cnc_cut_figure_batch() to check it.')
+  cob_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It compares cnc_cut_figure_batch() with cnc_cut_outline() on a bunch of shapes and measures the speed-up.')
+  effective_args = design_help.get_effective_args(ai_args)
+  cob_args = cob_parser.parse_args(effective_args)
+  r_cob = 1
+  if(cob_args.sw_test1):
+    r_cob = cnc_outline_batch_test1()
+  return(r_cob)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  cnc_outline_batch_cli("--test1")
+
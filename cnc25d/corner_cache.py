@@ -0,0 +1,279 @@
+# corner_cache.py
+# cache of the corners computed by cnc_outline.cnc_cut_corner()
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+corner_cache.py provides a LRU cache for the corners computed by cnc_outline.cnc_cut_corner().
+The corners are stored in a local frame: the current point is the origin and the previous point is on the x-axis.
+So two corners that are identical up to a translation and a rotation share the same cache entry.
+The cache is disabled by default because the corners returned by a hit differ from a new computation by the rounding errors of the rotation.
+"""
+
+################################################################
+# import
+################################################################
+
+import math
+import sys, argparse
+import collections
+import six
+#
+from . import design_help # just for get_effective_args()
+#
+import time # for the tests
+
+################################################################
+# Corner_Cache
+################################################################
+
+class Corner_Cache(object):
+  """ LRU cache of corner outlines with hit and miss counters
+  """
+  def __init__(self, ai_max_size=4096, ai_tolerance=1e-9):
+    """ ai_max_size: maximum number of corners kept in the cache
+        ai_tolerance: quantization of the local geometry used to build the cache key
+    """
+    self.max_size = ai_max_size
+    self.tolerance = ai_tolerance
+    self.corners = collections.OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def clear(self):
+    """ empty the cache and reset the counters
+    """
+    self.corners.clear()
+    self.hits = 0
+    self.misses = 0
+
+  def info(self):
+    """ return a dictionary with the counters of the cache
+    """
+    r_info = {'hits':self.hits, 'misses':self.misses, 'size':len(self.corners), 'max_size':self.max_size}
+    return(r_info)
+
+  def get(self, ai_key):
+    """ return the corner stored with ai_key or None
+    """
+    r_corner = self.corners.get(ai_key)
+    if(r_corner is None):
+      self.misses += 1
+    else:
+      self.hits += 1
+      self.corners.move_to_end(ai_key)
+    return(r_corner)
+
+  def put(self, ai_key, ai_corner):
+    """ store a corner and remove the least recently used one if the cache is full
+    """
+    self.corners[ai_key] = ai_corner
+    self.corners.move_to_end(ai_key)
+    while(len(self.corners)>self.max_size):
+      self.corners.popitem(last=False)
+
+################################################################
+# local frame
+################################################################
+
+def corner_frame(ai_pre_point, ai_current_point):
+  """ return the local frame (ox, oy, cos_a, sin_a) of a corner or None if the previous point is the current point
+  """
+  dx = ai_pre_point[0]-ai_current_point[0]
+  dy = ai_pre_point[1]-ai_current_point[1]
+  l = math.sqrt(dx**2+dy**2)
+  r_frame = None
+  if(l>0):
+    r_frame = (ai_current_point[0], ai_current_point[1], dx/l, dy/l)
+  return(r_frame)
+
+def to_local(ai_frame, ai_point):
+  """ coordinates of ai_point in the local frame
+  """
+  (ox, oy, cos_a, sin_a) = ai_frame
+  dx = ai_point[0]-ox
+  dy = ai_point[1]-oy
+  r_point = (dx*cos_a+dy*sin_a, -dx*sin_a+dy*cos_a)
+  return(r_point)
+
+def to_global(ai_frame, ai_x, ai_y):
+  """ coordinates of the local point (ai_x, ai_y) in the global frame
+  """
+  (ox, oy, cos_a, sin_a) = ai_frame
+  r_point = (ox+ai_x*cos_a-ai_y*sin_a, oy+ai_x*sin_a+ai_y*cos_a)
+  return(r_point)
+
+def corner_key(ai_frame, ai_tolerance, ai_pre_point, ai_pre_middle, ai_post_middle, ai_post_point, ai_router_bit_request):
+  """ build the cache key with the quantized local geometry of a corner
+  """
+  r_key = [ai_router_bit_request]
+  for pt in (ai_pre_point, ai_pre_middle, ai_post_middle, ai_post_point):
+    if(pt is None):
+      r_key.append(None)
+    else:
+      (x, y) = to_local(ai_frame, pt)
+      r_key.append((int(round(x/ai_tolerance)), int(round(y/ai_tolerance))))
+  return(tuple(r_key))
+
+def outline_to_local(ai_frame, ai_outline):
+  """ convert a format-B open outline into the local frame
+  """
+  r_outline = []
+  for segment in ai_outline:
+    local_segment = ()
+    for i in range(0, len(segment), 2):
+      local_segment += to_local(ai_frame, segment[i:i+2])
+    r_outline.append(local_segment)
+  return(tuple(r_outline))
+
+def outline_to_global(ai_frame, ai_outline):
+  """ convert a format-B open outline of the local frame into the global frame
+  """
+  r_outline = []
+  for segment in ai_outline:
+    global_segment = ()
+    for i in range(0, len(segment), 2):
+      global_segment += to_global(ai_frame, segment[i], segment[i+1])
+    r_outline.append(global_segment)
+  return(r_outline)
+
+################################################################
+# cached computation
+################################################################
+
+corner_cache = None # the active Corner_Cache. None if the cache is disabled
+
+def corner_cache_enable(ai_max_size=4096, ai_tolerance=1e-9):
+  """ enable the corner cache used by cnc_outline.cnc_cut_corner()
+  """
+  global corner_cache
+  corner_cache = Corner_Cache(ai_max_size, ai_tolerance)
+  return(corner_cache)
+
+def corner_cache_disable():
+  """ disable the corner cache
+  """
+  global corner_cache
+  corner_cache = None
+
+def corner_cache_info():
+  """ return the counters of the corner cache or None if it is disabled
+  """
+  r_info = None
+  if(corner_cache is not None):
+    r_info = corner_cache.info()
+  return(r_info)
+
+def cached_corner(ai_compute, ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request):
+  """ return the corner computed by ai_compute() or its cached value
+      ai_compute() returns the tuple (corner outline, status). The status is 0 if the corner has not been cut because of a warning
+      The corners with the status 0 are not cached, so their warning is printed each time
+  """
+  frame = corner_frame(ai_pre_point, ai_current_point)
+  if((corner_cache is None)or(frame is None)):
+    return(ai_compute()[0])
+  key = corner_key(frame, corner_cache.tolerance, ai_pre_point, ai_pre_middle, ai_post_middle, ai_post_point, ai_router_bit_request)
+  local_corner = corner_cache.get(key)
+  if(local_corner is not None):
+    return(outline_to_global(frame, local_corner))
+  # new corner
+  (r_corner, corner_status) = ai_compute()
+  if(corner_status==1):
+    corner_cache.put(key, outline_to_local(frame, r_corner))
+  return(r_corner)
+
+################################################################
+# corner_cache testing
+################################################################
+
+def corner_cache_test1():
+  """ compare the cnc_cut_outline() of rotated and translated crenels with and without the cache
+  """
+  from . import cnc_outline # here to avoid a circular import
+  r_test = 1
+  crenel = [(0,0,0), (40,0,2), (40,10,2), (50,10,2), (50,0,2), (100,0,3), (120,-15,100,-30,3), (0,-30,-2), (0,0,0)]
+  figure = []
+  for i in range(100):
+    ol = cnc_outline.outline_rotate(crenel, 0, 0, i*2*math.pi/100)
+    figure.append(cnc_outline.outline_shift_xy(ol, 3*i, 1, -2*i, 1))
+  corner_cache_disable()
+  t0 = time.time()
+  ref = [cnc_outline.cnc_cut_outline(ol, "corner_cache_test1") for ol in figure]
+  t1 = time.time()
+  corner_cache_enable()
+  new = [cnc_outline.cnc_cut_outline(ol, "corner_cache_test1") for ol in figure]
+  t2 = time.time()
+  info = corner_cache_info()
+  # the corners that are not cut because of a warning are not cached
+  small_square = [(0,0,0), (1,0,5), (1,1,5), (0,1,0), (0,0,0)]
+  cnc_outline.cnc_cut_outline(small_square, "corner_cache_test1_warning")
+  warning_info = corner_cache_info()
+  corner_cache_disable()
+  if(info['hits']==0):
+    six.print_(("ERR415: Error, the corner cache gets no hit"))
+    r_test = 0
+  if(warning_info['size']!=info['size']):
+    six.print_(("ERR416: Error, the corners with a warning are cached"))
+    r_test = 0
+  max_diff = 0
+  for (ol1, ol2) in zip(ref, new):
+    if(len(ol1)!=len(ol2)):
+      six.print_(("ERR417: Error, the outlines have different lengths {:d} {:d}".format(len(ol1), len(ol2))))
+      r_test = 0
+      continue
+    for (s1, s2) in zip(ol1, ol2):
+      if(len(s1)!=len(s2)):
+        print("ERR418: Error, the segments have different lengths")
+        r_test = 0
+        continue
+      max_diff = max([max_diff]+[abs(v1-v2) for (v1, v2) in zip(s1, s2)])
+  if(max_diff>1e-6):
+    six.print_(("ERR419: Error, the cached corners differ of {:0.9f}".format(max_diff)))
+    r_test = 0
+  six.print_(("corner cache: hits {:d}  misses {:d}  size {:d}  max_diff {:0.3e}".format(info['hits'], info['misses'], info['size'], max_diff)))
+  six.print_(("cnc_cut_outline: without cache {:0.4f} s  with cache {:0.4f} s".format(t1-t0, t2-t1)))
+  return(r_test)
+
+################################################################
+# corner_cache command line interface
+################################################################
+
+def corner_cache_cli(ai_args=""):
+  """ command line interface of corner_cache.py when it is used in standalone
+  """
+  cc_parser = argparse.ArgumentParser(description='Test the corner cache of cnc_cut_corner().')
+  cc_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It compares the outlines computed with and without the corner cache.')
+  effective_args = design_help.get_effective_args(ai_args)
+  cc_args = cc_parser.parse_args(effective_args)
+  r_cc = 1
+  if(cc_args.sw_test1):
+    r_cc = corner_cache_test1()
+  return(r_cc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  # cnc_outline uses the cache of the imported module cnc25d.corner_cache, not the cache of __main__
+  from cnc25d import corner_cache
+  corner_cache.corner_cache_cli("--test1")
+
@@ -29,9 +29,7 @@ it provide macro that are commonly used to generate the output files of a design
 # header for Python / FreeCAD compatibility
 ################################################################
 
-from . import importing_freecad
 import six
-importing_freecad.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -49,19 +47,48 @@ import os
 import re
 #import Tkinter # to display the outline in a small GUI
 # FreeCAD
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
 # cnc25d
 from . import outline_backends
+from . import stl_backend
+from . import brep_cache
+from . import assembly_slice
 from . import export_2d
 from . import design_help
 from . import cnc_outline
+from . import outline_array
 from . import positioning
 
 
+################################################################
+# global variable
+################################################################
+
+# if True, the .dxf outputs are written with outline_backends.write_figure_in_dxf_stream() (one LWPOLYLINE per outline, DXF R2000)
+# else with mozman dxfwrite (one LINE or ARC per segment, DXF R12)
+dxf_lwpolyline = False
+
+# if True, the .svg outputs are written with outline_backends.write_figure_in_svg_stream() (one path per outline)
+# else with mozman svgwrite
+svg_stream = False
+
+# how figures_to_freecad_assembly() combines the placed parts:
+# 'fuse': pairwise fuse, 'multifuse': one n-ary fuse, 'compound': no boolean operation (for visualization and STL)
+assembly_modes = ('fuse', 'multifuse', 'compound')
+assembly_mode = 'fuse'
+
+# if True, the .stl outputs of the 2D-figures are written with stl_backend.write_figure_in_stl() (no FreeCAD)
+# else with FreeCAD (figure_to_freecad_25d_part() and exportStl())
+stl_native = False
+
+# if True, the xyz-slices of the 3D assemblies are computed from the figures with assembly_slice.assembly_xyz_to_dxf()
+# else the FreeCAD assembly is sliced with export_2d.export_xyz_to_dxf()
+slice_xyz_analytic = True
+
 ################################################################
 # help functions
 ################################################################
@@ -96,9 +123,13 @@ def get_output_file_suffix(ai_output_file_basename):
   r_bs = (output_file_basename, output_file_suffix)
   return(r_bs)
 
-def generate_output_file(ai_figure, ai_output_filename, ai_height, ai_info_txt=''):
+def generate_output_file(ai_figure, ai_output_filename, ai_height, ai_info_txt='', ai_stl_native=None):
   """ implement the swith --output_file_basename for 2D figure
+      ai_stl_native selects the STL writer of the .stl outputs (default: stl_native)
   """
+  stl_native_writer = ai_stl_native
+  if(stl_native_writer is None):
+    stl_native_writer = stl_native
   if(ai_output_filename!=''):
     # create the output directory if needed
     l_output_dir = os.path.dirname(ai_output_filename)
@@ -108,22 +139,36 @@ def generate_output_file(ai_figure, ai_output_filename, ai_height, ai_info_txt='
     # mozman dxfwrite
     if(re.search('\.dxf$', ai_output_filename)):
       #print("Generate {:s} with mozman dxfwrite".format(ai_output_filename))
-      outline_backends.write_figure_in_dxf(ai_figure, ai_output_filename)
+      if(dxf_lwpolyline):
+        outline_backends.write_figure_in_dxf_stream(ai_figure, ai_output_filename)
+      else:
+        outline_backends.write_figure_in_dxf(ai_figure, ai_output_filename)
     # mozman svgwrite
     elif(re.search('\.svg$', ai_output_filename)):
       #print("Generate {:s} with mozman svgwrite".format(ai_output_filename))
-      outline_backends.write_figure_in_svg(ai_figure, ai_output_filename)
+      if(svg_stream):
+        outline_backends.write_figure_in_svg_stream(ai_figure, ai_output_filename)
+      else:
+        outline_backends.write_figure_in_svg(ai_figure, ai_output_filename)
     # FreeCAD
     elif(re.search('\.brep$', ai_output_filename)):
       six.print_(("Generate with FreeCAD the BRep file {:s}".format(ai_output_filename)))
-      freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
+      freecad_part = brep_cache.cached_figure_to_freecad_25d_part(ai_figure, ai_height)
       freecad_part.exportBrep("{:s}".format(ai_output_filename))
       six.print_(("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename)))
       # slice freecad_part  in the XY plan at a height of ai_height/2
       export_2d.export_to_dxf(freecad_part, Base.Vector(0,0,1), ai_height/2, "{:s}.dxf".format(ai_output_filename))
+    elif(re.search('\.stl$', ai_output_filename) and stl_native_writer):
+      six.print_(("Generate with stl_backend the STL file {:s}".format(ai_output_filename)))
+      stl_backend.write_figure_in_stl(ai_figure, ai_height, ai_output_filename)
+      # the slice of a straight extrusion at a height of ai_height/2 is the figure itself
+      if(dxf_lwpolyline):
+        outline_backends.write_figure_in_dxf_stream(ai_figure, "{:s}.dxf".format(ai_output_filename))
+      else:
+        outline_backends.write_figure_in_dxf(ai_figure, "{:s}.dxf".format(ai_output_filename))
     elif(re.search('\.stl$', ai_output_filename)):
       six.print_(("Generate with FreeCAD the STL file {:s}".format(ai_output_filename)))
-      freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
+      freecad_part = brep_cache.cached_figure_to_freecad_25d_part(ai_figure, ai_height)
       freecad_part.exportStl("{:s}".format(ai_output_filename))
       six.print_(("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename)))
       # slice freecad_part  in the XY plan at a height of ai_height/2
@@ -174,25 +219,34 @@ def freecad_object_output_file(ai_freecad_object, ai_output_filename, ai_brep=Tr
     export_2d.export_xyz_to_dxf(ai_freecad_object, size_x, size_y, size_z, slice_x, slice_y, slice_z, dxf_output_filename)
   return(0)
 
-def generate_3d_assembly_output_file(ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[]):
+def generate_3d_assembly_output_file(ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[], ai_assembly_mode=None):
   """ implement the swith --output_file_basename for 3D assembly
   """
-  six.print_(("Compute with FreeCAD the 3D assembly {:s}".format(ai_output_filename)))
-  fc_assembly = figures_to_freecad_assembly(ai_3d_conf)
-  freecad_object_output_file(fc_assembly, ai_output_filename, ai_brep, ai_stl, ai_slice_xyz)
+  freecad_slice_xyz = ai_slice_xyz
+  if(slice_xyz_analytic and (len(ai_slice_xyz)>0)):
+    dxf_output_filename = "{:s}_xyz_slices.dxf".format(ai_output_filename)
+    six.print_(("Slice the figures of the 3D assembly into the DXF file {:s}".format(dxf_output_filename)))
+    assembly_slice.assembly_xyz_to_dxf(ai_3d_conf, ai_slice_xyz, dxf_output_filename)
+    freecad_slice_xyz = []
+  if(ai_brep or ai_stl or (len(freecad_slice_xyz)>0)):
+    six.print_(("Compute with FreeCAD the 3D assembly {:s}".format(ai_output_filename)))
+    fc_assembly = figures_to_freecad_assembly(ai_3d_conf, ai_assembly_mode)
+    freecad_object_output_file(fc_assembly, ai_output_filename, ai_brep, ai_stl, freecad_slice_xyz)
   return(0)
 
 def flip_rotate_and_translate_figure(ai_figure, ai_zero_x, ai_zero_y, ai_size_x, ai_size_y, ai_x_flip, ai_y_flip, ai_rotation_angle, ai_translate_x, ai_translate_y):
   """ flip, rotate and translate a figure (list of outlines). Usually used to agglomerate figures to create a cut-set.
+      The transformations are composed in one affine matrix and applied only when the outline is read (outline_array.TransformedOutline)
   """
   r_figure = []
   for i in range(len(ai_figure)):
-    centered_ol = cnc_outline.outline_shift_xy(ai_figure[i], -1*(ai_zero_x+ai_size_x/2.0), 1, -1*(ai_zero_y+ai_size_y/2.0), 1)
+    lazy_ol = outline_array.TransformedOutline(ai_figure[i])
+    centered_ol = cnc_outline.outline_shift_xy(lazy_ol, -1*(ai_zero_x+ai_size_x/2.0), 1, -1*(ai_zero_y+ai_size_y/2.0), 1)
     flipped_ol = cnc_outline.outline_shift_xy(centered_ol, 0.0, ai_x_flip, 0.0, ai_y_flip)
     #flipped_ol = cnc_outline.outline_shift_xy(centered_ol, 0, ai_x_flip, 0, ai_y_flip) # what makes the most sense? re-shift or not?
     rotated_ol = cnc_outline.outline_rotate(flipped_ol, 0.0, 0.0, ai_rotation_angle)
     translated_ol = cnc_outline.outline_shift_xy(rotated_ol, ai_size_x/2.0+ai_translate_x, 1, ai_size_y/2.0+ai_translate_y, 1)
-    r_figure.append(translated_ol[:])
+    r_figure.append(translated_ol)
   return(r_figure)
 
 def rotate_and_translate_figure(ai_figure, ai_rotation_center_x, ai_rotation_center_y, ai_rotation_angle, ai_translate_x, ai_translate_y):
@@ -204,14 +258,15 @@ def rotate_and_translate_figure(ai_figure, ai_rotation_center_x, ai_rotation_cen
   r_figure = flip_rotate_and_translate_figure(ai_figure, ai_rotation_center_x, ai_rotation_center_y, 0.0, 0.0, 1, 1, ai_rotation_angle, ai_rotation_center_x+ai_translate_x, ai_rotation_center_y+ai_translate_y)
   return(r_figure)
 
-def cnc_cut_figure(ai_figure, ai_error_msg_id):
+def cnc_cut_figure(ai_figure, ai_error_msg_id, ai_arc_geometry=False):
   """ apply the cnc_cut_outline function to all outlines of the input figure
+      If ai_arc_geometry is True, the outlines carry the geometry of their arcs (cnc_outline.Arc_Geometry_Outline)
   """
   r_figure = []
   for i in range(len(ai_figure)):
     #print("dbg133:", ai_figure[i])
     if(cnc_outline.check_outline_format(ai_figure[i])==2):
-      r_figure.append(cnc_outline.cnc_cut_outline(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i)))
+      r_figure.append(cnc_outline.cnc_cut_outline(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i), ai_arc_geometry))
     else: # circle of format-B
       r_figure.append(ai_figure[i])
   return(r_figure)
@@ -228,9 +283,16 @@ def ideal_figure(ai_figure, ai_error_msg_id):
       r_figure.append(ai_figure[i])
   return(r_figure)
 
-def figures_to_freecad_assembly(ai_figure_assembly):
+def figures_to_freecad_assembly(ai_figure_assembly, ai_assembly_mode=None):
   """ Extrude figures and place them from a list of figures and 3D positioning instructions
+      ai_assembly_mode selects how the parts are combined (default: assembly_mode)
   """
+  mode = ai_assembly_mode
+  if(mode is None):
+    mode = assembly_mode
+  if(not mode in assembly_modes):
+    six.print_(("ERR236: Error, the assembly mode {:s} does not exist! Use only: {:s}".format(mode, ', '.join(assembly_modes))))
+    sys.exit(2)
   obj_nb = len(ai_figure_assembly)
   if(obj_nb<1):
     print("ERR235: the freecad assembly must contain at least one figure")
@@ -242,13 +304,21 @@ def figures_to_freecad_assembly(ai_figure_assembly):
       sys.exit(2)
     (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z) = ai_figure_assembly[i]
     part_figure_zero = rotate_and_translate_figure(part_figure, 0, 0, 0, -1*zero_x, -1*zero_y)
-    part_extruded = outline_backends.figure_to_freecad_25d_part(part_figure_zero, size_z)
+    part_extruded = brep_cache.cached_figure_to_freecad_25d_part(part_figure_zero, size_z) # the planks are cached in their own frame
     part_placed = positioning.place_plank(part_extruded, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z)
-    fc_obj.append(part_placed.copy())
-  #r_assembly = Part.makeCompound(fc_obj) # common face are not fused with makeCompound
-  r_assembly = fc_obj[0]
-  for i in range(obj_nb-1):
-    r_assembly = r_assembly.fuse(fc_obj[i+1])
+    fc_obj.append(part_placed) # part_placed is a new shape, no need to copy it
+  if(obj_nb==1):
+    r_assembly = fc_obj[0]
+  elif(mode=='compound'):
+    r_assembly = Part.makeCompound(fc_obj) # common face are not fused with makeCompound
+  elif((mode=='multifuse')and hasattr(fc_obj[0], 'multiFuse')):
+    r_assembly = fc_obj[0].multiFuse(fc_obj[1:])
+  else:
+    if(mode=='multifuse'):
+      print("WARN236: Warning, multiFuse is not supported by this FreeCAD version. The parts are fused pairwise.")
+    r_assembly = fc_obj[0]
+    for i in range(obj_nb-1):
+      r_assembly = r_assembly.fuse(fc_obj[i+1])
   return(r_assembly)
 
 ################################################################
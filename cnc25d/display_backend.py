@@ -33,9 +33,11 @@ display_backend.py creates and displays the two Tkinter Canvas windows used by o
 
 import math
 import sys, argparse
-from six.moves import tkinter
+import collections
+import numpy
+from .lazy_import import tkinter
 #import tkMessageBox
-import matplotlib.pyplot
+from .lazy_import import pyplot # matplotlib is imported at its first use
 from . import design_help # just for get_effective_args()
 import six
 
@@ -50,50 +52,33 @@ g_fast_angle_speed = 1.0
 g_step_angle_speed = float(g_fast_angle_speed)/8
 g_slow_angle_speed = float(g_fast_angle_speed)/16
 g_step_period = 100 # ms
+frame_cache_max_size = 256 # minimal number of frames kept by a Frame_Cache
+lod_pixel_tolerance = 1.0 # size in pixel of the level-of-detail filter. None to draw all the points
+curve_table_capacity = 100000 # number of values kept by a Curve_Table
 
 ################################################################
 # ******** sub-functions for Two_Canvas ***********
 ################################################################
 
-def find_outline_extremum(ai_outline_list):
-  """ find the four extremum (min_x, min_y, max_x, max_y) of a list of outlines
+def outline_points(ai_outline):
+  """ return the points of an outline of the outline list as a numpy array of shape (n, 2)
   """
-  # first point
-  first_point_x = 0
-  first_point_y = 0
-  first_outline_type = ai_outline_list[0][0]
-  first_outline = ai_outline_list[0][1]
-  if((first_outline_type=='graphic_lines')or(first_outline_type=='overlay_lines')):
-    first_point_x=first_outline[0][0]
-    first_point_y=first_outline[0][1]
-  elif((first_outline_type=='graphic_polygon')or(first_outline_type=='overlay_polygon')):
-    first_point_x=first_outline[0]
-    first_point_y=first_outline[1]
+  outline_type = ai_outline[0]
+  if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
+    r_points = numpy.array(ai_outline[1], dtype=float).reshape(-1, 2)
+  elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
+    r_points = numpy.array(ai_outline[1], dtype=float).reshape(-1, 2)
   else:
-    six.print_(("ERR305: Error, the outline type is unknow: {:s}".format(first_outline_type)))
+    six.print_(("ERR305: Error, the outline type is unknow: {:s}".format(outline_type)))
     sys.exit(2)
-  min_x=first_point_x
-  max_x=first_point_x
-  min_y=first_point_y
-  max_y=first_point_y
-  for outline in ai_outline_list:
-    outline_type = outline[0]
-    if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      for line in lines:
-        #print("dbg772: line:", line)
-        min_x = min(min_x, line[0], line[2])
-        max_x = max(max_x, line[0], line[2])
-        min_y = min(min_y, line[1], line[3])
-        max_y = max(max_y, line[1], line[3])
-    elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      for i in range(len(points)/2):
-        #print("dbg773: i:", i)
-        min_x = min(min_x, points[2*i])
-        max_x = max(max_x, points[2*i])
-        min_y = min(min_y, points[2*i+1])
-        max_y = max(max_y, points[2*i+1])
+  return(r_points)
+
+def find_outline_extremum(ai_outline_list):
+  """ find the four extremum (min_x, min_y, max_x, max_y) of a list of outlines
+  """
+  points = numpy.concatenate([outline_points(outline) for outline in ai_outline_list])
+  (min_x, min_y) = points.min(axis=0).tolist()
+  (max_x, max_y) = points.max(axis=0).tolist()
   r_extremum = (min_x, min_y, max_x, max_y)
   #print("dbg653: r_extremum:", r_extremum)
   return(r_extremum)
@@ -124,26 +109,17 @@ def scale_outline(ai_outline_list, ai_coef):
   """ apply the scale coefficient to a list of outlines
   """
   (lx, kx, ly, ky) = ai_coef
+  coef_l = numpy.array((lx, ly))
+  coef_k = numpy.array((kx, ky))
   r_outline_list = []
   for outline in ai_outline_list:
     outline_type = outline[0]
     if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      new_lines = []
-      for line in lines:
-        new_line = []
-        for i in range(len(line)/2):
-          new_line.append(line[2*i]*lx+kx)
-          new_line.append(line[2*i+1]*ly+ky)
-        new_lines.append(tuple(new_line))
-      r_outline_list.append((outline_type, tuple(new_lines),  outline[2],  outline[3]))
+      new_lines = (outline_points(outline)*coef_l+coef_k).reshape(-1, 4)
+      r_outline_list.append((outline_type, tuple(map(tuple, new_lines.tolist())),  outline[2],  outline[3]))
     elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      new_points = []
-      for i in range(len(points)/2):
-        new_points.append(points[2*i]*lx+kx)
-        new_points.append(points[2*i+1]*ly+ky)
-      r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
+      new_points = (outline_points(outline)*coef_l+coef_k).reshape(-1)
+      r_outline_list.append((outline_type, tuple(new_points.tolist()),  outline[2],  outline[3], outline[4]))
   return(r_outline_list)
 
 def compute_crop_limit(ai_selected_area, ai_canvas_size, ai_scale_coef):
@@ -165,46 +141,286 @@ def compute_crop_limit(ai_selected_area, ai_canvas_size, ai_scale_coef):
   r_crop_limit = (limit_x1, limit_y1, limit_x2, limit_y2)
   return(r_crop_limit)
 
+def clip_lines(ai_lines, ai_limit):
+  """ clip the lines (numpy array of shape (n, 4)) with the rectangle ai_limit (Liang-Barsky algorithm)
+      The lines outside the rectangle are removed. The end points inside the rectangle are kept unchanged.
+  """
+  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
+  (x1, y1, x2, y2) = (ai_lines[:,0], ai_lines[:,1], ai_lines[:,2], ai_lines[:,3])
+  dx = x2-x1
+  dy = y2-y1
+  t0 = numpy.zeros(len(ai_lines))
+  t1 = numpy.ones(len(ai_lines))
+  keep = numpy.ones(len(ai_lines), dtype=bool)
+  with numpy.errstate(divide='ignore', invalid='ignore'):
+    for (p, q) in ((-dx, x1-limit_x1), (dx, limit_x2-x1), (-dy, y1-limit_y1), (dy, limit_y2-y1)):
+      keep &= (p!=0)|(q>=0) # parallel to the border and outside
+      t = q/p
+      t0 = numpy.where(p<0, numpy.maximum(t0, t), t0)
+      t1 = numpy.where(p>0, numpy.minimum(t1, t), t1)
+  keep &= (t0<=t1)
+  (t0, t1) = (t0[keep], t1[keep])
+  (x1, y1, x2, y2, dx, dy) = (x1[keep], y1[keep], x2[keep], y2[keep], dx[keep], dy[keep])
+  r_lines = numpy.column_stack((
+    numpy.where(t0>0, x1+t0*dx, x1),
+    numpy.where(t0>0, y1+t0*dy, y1),
+    numpy.where(t1<1, x1+t1*dx, x2),
+    numpy.where(t1<1, y1+t1*dy, y2)))
+  return(r_lines)
+
+def clip_polygon(ai_points, ai_limit):
+  """ clip the polygon ai_points (numpy array of shape (n, 2)) with the rectangle ai_limit (Sutherland-Hodgman algorithm)
+  """
+  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
+  r_points = ai_points
+  for (axis, limit, sign) in ((0, limit_x1, 1), (0, limit_x2, -1), (1, limit_y1, 1), (1, limit_y2, -1)):
+    if(len(r_points)==0):
+      break
+    next_points = numpy.roll(r_points, -1, axis=0)
+    inside = sign*(r_points[:,axis]-limit)>=0
+    next_inside = sign*(next_points[:,axis]-limit)>=0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+      t = (limit-r_points[:,axis])/(next_points[:,axis]-r_points[:,axis])
+      intersection = r_points + t[:,numpy.newaxis]*(next_points-r_points)
+    intersection[:,axis] = limit
+    # each edge produces the intersection point if it crosses the border and its end point if it is inside
+    candidates = numpy.stack((intersection, next_points), axis=1)
+    selection = numpy.column_stack((inside!=next_inside, next_inside))
+    r_points = candidates[selection]
+  return(r_points)
+
 def crop_outline(ai_outline_list, ai_limit):
   """ crop a list of outlines to get a new list of outlines
   """
-  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
   r_outline_list = []
   for outline in ai_outline_list:
     outline_type = outline[0]
     if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      new_lines = []
-      for line in lines:
-        include_new_line = 1
-        for i in range(len(line)/2):
-          if((line[2*i]<limit_x1)
-              or (line[2*i]>limit_x2)
-              or (line[2*i+1]<limit_y1)
-              or (line[2*i+1]>limit_y2)):
-            include_new_line = 0
-        if(include_new_line==1):
-          new_lines.append(line)
+      new_lines = clip_lines(outline_points(outline).reshape(-1, 4), ai_limit)
       if(len(new_lines)>0):
-        r_outline_list.append((outline_type, tuple(new_lines),  outline[2],  outline[3]))
+        r_outline_list.append((outline_type, tuple(map(tuple, new_lines.tolist())),  outline[2],  outline[3]))
     elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      new_points = []
-      for i in range(len(points)/2):
-        if((points[2*i]>limit_x1)
-            and (points[2*i]<limit_x2)
-            and (points[2*i+1]>limit_y1)
-            and (points[2*i+1]<limit_y2)):
-          new_points.append(points[2*i])
-          new_points.append(points[2*i+1])
-        else:
-          if(len(new_points)>1):
-            r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
-            new_points = []
-      if(len(new_points)>1):
-        r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
+      new_points = clip_polygon(outline_points(outline), ai_limit)
+      if(len(new_points)>2):
+        r_outline_list.append((outline_type, tuple(new_points.reshape(-1).tolist()),  outline[2],  outline[3], outline[4]))
   return(r_outline_list)
 
+def lines_to_polylines(ai_lines):
+  """ join the lines (x1, y1, x2, y2) of an outline into polylines (flat list of coordinates)
+      A new polyline starts when a line doesn't start at the end of the previous line
+  """
+  r_polylines = []
+  polyline = []
+  for line in ai_lines:
+    if((len(polyline)>0)and(polyline[-2]==line[0])and(polyline[-1]==line[1])):
+      polyline.extend(line[2:])
+    else:
+      if(len(polyline)>0):
+        r_polylines.append(polyline)
+      polyline = list(line)
+  if(len(polyline)>0):
+    r_polylines.append(polyline)
+  return(r_polylines)
+
+def decimate_points(ai_points, ai_pixel_tolerance):
+  """ merge the consecutive points (numpy array of shape (n, 2)) that are in the same pixel cell
+      The first and the last points are always kept
+  """
+  cells = numpy.floor(ai_points/ai_pixel_tolerance)
+  keep = numpy.ones(len(ai_points), dtype=bool)
+  keep[1:] = numpy.any(cells[1:]!=cells[:-1], axis=1)
+  keep[-1] = True
+  r_points = ai_points[keep]
+  return(r_points)
+
+def decimate_outline(ai_outline_list, ai_pixel_tolerance):
+  """ level-of-detail filter of a list of scaled outlines
+      It returns the tuple (outline_list, input_point_nb, output_point_nb)
+  """
+  r_outline_list = []
+  input_point_nb = 0
+  output_point_nb = 0
+  for outline in ai_outline_list:
+    outline_type = outline[0]
+    if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
+      new_lines = []
+      for polyline in lines_to_polylines(outline[1]):
+        points = numpy.array(polyline, dtype=float).reshape(-1, 2)
+        new_points = decimate_points(points, ai_pixel_tolerance)
+        input_point_nb += len(points)
+        output_point_nb += len(new_points)
+        new_lines.extend(map(tuple, numpy.column_stack((new_points[:-1], new_points[1:])).tolist()))
+      r_outline_list.append((outline_type, tuple(new_lines),  outline[2],  outline[3]))
+    elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
+      points = outline_points(outline)
+      new_points = decimate_points(points, ai_pixel_tolerance)
+      input_point_nb += len(points)
+      output_point_nb += len(new_points)
+      r_outline_list.append((outline_type, tuple(new_points.reshape(-1).tolist()),  outline[2],  outline[3], outline[4]))
+  return((r_outline_list, input_point_nb, output_point_nb))
+
+def canvas_items(ai_canvas_graphics, ai_overlay):
+  """ convert the outline list of a canvas into the list of canvas items (item_type, coordinates, options)
+  """
+  r_items = []
+  for outline in ai_canvas_graphics:
+    outline_type = outline[0]
+    if((outline_type=='graphic_lines')or((outline_type=='overlay_lines')and(ai_overlay==1))):
+      for polyline in lines_to_polylines(outline[1]):
+        r_items.append(('line', polyline, (('fill', outline[2]), ('width', outline[3]))))
+    elif((outline_type=='graphic_polygon')or((outline_type=='overlay_polygon')and(ai_overlay==1))):
+      r_items.append(('polygon', outline[1], (('fill', outline[2]), ('outline', outline[3]), ('width', outline[4]))))
+  return(r_items)
+
+class Retained_Canvas():
+  """ keep the items of a Tkinter canvas from one frame to the next one
+      The items are moved with coords() and they are created or deleted only when the number of items changes
+  """
+
+  def __init__(self, ai_canvas):
+    self.canvas = ai_canvas
+    self.items = [] # list of (item_id, item_type, options)
+    self.temporary_items = [] # items redrawn at each frame like the mouse selection
+    self.lod_statistics = (0, 0) # number of points of the last frame before and after the level-of-detail filter
+
+  def draw(self, ai_items):
+    """ update the canvas items with the list of (item_type, coordinates, options)
+    """
+    for (i, (item_type, coordinates, options)) in enumerate(ai_items):
+      if(i<len(self.items)):
+        (item_id, old_type, old_options) = self.items[i]
+        if(old_type==item_type):
+          self.canvas.coords(item_id, *coordinates)
+          if(old_options!=options):
+            self.canvas.itemconfigure(item_id, **dict(options))
+            self.items[i] = (item_id, item_type, options)
+          continue
+        self.canvas.delete(item_id)
+      if(item_type=='line'):
+        item_id = self.canvas.create_line(*coordinates, **dict(options))
+      else:
+        item_id = self.canvas.create_polygon(*coordinates, **dict(options))
+      if(i<len(self.items)):
+        self.items[i] = (item_id, item_type, options)
+      else:
+        self.items.append((item_id, item_type, options))
+    for (item_id, item_type, options) in self.items[len(ai_items):]:
+      self.canvas.delete(item_id)
+    del self.items[len(ai_items):]
+
+  def clear_temporary(self):
+    """ delete the temporary items of the previous frame
+    """
+    for item_id in self.temporary_items:
+      self.canvas.delete(item_id)
+    self.temporary_items = []
+
+  def add_temporary(self, ai_item_id):
+    """ register an item that is deleted at the next frame
+    """
+    self.temporary_items.append(ai_item_id)
+
+class Frame_Cache():
+  """ LRU cache of the canvas-graphics of a periodic simulation
+      Two angle positions that differ of a multiple of ai_period produce the same canvas-graphics.
+      The angle positions are quantized with ai_quantum, the smallest step of the Two_Canvas buttons.
+      By default, the cache is large enough to keep all the phases of both rotation directions,
+      otherwise the LRU eviction removes each frame just before it comes back in a continuous run.
+  """
+
+  def __init__(self, ai_period, ai_quantum=None, ai_max_size=None):
+    self.period = ai_period # None if the simulation is not periodic
+    self.quantum = ai_quantum if (ai_quantum is not None) else g_slow_angle_speed
+    self.period_step_nb = 1
+    if(self.period is not None):
+      self.period_step_nb = max(1, int(round(self.period/self.quantum)))
+    self.max_size = ai_max_size if (ai_max_size is not None) else max(frame_cache_max_size, 2*self.period_step_nb)
+    self.frames = collections.OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def phase_key(self, ai_rotation_direction, ai_angle_position):
+    """ return the cache key of an angle position or None if it can not be cached
+    """
+    r_key = None
+    if(self.period is not None):
+      step = ai_angle_position/self.quantum
+      step_nb = int(round(step))
+      if(abs(step-step_nb)<1e-6): # only the positions reachable with the buttons are cached
+        r_key = (ai_rotation_direction, step_nb % self.period_step_nb)
+    return(r_key)
+
+  def get(self, ai_compute, ai_rotation_direction, ai_angle_position):
+    """ return the canvas-graphics computed by ai_compute() or its cached value
+    """
+    key = self.phase_key(ai_rotation_direction, ai_angle_position)
+    if(key is None):
+      return(ai_compute())
+    r_graphics = self.frames.get(key)
+    if(r_graphics is None):
+      self.misses += 1
+      r_graphics = ai_compute()
+      self.frames[key] = r_graphics
+      while(len(self.frames)>self.max_size):
+        self.frames.popitem(last=False)
+    else:
+      self.hits += 1
+      self.frames.move_to_end(key)
+    return(r_graphics)
+
+  def info(self):
+    """ return a dictionary with the counters of the cache
+    """
+    r_info = {'hits':self.hits, 'misses':self.misses, 'size':len(self.frames), 'max_size':self.max_size}
+    return(r_info)
+
+class Curve_Table():
+  """ preallocated ring buffer of the values of a matplotlib curve of Two_Canvas
+      When the capacity is reached, the oldest values are overwritten, so the memory stays constant
+  """
+
+  def __init__(self, ai_capacity=None):
+    self.capacity = ai_capacity if (ai_capacity is not None) else curve_table_capacity
+    self.values = numpy.zeros(self.capacity)
+    self.append_nb = 0 # number of values appended since the creation
+
+  def __len__(self):
+    return(min(self.append_nb, self.capacity))
+
+  def dropped_nb(self):
+    """ return the number of the overwritten values
+    """
+    return(self.append_nb-len(self))
+
+  def index(self, ai_index):
+    """ return the position in the buffer of the value ai_index (0 is the oldest kept value)
+    """
+    if(ai_index<0):
+      ai_index += len(self)
+    if((ai_index<0)or(ai_index>=len(self))):
+      raise IndexError("Curve_Table index out of range")
+    return((self.dropped_nb()+ai_index)%self.capacity)
+
+  def __getitem__(self, ai_index):
+    return(self.values[self.index(ai_index)])
+
+  def __setitem__(self, ai_index, ai_value):
+    self.values[self.index(ai_index)] = ai_value
+
+  def append(self, ai_value):
+    self.values[self.append_nb%self.capacity] = ai_value
+    self.append_nb += 1
+
+  def to_array(self):
+    """ return the kept values in chronological order as a numpy array
+    """
+    start = self.append_nb%self.capacity
+    if(self.append_nb<=self.capacity):
+      r_array = self.values[:self.append_nb]
+    else:
+      r_array = numpy.concatenate((self.values[start:], self.values[:start]))
+    return(r_array)
+
 ################################################################
 # ******** Two_Canvas class ***********
 ################################################################
@@ -381,23 +597,14 @@ class Two_Canvas():
   
   def draw_canvas(self, ai_canvas, ai_canvas_graphics, ai_overlay):
     """ Draw the computed outline list into a canvas
+        ai_canvas is a Retained_Canvas: the items of the previous frame are reused
+        The points that fall in the same pixel are merged before drawing
     """
-    for outline in ai_canvas_graphics:
-      outline_type = outline[0]
-      if(outline_type=='graphic_lines'):
-        lines = outline[1]
-        for line in lines:
-          ai_canvas.create_line(line, fill=outline[2], width=outline[3])
-      elif(outline_type=='overlay_lines'):
-        if(ai_overlay==1):
-          lines = outline[1]
-          for line in lines:
-            ai_canvas.create_line(line, fill=outline[2], width=outline[3])
-      elif(outline_type=='graphic_polygon'):
-        ai_canvas.create_polygon(outline[1], fill=outline[2], outline=outline[3], width=outline[4])
-      elif(outline_type=='overlay_polygon'):
-        if(ai_overlay==1):
-          ai_canvas.create_polygon(outline[1], fill=outline[2], outline=outline[3], width=outline[4])
+    canvas_graphics = ai_canvas_graphics
+    if(lod_pixel_tolerance is not None):
+      (canvas_graphics, input_point_nb, output_point_nb) = decimate_outline(ai_canvas_graphics, lod_pixel_tolerance)
+      ai_canvas.lod_statistics = (input_point_nb, output_point_nb)
+    ai_canvas.draw(canvas_items(canvas_graphics, ai_overlay))
 
   def apply_canvas_graphic_function(self):
     """ compute and draw the outline list for the main and the zoom window
@@ -415,20 +622,20 @@ class Two_Canvas():
     if(self.canvas_graphic_function!=None):
       all_graphics = self.canvas_graphic_function(self.rotation_direction, self.angle_position)
       #
-      self.canvas_a.delete(tkinter.ALL)
+      self.retained_a.clear_temporary()
       # uncomment if you want to scale outline depending on the angle_position
       #self.outline_extremum = find_outline_extremum(all_graphics)
       canvas_a_size = (canvas_a_width, canvas_a_height, tkinter_canvas_margin_x, tkinter_canvas_margin_y)
       self.scale_coef_a = compute_scale_coef(self.outline_extremum, canvas_a_size)
       canvas_a_graphics = scale_outline(all_graphics, self.scale_coef_a)
-      self.draw_canvas(self.canvas_a, canvas_a_graphics, self.overlay)
+      self.draw_canvas(self.retained_a, canvas_a_graphics, self.overlay)
       if(self.canvas_a_mouse_press==1):
-        self.canvas_a.create_rectangle(self.mouse_x1, self.mouse_y1, self.mouse_x2, self.mouse_y2, fill='', outline='red', width=2)
+        self.retained_a.add_temporary(self.canvas_a.create_rectangle(self.mouse_x1, self.mouse_y1, self.mouse_x2, self.mouse_y2, fill='', outline='red', width=2))
       #
       if(self.crop_limit==(0,0,0,0)):
         self.crop_limit=(self.outline_extremum[0], self.outline_extremum[1], (self.outline_extremum[0]+self.outline_extremum[2])/2, (self.outline_extremum[1]+self.outline_extremum[3])/2)
       #
-      self.canvas_b.delete(tkinter.ALL)
+      self.retained_b.clear_temporary()
       crop_graphics = crop_outline(all_graphics, self.crop_limit)
       #print("dbg857: len(crop_graphics):", len(crop_graphics))
       canvas_b_size = (canvas_b_width, canvas_b_height, 2, 2)
@@ -438,10 +645,10 @@ class Two_Canvas():
       #print("dbg854: scale_coef_b:", scale_coef_b)
       canvas_b_graphics = scale_outline(crop_graphics, self.scale_coef_b)
       #print("dbg986: canvas_b_graphics:", canvas_b_graphics)
-      self.draw_canvas(self.canvas_b, canvas_b_graphics, self.overlay)
+      self.draw_canvas(self.retained_b, canvas_b_graphics, self.overlay)
       #self.canvas_b.create_line((5,5,canvas_b_width-5,canvas_b_height-5), fill='yellow', width=3)
       if(self.canvas_b_mouse_press==1):
-        self.canvas_b.create_line(self.mouse_bx1, self.mouse_by1, self.mouse_bx2, self.mouse_by2, fill='red', width=2)
+        self.retained_b.add_temporary(self.canvas_b.create_line(self.mouse_bx1, self.mouse_by1, self.mouse_bx2, self.mouse_by2, fill='red', width=2))
 
   def action_button_overlay(self):
     """ Toggle the overlay visibility
@@ -471,6 +678,7 @@ class Two_Canvas():
     #self.frame_b.pack(fill=Tkinter.BOTH, expand=1)
     self.frame_b.title("cnc25d display backend details")
     self.canvas_b = tkinter.Canvas(self.frame_b, width=initial_tkinter_canvas_width, height=initial_tkinter_canvas_height)
+    self.retained_b = Retained_Canvas(self.canvas_b)
     #self.canvas_b.grid(column=0, row=0, sticky=Tkinter.N+Tkinter.E+Tkinter.S+Tkinter.W)
     #self.canvas_b.columnconfigure(0, weight=1)
     #self.canvas_b.rowconfigure(0, weight=1)
@@ -554,40 +762,42 @@ class Two_Canvas():
       print("WARN451: Warning, self.curve_graphic_table is not set!")
     else:
       # create curve_points
-      curve_nb = len(self.curve_graphic_table)-1
       curve_points = []
-      for i in range(curve_nb+1):
-        curve_points.append([])
-      curve_table_len = len( self.curve_graphic_table[1][1])
+      for j in range(curve_nb):
+        table = self.curve_graphic_table[j+1][1]
+        if(isinstance(table, Curve_Table)):
+          curve_points.append(table.to_array())
+        else:
+          curve_points.append(numpy.asarray(table, dtype=float))
+      curve_table_len = len(curve_points[0])
       for j in range(curve_nb-1):
-        check_len = len( self.curve_graphic_table[j+2][1])
+        check_len = len(curve_points[j+1])
         if(check_len!=curve_table_len):
           six.print_(("ERR586: Error in the curve_table {:d}! Its lenght {:d} does not match the reference length {:d}".format(j, check_len, curve_table_len)))
+      # the abscissa starts after the values dropped by the ring buffers
+      first_table = self.curve_graphic_table[1][1]
+      first_x = first_table.dropped_nb() if isinstance(first_table, Curve_Table) else 0
       x_increment = self.curve_graphic_table[0][2]
-      abscissa_x = 0
-      for i in range(curve_table_len):
-        curve_points[0].append(abscissa_x)
-        abscissa_x += x_increment
-        for j in range(curve_nb):
-          table = self.curve_graphic_table[j+1][1]
-          ly = table[i]
-          curve_points[j+1].append(ly)
-      #matplotlib.pyplot.plot([1,2,3,4,5],[5,3,2,1,4])
-      matplotlib.pyplot.figure(1)
+      curve_points.insert(0, (first_x+numpy.arange(curve_table_len))*x_increment)
+      #pyplot.plot([1,2,3,4,5],[5,3,2,1,4])
+      pyplot.figure(1)
       for i in range(curve_nb):
-        matplotlib.pyplot.subplot(curve_nb,1,i+1)
-        #matplotlib.pyplot.plot(self.curve_points[0], self.curve_points[i+1], self.curve_graphic_table[i+1][2])
-        matplotlib.pyplot.plot(curve_points[0], curve_points[i+1], self.curve_graphic_table[i+1][2])
-        matplotlib.pyplot.ylabel(self.curve_graphic_table[i+1][0])
+        pyplot.subplot(curve_nb,1,i+1)
+        #pyplot.plot(self.curve_points[0], self.curve_points[i+1], self.curve_graphic_table[i+1][2])
+        pyplot.plot(curve_points[0], curve_points[i+1], self.curve_graphic_table[i+1][2])
+        pyplot.ylabel(self.curve_graphic_table[i+1][0])
         if(i==0):
-          matplotlib.pyplot.title(self.curve_graphic_table[0][0])
+          pyplot.title(self.curve_graphic_table[0][0])
         if(i==curve_nb-1):
-          matplotlib.pyplot.xlabel(self.curve_graphic_table[0][1])
-      matplotlib.pyplot.show()
+          pyplot.xlabel(self.curve_graphic_table[0][1])
+      pyplot.show()
 
   def quit_Two_Canvas(self):
     """ Destroy the Two_Canvas Tkinter application
     """
+    for (canvas_name, retained) in (('main', self.retained_a), ('zoom', self.retained_b)):
+      (input_point_nb, output_point_nb) = retained.lod_statistics
+      six.print_(("Info: level-of-detail of the {:s} canvas: {:d} points drawn of {:d} ({:d} removed)".format(canvas_name, output_point_nb, input_point_nb, input_point_nb-output_point_nb)))
     self.frame_b.destroy()
     self.frame_c.destroy()
     self.frame_a.destroy()
@@ -606,6 +816,7 @@ class Two_Canvas():
     #
     #self.canvas_a =  Tkinter.Canvas(self.frame_a, width=self.canvas_a_width, height=self.canvas_a_height)
     self.canvas_a =  tkinter.Canvas(self.frame_a, width=initial_tkinter_canvas_width, height=initial_tkinter_canvas_height)
+    self.retained_a = Retained_Canvas(self.canvas_a)
     #self.canvas_a.pack(fill=Tkinter.BOTH, expand=1)
     self.canvas_a.grid(column=0, row=0, sticky=tkinter.N+tkinter.E+tkinter.S+tkinter.W)
     self.canvas_a.columnconfigure(0, weight=1)
@@ -920,6 +1131,25 @@ Tenait en son bec un fromage.
   r_test = 1
   return(r_test)
 
+def frame_cache_test3():
+  """ check the hit rate of Frame_Cache for a continuous simulation at the slow speed in both directions
+  """
+  r_test = 1
+  period = 20
+  dut = Frame_Cache(period)
+  for rotation_direction in (1, -1):
+    angle_position = 0
+    for i in range(2000):
+      dut.get(lambda: test_canvas_graphic_2(rotation_direction, angle_position), rotation_direction, angle_position)
+      angle_position += rotation_direction*g_slow_angle_speed
+  info = dut.info()
+  phase_nb = 2*int(round(period/g_slow_angle_speed))
+  six.print_(("frame cache: hits {:d}  misses {:d}  size {:d}  max_size {:d}".format(info['hits'], info['misses'], info['size'], info['max_size'])))
+  if(info['misses']!=phase_nb):
+    six.print_(("ERR331: Error, the frame cache computes {:d} frames instead of {:d}".format(info['misses'], phase_nb)))
+    r_test = 0
+  return(r_test)
+
 ################################################################
 # ******** command line interface ***********
 ################################################################
@@ -932,6 +1162,8 @@ def display_backends_cli(ai_args=""):
     help='Run two_canvas_class_test1() with a static graphic')
   db_parser.add_argument('--test2','--t2', action='store_true', default=False, dest='sw_test2',
     help='Run two_canvas_class_test2() with a dynamic graphic')
+  db_parser.add_argument('--test3','--t3', action='store_true', default=False, dest='sw_test3',
+    help='Run frame_cache_test3() that checks the hit rate of Frame_Cache without display')
   effective_args = design_help.get_effective_args(ai_args)
   db_args = db_parser.parse_args(effective_args)
   r_dbc = 0
@@ -940,6 +1172,8 @@ def display_backends_cli(ai_args=""):
     r_dbc = two_canvas_class_test1()
   elif(db_args.sw_test2):
     r_dbc = two_canvas_class_test2()
+  elif(db_args.sw_test3):
+    r_dbc = frame_cache_test3()
   print("dbg999: end of script")
   return(r_dbc)
 
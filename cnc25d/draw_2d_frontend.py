@@ -51,6 +51,7 @@ import copy
 ## cnc25d
 from . import small_geometry
 from . import cnc_outline
+from . import outline_array
 import six
 #import outline_backends
 #import export_2d
@@ -177,8 +178,9 @@ class Arc_Line_Outline:
   def add_piece(self, ai_piece):
     """ Add a list of list to the outline
         This might be convenient if you work with sub-outline than you inversed, etc
+        ai_piece can also be an OutlineArray
     """
-    self.ol.extend(ai_piece)
+    self.ol.extend(outline_array.outline_to_list(ai_piece))
     
   def close_with_Line(self):
     """
@@ -431,6 +433,7 @@ y_length: {:0.3f}
     """ convert the old-list-format to the Arc_Line_Outline object
         this function should be only used during the transistion to the new format (Arc_Line_Outline object)
     """
+    ai_outline = outline_array.outline_to_list(ai_outline)
     if(len(ai_outline)<3):
       six.print_(("ERR378: Error, outline {:s}, convert_from_old_format failed because import list {:d} is too short".format(self.outline_id, len(ai_outline))))
       sys.exit(2)
@@ -796,7 +799,7 @@ y_length: {:0.3f}
       six.print_(("ERR701: Error, figure {:s}, convert_from_old_format failed because import list {:d} is 0".format(self.figure_id, len(ai_figure))))
       sys.exit(2)
     for i in range(len(ai_figure)):
-      old_ol = ai_figure[i]
+      old_ol = outline_array.outline_to_list(ai_figure[i])
       if(isinstance(old_ol[0], (tuple, list))): # outline is arc-line
         ol = Arc_Line_Outline("undef_ol_arc_line_{:d}".format(i))
         ol.convert_from_old_format(old_ol)
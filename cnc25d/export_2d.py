@@ -28,8 +28,6 @@ export_2d.py provides functions to create DXF file from a FreeCAD Part Oject
 # header for Python / FreeCAD compatibility
 ################################################################
 
-from . import importing_freecad
-importing_freecad.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -38,10 +36,10 @@ importing_freecad.importing_freecad()
 # import
 ################################################################
 
-import Part
-from FreeCAD import Base
-import importDXF
-import Drawing
+from .lazy_import import Part
+from .lazy_import import Base
+from .lazy_import import importDXF
+from .lazy_import import Drawing
 #import FreeCADGui
 
 ################################################################
@@ -0,0 +1,203 @@
+# figure_pool.py
+# apply cnc_cut_outline() and ideal_outline() to the outlines of a figure with a pool of processes
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+figure_pool.py provides cnc_cut_figure_pool() and ideal_figure_pool(), the parallel variants of design_output.cnc_cut_figure() and design_output.ideal_figure().
+The outlines of a figure are independent, so they are distributed over a pool of worker processes.
+The outlines are sent to the workers and returned as OutlineArray to reduce the amount of pickled data.
+The returned figure keeps the order of the input figure and is identical to the serial version.
+Small figures are processed serially because starting the workers costs more than the computation.
+"""
+
+################################################################
+# import
+################################################################
+
+import sys, argparse
+import multiprocessing
+import six
+#
+from . import design_help # just for get_effective_args()
+from . import cnc_outline
+from . import outline_array
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+# number of worker processes. None: the number of CPUs
+pool_worker_nb = None
+# figures with less segments than pool_serial_threshold are processed serially
+pool_serial_threshold = 2000
+
+################################################################
+# worker
+################################################################
+
+def figure_pool_outline(ai_function_name, ai_outline, ai_error_msg_id, ai_arc_geometry):
+  """ compute one outline with cnc_cut_outline() or ideal_outline()
+  """
+  if(ai_function_name=='cnc_cut_outline'):
+    r_outline = cnc_outline.cnc_cut_outline(ai_outline, ai_error_msg_id, ai_arc_geometry)
+  else:
+    r_outline = cnc_outline.ideal_outline(ai_outline, ai_error_msg_id)
+  return(r_outline)
+
+def figure_pool_worker(ai_job):
+  """ compute one outline in a worker process
+      ai_job is the tuple (function_name, outline, error_msg_id, arc_geometry) with the outline as OutlineArray
+      It returns the tuple (exit_code, outline). The exit_code is set if the computation has called sys.exit()
+  """
+  (function_name, outline, error_msg_id, arc_geometry) = ai_job
+  try:
+    r_outline = figure_pool_outline(function_name, outline.to_list(), error_msg_id, arc_geometry)
+  except SystemExit as e: # a SystemExit would kill the worker and block the pool
+    sys.stdout.flush()
+    return((e.code, None))
+  sys.stdout.flush()
+  if(not isinstance(r_outline, cnc_outline.Arc_Geometry_Outline)):
+    r_outline = outline_array.outline_to_array(r_outline)
+  return((None, r_outline))
+
+################################################################
+# API function
+################################################################
+
+def figure_segment_nb(ai_figure):
+  """ return the number of segments of a figure
+  """
+  r_nb = 0
+  for ol in ai_figure:
+    if(cnc_outline.check_outline_format(ol)!=0):
+      r_nb += len(ol)
+  return(r_nb)
+
+def process_figure_pool(ai_function_name, ai_figure, ai_error_msg_id, ai_arc_geometry, ai_worker_nb, ai_serial_threshold):
+  """ apply cnc_cut_outline() or ideal_outline() to the format-A outlines of ai_figure
+  """
+  worker_nb = ai_worker_nb
+  if(worker_nb is None):
+    worker_nb = pool_worker_nb
+  if(worker_nb is None):
+    worker_nb = multiprocessing.cpu_count()
+  serial_threshold = ai_serial_threshold
+  if(serial_threshold is None):
+    serial_threshold = pool_serial_threshold
+  # list of the outlines to compute
+  job_idx = []
+  for i in range(len(ai_figure)):
+    if(cnc_outline.check_outline_format(ai_figure[i])==2):
+      job_idx.append(i)
+  # compute the outlines
+  r_figure = list(ai_figure) # the circles of format-B are kept
+  if((worker_nb<2)or(len(job_idx)<2)or(figure_segment_nb(ai_figure)<serial_threshold)or(design_help.interpretor_is_freecad())):
+    for i in job_idx:
+      r_figure[i] = figure_pool_outline(ai_function_name, ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i), ai_arc_geometry)
+    return(r_figure)
+  jobs = [(ai_function_name, outline_array.outline_to_array(ai_figure[i]), "{:s}.ol{:d}".format(ai_error_msg_id, i), ai_arc_geometry) for i in job_idx]
+  sys.stdout.flush()
+  pool = multiprocessing.Pool(min(worker_nb, len(jobs)))
+  try:
+    results = pool.map(figure_pool_worker, jobs, chunksize=max(1, len(jobs)//(4*worker_nb))) # map() keeps the order
+  finally:
+    pool.close()
+    pool.join()
+  for (i, (exit_code, outline)) in zip(job_idx, results):
+    if(exit_code is not None):
+      six.print_(("ERR651: Error in {:s}.ol{:d}, the computation of the outline has stopped".format(ai_error_msg_id, i)))
+      sys.exit(exit_code)
+    r_figure[i] = outline_array.outline_to_list(outline)
+  return(r_figure)
+
+def cnc_cut_figure_pool(ai_figure, ai_error_msg_id, ai_arc_geometry=False, ai_worker_nb=None, ai_serial_threshold=None):
+  """ parallel version of design_output.cnc_cut_figure()
+      ai_worker_nb: number of worker processes (default: pool_worker_nb)
+      ai_serial_threshold: the figures with less segments are processed serially (default: pool_serial_threshold)
+  """
+  r_figure = process_figure_pool('cnc_cut_outline', ai_figure, ai_error_msg_id, ai_arc_geometry, ai_worker_nb, ai_serial_threshold)
+  return(r_figure)
+
+def ideal_figure_pool(ai_figure, ai_error_msg_id, ai_worker_nb=None, ai_serial_threshold=None):
+  """ parallel version of design_output.ideal_figure()
+  """
+  r_figure = process_figure_pool('ideal_outline', ai_figure, ai_error_msg_id, False, ai_worker_nb, ai_serial_threshold)
+  return(r_figure)
+
+################################################################
+# figure_pool testing
+################################################################
+
+def figure_pool_test1():
+  """ compare cnc_cut_figure_pool() and ideal_figure_pool() with the serial functions
+  """
+  from . import cnc_outline_batch # for the test figure
+  r_test = 1
+  fig = []
+  for i in range(8):
+    for ol in cnc_outline_batch.test_figure(2.0):
+      fig.append(cnc_outline.outline_shift_xy(ol, 1000*i, 1, 0, 1))
+  for (fct_name, fct_pool, fct_serial) in (
+    ('cnc_cut', cnc_cut_figure_pool, cnc_outline.cnc_cut_outline),
+    ('ideal', ideal_figure_pool, cnc_outline.ideal_outline)):
+    t0 = time.time()
+    serial_figure = []
+    for i in range(len(fig)):
+      if(cnc_outline.check_outline_format(fig[i])==2):
+        serial_figure.append(fct_serial(fig[i], "test1.ol{:d}".format(i)))
+      else:
+        serial_figure.append(fig[i])
+    t1 = time.time()
+    pool_figure = fct_pool(fig, "test1", ai_worker_nb=max(2, multiprocessing.cpu_count()), ai_serial_threshold=0)
+    t2 = time.time()
+    diff = cnc_outline_batch.figure_difference(serial_figure, pool_figure)
+    six.print_(("{:s}: {:d} outlines {:d} segments  difference {:0.3e}  serial {:0.4f} s  pool {:0.4f} s".format(fct_name, len(fig), figure_segment_nb(fig), diff, t1-t0, t2-t1)))
+    if(diff!=0):
+      six.print_(("ERR652: Error, the {:s} pool figure differs from the serial figure".format(fct_name)))
+      r_test = 0
+  return(r_test)
+
+################################################################
+# figure_pool command line interface
+################################################################
+
+def figure_pool_cli(ai_args=""):
+  """ command line interface of figure_pool.py when it is used in standalone
+  """
+  fp_parser = argparse.ArgumentParser(description='Test the parallel cnc_cut_figure_pool() and ideal_figure_pool().')
+  fp_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It compares the parallel and the serial computation of a figure.')
+  effective_args = design_help.get_effective_args(ai_args)
+  fp_args = fp_parser.parse_args(effective_args)
+  r_fp = 1
+  if(fp_args.sw_test1):
+    r_fp = figure_pool_test1()
+  return(r_fp)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  figure_pool_cli("--test1")
+
@@ -32,7 +32,6 @@ The function gear_profile() returns an format B outline that can be easily inclu
 
 from . import cnc25d_api
 import six
-cnc25d_api.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -47,10 +46,11 @@ import sys, argparse
 #from datetime import datetime
 #import os, errno
 #import re
-from six.moves import tkinter # to display the outline in a small GUI
+from .lazy_import import tkinter # to display the outline in a small GUI
 import time # for time.sleep to help Tkinter to finish properly
+import numpy # for the headless simulation
 # FreeCAD
-import Part
+from .lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -192,6 +192,12 @@ def gear_profile_constraint_constructor(ai_parser, ai_variant=0):
   ## simulation
   #r_parser.add_argument('--simulation_enable','--se', action='store_true', default=False,
   #  help='It display a Tk window where you can observe the gear running. Check with your eyes if the geometry is working.')
+  # headless simulation (gear_profile_simulation_B)
+  if((ai_variant!=1)and(ai_variant!=2)and(ai_variant!=3)and(ai_variant!=4)):
+    r_parser.add_argument('--simulation_tooth_cycle_nb','--stcn', action='store', type=float, default=1.0,
+      help="Set the number of tooth pitches the first gear moves during the headless simulation. Default: 1.0")
+    r_parser.add_argument('--simulation_revolution_nb','--srn', action='store', type=float, default=0.0,
+      help="If not zero, the first gear moves of this number of revolutions during the headless simulation instead of simulation_tooth_cycle_nb. Default: 0.0")
   # output file : added later
   #r_parser.add_argument('--output_file_basename','--ofb', action='store', default='',
   #  help="If not  the empty_string (the default value), it outputs the (first) gear in file(s) depending on your argument file_extension: .dxf uses mozman dxfwrite, .svg uses mozman svgwrite, no-extension uses FreeCAD and you get .brep and .dxf")
@@ -914,18 +920,54 @@ def gear_profile_info(c):
 # gear_profile simulation
 ################################################################
 
-def gear_profile_simulation_A(c):
-  """ define the gear_profile simulation
-      It's called simulation_A because we can imagine an other kind of simulation
+def g1_simulation_position(c, ai_angle_position, ai_step_nb=20):
+  """ return the position of the first gear after ai_angle_position simulation steps
+      ai_step_nb is the number of steps per tooth pitch
+  """
+  if((c['gear_type']=='e')or(c['gear_type']=='i')):
+    r_position = c['gear_initial_angle']+ai_angle_position*float(c['g1_pi_module_angle'])/ai_step_nb # fraction of pi_module_angle (angular tooth pitch)
+  elif(c['gear_type']=='l'):
+    r_position = c['gear_initial_angle']-ai_angle_position*float(c['g1_pi_module'])/ai_step_nb # fraction of pi_module (linear tooth pitch)
+  return(r_position)
+
+def gear_profile_simulation_arrays(c, ai_rotation_direction=1, ai_tooth_cycle_nb=1, ai_revolution_nb=0, ai_step_nb=20):
+  """ compute the kinematic of the gear system without creating any outline or window
+      The first gear moves of ai_tooth_cycle_nb tooth pitches or of ai_revolution_nb revolutions if it is set.
+      ai_step_nb is the number of positions per tooth pitch.
+      It returns the numpy arrays (g1_position, g2_position, g2_rotation_speed, tangential_friction)
+  """
+  if(not c['g2_exist']):
+    print("ERR931: Error, the simulation requires a second gear. Set second_gear_tooth_nb")
+    sys.exit(2)
+  if((ai_rotation_direction!=1)and(ai_rotation_direction!=-1)):
+    six.print_(("ERR932: Error, the rotation direction {:d} must be 1 or -1".format(ai_rotation_direction)))
+    sys.exit(2)
+  if(ai_step_nb<1):
+    six.print_(("ERR933: Error, the step number {:d} must be positive".format(ai_step_nb)))
+    sys.exit(2)
+  tooth_cycle_nb = ai_tooth_cycle_nb
+  if(ai_revolution_nb>0):
+    tooth_cycle_nb = ai_revolution_nb*c['gear_tooth_nb']
+  (place_low_parameters, place_info) = pre_g2_position_calculation(c['g1_param'], c['g2_param'], c['second_gear_additional_axis_length'], c['second_gear_position_angle'], g1_rotation_speed, speed_scale)
+  position_nb = int(round(tooth_cycle_nb*ai_step_nb))+1 # the last position is the first position of the next tooth
+  r_g1_position = g1_simulation_position(c, numpy.arange(position_nb, dtype=float), ai_step_nb)
+  r_g2_position = numpy.empty(position_nb)
+  r_g2_rotation_speed = numpy.empty(position_nb)
+  r_tangential_friction = numpy.empty(position_nb)
+  for i in range(position_nb):
+    (r_g2_position[i], r_g2_rotation_speed[i], r_tangential_friction[i], c1_speed_outline, c2_speed_outline) = g2_position_calculation(place_low_parameters, ai_rotation_direction, float(r_g1_position[i]))
+  return((r_g1_position, r_g2_position, r_g2_rotation_speed, r_tangential_friction))
+
+def gear_profile_simulation_graphics(c):
+  """ create the canvas-graphic function of the gear_profile simulation
+      It returns the tuple (canvas_graphic_function, info_txt, matplotlib_curves) used by Two_Canvas or by offscreen_backend
   """
-  #print("dbg901: gear_profile_simulation_A")
   g1g2_info_txt = gear_profile_simulation_info(c)
   (g1_make_low_param, g1_info_low) = calc_low_level_gear_parameters(c['g1_param'])
   if(c['g2_exist']):
     (g2_make_low_param, g2_info_low) = calc_low_level_gear_parameters(c['g2_param'])
     (place_low_parameters, place_info) = pre_g2_position_calculation(c['g1_param'], c['g2_param'], c['second_gear_additional_axis_length'], c['second_gear_position_angle'], g1_rotation_speed, speed_scale)
   ### simulation
-  print("Launch the simulation with Tkinter ..")
   # initialization
   #g1_ideal_involute = ideal_tooth_outline(g1_make_low_param, 0, 0)
   #g1_ideal_tooth = ideal_tooth_outline(g1_make_low_param, 0, 1)
@@ -933,39 +975,46 @@ def gear_profile_simulation_A(c):
   #  g2_outline_B = gear_profile_outline(g2_make_low_param, 0)
   #  g2_ideal_involute = ideal_tooth_outline(g2_make_low_param, 0, 0)
   #  g2_ideal_tooth = ideal_tooth_outline(g2_make_low_param, 0, 1)
-  ### gear_profile parameter info in the log
-  print(g1g2_info_txt)
   ### static figure
   inter_axis_outline = ((c['center_position_x'], c['center_position_y']), (c['g2_ix'], c['g2_iy']))
   ### matplotlib curve table
-  g1_position_curve_table = []
-  g2_position_curve_table = []
-  g2_rotation_speed_curve_table = []
-  tangential_friction_curve_table = []
-  ### start Tkinter
-  tk_root = tkinter.Tk()
-  my_canvas = cnc25d_api.Two_Canvas(tk_root)
+  g1_position_curve_table = cnc25d_api.Curve_Table()
+  g2_position_curve_table = cnc25d_api.Curve_Table()
+  g2_rotation_speed_curve_table = cnc25d_api.Curve_Table()
+  tangential_friction_curve_table = cnc25d_api.Curve_Table()
+  ### frame cache
+  # the gear outlines repeat when g1 moves of one tooth pitch (20 steps of fast speed)
+  frame_period = None
+  if(c['g2_exist']):
+    if((c['gear_type']!='l')and(c['second_gear_type']!='l')and(c['g1_param']['portion_tooth_nb']==0)and(c['g2_param']['portion_tooth_nb']==0)):
+      frame_period = 20
+  frame_cache = cnc25d_api.Frame_Cache(frame_period)
   # callback functions for display_backend
+  def sub_gear_graphics(ai_g1_position, ai_g2_position):
+    """ return the function that creates the graphics of the gear outlines
+    """
+    def sub_compute():
+      r_gear_graphics = [('graphic_lines', cnc25d_api.outline_arc_line(gear_profile_outline(g1_make_low_param, ai_g1_position), 'tkinter'), 'red', 1)]
+      if(c['g2_exist']):
+        r_gear_graphics.append(('graphic_lines', cnc25d_api.outline_arc_line(gear_profile_outline(g2_make_low_param, ai_g2_position), 'tkinter'), 'grey', 1))
+      return(r_gear_graphics)
+    return(sub_compute)
   def sub_canvas_graphics(ai_rotation_direction, ai_angle_position):
     """ create the graphics and fill-up the matplotlib curve tables
     """
     #global g1_position_curve_table, g2_position_curve_table, g2_rotation_speed_curve_table, tangential_friction_curve_table # no need of global because just append element to lists
     ## gear position
     # g1_position : assuming that ai_angle_position is incremented by 1.0 in fast_speed
-    if((c['gear_type']=='e')or(c['gear_type']=='i')):
-      g1_position = c['gear_initial_angle']+ai_angle_position*float(c['g1_pi_module_angle'])/20 # 20th of pi_module_angle (angular tooth pitch)
-    elif(c['gear_type']=='l'):
-      g1_position = c['gear_initial_angle']-ai_angle_position*float(c['g1_pi_module'])/20 # 20th of pi_module (linear tooth pitch)
+    g1_position = g1_simulation_position(c, ai_angle_position)
     # g2_position
+    g2_position = 0
     if(c['g2_exist']):
       #g2_position = g2_ia-ai_angle_position # completely wrong, just waiting for the good formula
       (g2_position, g2_rotation_speed, tangential_friction, c1_speed_outline, c2_speed_outline) = g2_position_calculation(place_low_parameters, ai_rotation_direction, g1_position)
     ## get outline_B
-    lg1_outline_B = gear_profile_outline(g1_make_low_param, g1_position)
     lg1_ideal_involute = ideal_tooth_outline(g1_make_low_param, g1_position, 0)
     lg1_ideal_tooth = ideal_tooth_outline(g1_make_low_param, g1_position, 1)
     if(c['g2_exist']):
-      lg2_outline_B = gear_profile_outline(g2_make_low_param, g2_position)
       lg2_ideal_involute = ideal_tooth_outline(g2_make_low_param, g2_position, 0)
       lg2_ideal_tooth = ideal_tooth_outline(g2_make_low_param, g2_position, 1)
     ## alternative to get outline_B
@@ -984,11 +1033,12 @@ def gear_profile_simulation_A(c):
         action_line_outline = c['negative_rotation_action_line_outline']
     ## make graphic
     r_canvas_graphics = []
-    r_canvas_graphics.append(('graphic_lines', cnc25d_api.outline_arc_line(lg1_outline_B, 'tkinter'), 'red', 1))
+    gear_graphics = frame_cache.get(sub_gear_graphics(g1_position, g2_position), ai_rotation_direction, ai_angle_position)
+    r_canvas_graphics.append(gear_graphics[0])
     r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg1_ideal_involute, 'tkinter'), 'green', 1))
     r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg1_ideal_tooth, 'tkinter'), 'blue', 1))
     if(c['g2_exist']):
-      r_canvas_graphics.append(('graphic_lines', cnc25d_api.outline_arc_line(lg2_outline_B, 'tkinter'), 'grey', 1))
+      r_canvas_graphics.append(gear_graphics[1])
       r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg2_ideal_involute, 'tkinter'), 'green', 1))
       r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg2_ideal_tooth, 'tkinter'), 'blue', 1))
       # speed overlay
@@ -1026,6 +1076,20 @@ def gear_profile_simulation_A(c):
     ('g2\nrotation_speed\n(radian/s)', g2_rotation_speed_curve_table, 'y.'),
     ('tangential\nfriction\n(mm/s)', tangential_friction_curve_table, 'bo'))
   # end of callback functions
+  return((sub_canvas_graphics, g1g2_info_txt, gear_profile_mpl_curves))
+
+def gear_profile_simulation_A(c):
+  """ define the gear_profile simulation
+      It's called simulation_A because we can imagine an other kind of simulation
+  """
+  #print("dbg901: gear_profile_simulation_A")
+  (sub_canvas_graphics, g1g2_info_txt, gear_profile_mpl_curves) = gear_profile_simulation_graphics(c)
+  print("Launch the simulation with Tkinter ..")
+  ### gear_profile parameter info in the log
+  print(g1g2_info_txt)
+  ### start Tkinter
+  tk_root = tkinter.Tk()
+  my_canvas = cnc25d_api.Two_Canvas(tk_root)
   my_canvas.add_canvas_graphic_function(sub_canvas_graphics)
   my_canvas.add_parameter_info(g1g2_info_txt)
   my_canvas.add_curve_graphic_table(gear_profile_mpl_curves)
@@ -1034,11 +1098,27 @@ def gear_profile_simulation_A(c):
   time.sleep(1) # delay to help Tkinter to close properly
   return(1)
 
+def gear_profile_simulation_B(c):
+  """ headless version of the gear_profile simulation
+      It prints the kinematic analysis of the first gear moving of simulation_tooth_cycle_nb tooth pitches
+      (or of simulation_revolution_nb revolutions if it is set) for both rotation directions
+  """
+  print(gear_profile_simulation_info(c))
+  for rotation_direction in (1, -1):
+    start_time = time.time()
+    (g1_position, g2_position, g2_rotation_speed, tangential_friction) = gear_profile_simulation_arrays(c, rotation_direction, c['simulation_tooth_cycle_nb'], c['simulation_revolution_nb'])
+    duration = time.time() - start_time
+    six.print_(("Kinematic analysis with rotation direction {:d} over {:d} positions in {:0.4f} s:".format(rotation_direction, len(g1_position), duration)))
+    for (name, table) in (('g1_position', g1_position), ('g2_position', g2_position), ('g2_rotation_speed', g2_rotation_speed), ('tangential_friction', tangential_friction)):
+      six.print_(("  {:s}: min {:0.5f}  max {:0.5f}  mean {:0.5f}".format(name, table.min(), table.max(), table.mean())))
+  return(1)
+
 def gear_profile_2d_simulations():
   """ return the dictionary defining the available simulation for gear_profile
   """
   r_sim = {}
   r_sim['gear_profile_simulation_A'] = gear_profile_simulation_A
+  r_sim['gear_profile_simulation_B'] = gear_profile_simulation_B
   return(r_sim)
 
 ################################################################
@@ -1053,6 +1133,8 @@ def gear_profile_self_test():
   r_tests = [
     ["simplest test"                    , "--gear_tooth_nb 17"],
     ["external-external simple"         , "--gear_tooth_nb 17 --second_gear_tooth_nb 21 --gear_module 10.0 --gear_skin_thickness 1.0 --gear_router_bit_radius 2.0 --simulate_2d gear_profile_simulation_A"],
+    ["headless simulation"              , "--gear_tooth_nb 17 --second_gear_tooth_nb 21 --gear_module 10.0 --simulate_2d gear_profile_simulation_B"],
+    ["headless simulation over 2 revolutions", "--gear_tooth_nb 17 --second_gear_tooth_nb 21 --gear_module 10.0 --simulation_revolution_nb 2 --simulate_2d gear_profile_simulation_B"],
     ["external-internal simple"         , "--gear_tooth_nb 17 --second_gear_tooth_nb 23 --gear_module 10.0 --second_gear_type i --gear_router_bit_radius 1.2"],
     ["internal-external simple"         , "--gear_tooth_nb 30 --gear_type i --second_gear_tooth_nb 15 --gear_module 10 --gear_router_bit_radius 1.4"],
     ["external-linear simple"           , "--gear_tooth_nb 20 --gear_module 10 --second_gear_type l --gearbar_slope 0.3 --gearbar_slope_n 0.6 --gear_router_bit_radius 3 --second_gear_tooth_nb 5 --second_gear_router_bit_radius 2"],
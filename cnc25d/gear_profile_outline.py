@@ -41,8 +41,8 @@ from . import cnc25d_api
 
 # Python standard library
 import math
-#import sys, argparse
-import sys
+import sys, argparse
+import numpy
 #from datetime import datetime
 #import os, errno
 #import re
@@ -54,7 +54,9 @@ import sys
 #import svgwrite
 #from dxfwrite import DXFEngine
 # cnc25d
+from . import design_help # just for get_effective_args()
 from . import small_geometry # use some well-tested functions from the internal of the cnc25d_api
+from . import outline_array # for the tooth instancing
 import six
 
 ################################################################
@@ -65,6 +67,8 @@ gpo_radian_epsilon_1000 = math.pi/1000 #0.003
 gpo_radian_epsilon_100000 = gpo_radian_epsilon_1000/100 #0.0003
 gpo_radian_epsilon_100 = gpo_radian_epsilon_1000*10 # 0.03
 gpo_radian_epsilon_10 = gpo_radian_epsilon_1000*100 # 0.3
+# the first tooth of a gearwheel (or gearbar) is computed and the other teeth are obtained by rotation (or translation). Set to False to compute each tooth
+gpo_tooth_instancing = True
 #gpo_radian_big_epsilon = math.pi/5 # almost 1 mm !
 
 ################################################################
@@ -194,6 +198,62 @@ def sample_of_gear_tooth_profile(ai_center, ai_base_radius, ai_initial_angle, ai
   r_sogtp = (qx, qy, ti)
   return(r_sogtp)
 
+def involute_parameter_array(ai_u_nb, ai_u_ini, ai_u_inc, ai_radian_epsilon):
+  """ return the numpy array of the ai_u_nb+1 parameters u used to sample an involute_to_circle
+      The parameters are accumulated with the loop of the scalar sampling: u is set to zero when it is close to zero (rounding error)
+      and the accumulation continues from zero
+  """
+  l_u = []
+  u = ai_u_ini
+  for sampling in range(ai_u_nb+1):
+    if(abs(u)<ai_radian_epsilon): # for rounding error
+      u=0
+    l_u.append(u)
+    u += ai_u_inc
+  r_u = numpy.array(l_u, dtype=float)
+  return(r_u)
+
+def involute_to_circle_array(ai_center, ai_base_radius, ai_initial_angle, ai_orientation, ai_parameter):
+  """ numpy version of involute_to_circle(). ai_parameter is an array of parameters u
+      it returns: the arrays of the Cartesian coordinates of (P) and of the tangent inclination (xPt)
+  """
+  # use notation of the documentation
+  OX = ai_center[0]
+  OY = ai_center[1]
+  B = ai_base_radius
+  s = ai_initial_angle
+  rd = ai_orientation
+  u = numpy.asarray(ai_parameter, dtype=float)
+  # check the parameter
+  if(numpy.any(u<0)):
+    six.print_(("ERR099: Error, the parameter of the involute_to_circle must be positive {:0.8f}".format(u.min())))
+    six.print_(("dbg887: ai_center {:0.2f} {:0.2f}  ai_base_radius {:0.2f}  ai_initial_angle {:0.2f}  ai_orientation {:d}".format(ai_center[0], ai_center[1], ai_base_radius, ai_initial_angle, ai_orientation)))
+    sys.exit(2)
+  # involute_to_circle of center (0,0), radius 1 and initial_angle = 0 with the parameter u
+  cos_u = numpy.cos(u)
+  sin_u = numpy.sin(u)
+  px0 = cos_u+u*sin_u
+  py0 = rd*(sin_u-u*cos_u)
+  ti0 = numpy.fmod(rd*u+math.pi, 2*math.pi) - math.pi # =u translated in [-pi,pi[
+  # involute_to_circle of center (OX,OY), radius B and initial_angle = s with the parameter u
+  px = OX+math.cos(s)*B*px0-math.sin(s)*B*py0
+  py = OY+math.sin(s)*B*px0+math.cos(s)*B*py0
+  ti = numpy.fmod(ti0+s+3*math.pi, 2*math.pi) - math.pi #=u+s translated in [-pi,pi[
+  # return
+  r_itc=(px, py, ti)
+  return(r_itc)
+
+def sample_of_gear_tooth_profile_array(ai_center, ai_base_radius, ai_initial_angle, ai_orientation, ai_thickness_offset, ai_parameter):
+  """ numpy version of sample_of_gear_tooth_profile(). ai_parameter is an array of parameters u
+      it returns: the arrays of the Cartesian coordinates of (Q) and of the tangent inclination (xPt)
+  """
+  (px, py, ti) = involute_to_circle_array(ai_center, ai_base_radius, ai_initial_angle, ai_orientation, ai_parameter)
+  qx = px + ai_orientation*ai_thickness_offset*numpy.sin(ti)
+  qy = py - ai_orientation*ai_thickness_offset*numpy.cos(ti)
+  # return
+  r_sogtp = (qx, qy, ti)
+  return(r_sogtp)
+
 def calc_low_level_gear_parameters(ai_param):
   """ From the hight level parameters relative to a gearwheel (or gearbar) and returns the low level parameters required to compute the gearwheel outline
       It also adds some parameters to the high-level parameter dictionary ai_param. So this function must be called before calling pre_g2_position_calculation()
@@ -540,16 +600,10 @@ def involute_outline(ai_ox, ai_oy, ai_base_radius, ai_offset, ai_sign, ai_u_nb,
   # precision
   #radian_epsilon=math.pi/1000 # unefficient because this function is used often
   radian_epsilon = gpo_radian_epsilon_1000
-  #
-  u = ai_u_ini
-  involute_C = []
-  for sampling in range(ai_u_nb+1):
-    #print("dbg443: u:", u)
-    if(abs(u)<radian_epsilon): # for rounding error
-      u=0
-    (qx, qy, ti) = sample_of_gear_tooth_profile((ai_ox,ai_oy), ai_base_radius, ai_tooth_angle+ai_offset, ai_sign, ai_g_type*ai_thickness, u)
-    involute_C.append((qx, qy, ti-(ai_sign-1)/2*math.pi))
-    u += ai_u_inc
+  # all samples in one shot
+  u = involute_parameter_array(ai_u_nb, ai_u_ini, ai_u_inc, radian_epsilon)
+  (qx, qy, ti) = sample_of_gear_tooth_profile_array((ai_ox,ai_oy), ai_base_radius, ai_tooth_angle+ai_offset, ai_sign, ai_g_type*ai_thickness, u)
+  involute_C = list(zip(qx.tolist(), qy.tolist(), (ti-(ai_sign-1)/2*math.pi).tolist()))
   #print("dbg444: involute_C:", involute_C)
   r_involute_B = cnc25d_api.smooth_outline_c_curve(involute_C, radian_epsilon, 0, "involute_outline")
   # hollow slope
@@ -680,7 +734,14 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
     r_final_outline.extend(half_hollow)
     r_final_outline.extend(start_of_profile_B)
   ### bulk of the gearwheel_portion
+  first_tooth_angle = tooth_angle
+  first_tooth_B = None
   for tooth in range(portion_tooth_nb):
+    # instancing: the other teeth are the rotation of the first tooth
+    if(first_tooth_B is not None):
+      r_final_outline.extend(first_tooth_B.rotate(ox, oy, tooth_angle-first_tooth_angle).to_list())
+      tooth_angle += pi_module_angle
+      continue
     # first involute
     (first_involute_B, first_hollow_slope_A, s_ti) = involute_outline(ox, oy, i1_base, i1_offset, i1_sign, i1u_nb, i1u_ini, i1u_inc, i1_thickness, hgt, -1, i1_dsl, i1_hsl, hrbr, tooth_angle)
     # second involute
@@ -707,9 +768,13 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
         sys.exit(2)
     hollow_B = cnc25d_api.cnc_cut_outline(hollow_A, "hollow")
     # assembly
-    r_final_outline.extend(first_involute_B)
-    r_final_outline.extend(hollow_B[1:-1])
-    r_final_outline.extend(second_involute_B)
+    tooth_B = []
+    tooth_B.extend(first_involute_B)
+    tooth_B.extend(hollow_B[1:-1])
+    tooth_B.extend(second_involute_B)
+    r_final_outline.extend(tooth_B)
+    if(gpo_tooth_instancing):
+      first_tooth_B = outline_array.outline_to_array(tooth_B)
     # prepare the next tooth
     tooth_angle += pi_module_angle
   ### end of bulk
@@ -756,25 +821,13 @@ def ideal_involute_tooth_outline(ai_low_parameters, ai_angle_position, ai_thickn
     gear_type_sign = -1
   # construct the ideal_tooth_outline over the first tooth
   # first_involute
-  first_involute = []
-  u = i2u_ini
-  ideal_i2u_inc = float(i2u_inc)/ideal
-  for sampling in range(ideal*i2u_nb+1):
-    if(abs(u)<radian_epsilon): # for rounding error
-      u=0
-    (qx, qy, ti) = sample_of_gear_tooth_profile((ox,oy), i2_base, tooth_angle-pi_module_angle+i2_offset, i2_sign, ai_thickness_coeff*gear_type_sign*i2_thickness, u)
-    first_involute.append((qx, qy))
-    u += ideal_i2u_inc
+  u = involute_parameter_array(ideal*i2u_nb, i2u_ini, float(i2u_inc)/ideal, radian_epsilon)
+  (qx, qy, ti) = sample_of_gear_tooth_profile_array((ox,oy), i2_base, tooth_angle-pi_module_angle+i2_offset, i2_sign, ai_thickness_coeff*gear_type_sign*i2_thickness, u)
+  first_involute = list(zip(qx.tolist(), qy.tolist()))
   # second_involute
-  second_involute = []
-  u = i1u_ini
-  ideal_i1u_inc = float(i1u_inc)/ideal
-  for sampling in range(ideal*i1u_nb+1):
-    if(abs(u)<radian_epsilon): # for rounding error
-      u=0
-    (qx, qy, ti) = sample_of_gear_tooth_profile((ox,oy), i1_base, tooth_angle+i1_offset, i1_sign, ai_thickness_coeff*gear_type_sign*i1_thickness, u)
-    second_involute.append((qx, qy))
-    u += ideal_i1u_inc
+  u = involute_parameter_array(ideal*i1u_nb, i1u_ini, float(i1u_inc)/ideal, radian_epsilon)
+  (qx, qy, ti) = sample_of_gear_tooth_profile_array((ox,oy), i1_base, tooth_angle+i1_offset, i1_sign, ai_thickness_coeff*gear_type_sign*i1_thickness, u)
+  second_involute = list(zip(qx.tolist(), qy.tolist()))
   # assembly
   r_ideal_tooth_outline = []
   r_ideal_tooth_outline.extend(first_involute)
@@ -844,7 +897,15 @@ def gearbar_profile_outline(ai_low_parameters, ai_tangential_position):
   elif(len(gearbar_A)==1):
     r_final_outline.append((gearbar_A[0][0], gearbar_A[0][1]))
   # bulk of the gearbar
+  first_tangential_position = tangential_position
+  first_tooth_B = None
   for tooth in range(bar_tooth_nb):
+    # instancing: the other teeth are the translation of the first tooth along the gearbar
+    if(first_tooth_B is not None):
+      tooth_shift = tangential_position-first_tangential_position
+      r_final_outline.extend(first_tooth_B.shift_xy(tooth_shift*math.cos(g_bi-math.pi/2), 1, tooth_shift*math.sin(g_bi-math.pi/2), 1).to_list())
+      tangential_position += pi_module
+      continue
     gearbar_A = []
     l_positive_slope = slope_outline(g_ox, g_oy, g_bi, gb_p_offset, g_sp,  1, g_alp, g_dlp, g_hlp, g_stp, g_rbr, tangential_position) # positive slope
     l_negative_slope = slope_outline(g_ox, g_oy, g_bi, gb_n_offset, g_sn, -1, g_aln, g_dln, g_hln, g_stn, g_rbr, tangential_position+pi_module) # negative slope
@@ -860,6 +921,8 @@ def gearbar_profile_outline(ai_low_parameters, ai_tangential_position):
     #print("dbg745: gearbar_A:", gearbar_A)
     gearbar_B = cnc25d_api.cnc_cut_outline(gearbar_A, "bulk of gearbar")
     r_final_outline.extend(gearbar_B)
+    if(gpo_tooth_instancing):
+      first_tooth_B = outline_array.outline_to_array(gearbar_B)
     # prepare the next tooth
     tangential_position += pi_module
   # end of the gearbar
@@ -1496,3 +1559,52 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
   r_iorfa = (r_info, r_action_line_outline)
   return(r_iorfa)
 
+################################################################
+# gear_profile_outline testing
+################################################################
+
+def gear_profile_outline_test1():
+  """ compare the numpy sampling of the involutes with the scalar loop of sample_of_gear_tooth_profile()
+  """
+  r_test = 1
+  radian_epsilon = gpo_radian_epsilon_1000
+  # (u_ini, u_inc, u_nb): a dedendum just above the base circle, on the base circle, below the base circle and a decreasing sampling
+  for (u_ini, u_inc, u_nb) in ((0.002, 0.05, 20), (0, 0.05, 20), (-0.001, 0.05, 20), (1.0, -0.05, 20), (0.002, 0.05/8, 160)):
+    scalar_sample = []
+    u = u_ini
+    for sampling in range(u_nb+1):
+      if(abs(u)<radian_epsilon):
+        u=0
+      scalar_sample.append(sample_of_gear_tooth_profile((10.0, 20.0), 50.0, 0.3, -1, 0.5, u))
+      u += u_inc
+    (qx, qy, ti) = sample_of_gear_tooth_profile_array((10.0, 20.0), 50.0, 0.3, -1, 0.5, involute_parameter_array(u_nb, u_ini, u_inc, radian_epsilon))
+    diff = max([max(abs(s[0]-x), abs(s[1]-y), abs(s[2]-t)) for (s, x, y, t) in zip(scalar_sample, qx.tolist(), qy.tolist(), ti.tolist())])
+    six.print_(("u_ini {:0.4f}  u_inc {:0.4f}  u_nb {:d} : difference {:0.3e}".format(u_ini, u_inc, u_nb, diff)))
+    if(diff>1e-12):
+      six.print_(("ERR097: Error, the numpy sampling of the involute differs from the scalar sampling with u_ini {:0.4f} and u_inc {:0.4f}".format(u_ini, u_inc)))
+      r_test = 0
+  return(r_test)
+
+################################################################
+# gear_profile_outline command line interface
+################################################################
+
+def gear_profile_outline_cli(ai_args=""):
+  """ command line interface of gear_profile_outline.py when it is used in standalone
+  """
+  gpo_parser = argparse.ArgumentParser(description='Test the functions of gear_profile_outline.py.')
+  gpo_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It compares the numpy sampling of the involutes with the scalar sampling.')
+  effective_args = design_help.get_effective_args(ai_args)
+  gpo_args = gpo_parser.parse_args(effective_args)
+  r_gpo = 1
+  if(gpo_args.sw_test1):
+    r_gpo = gear_profile_outline_test1()
+  return(r_gpo)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  gear_profile_outline_cli("--test1")
@@ -47,8 +47,8 @@ import sys, argparse
 #import re
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
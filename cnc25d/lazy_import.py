@@ -0,0 +1,185 @@
+# lazy_import.py
+# imports FreeCAD, Tkinter and matplotlib at their first use
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+lazy_import.py provides the placeholders Part, Base, importDXF, Drawing, tkinter and pyplot.
+A placeholder imports its module at the first access to one of its attributes,
+so a 2D job (outlines, SVG, DXF) neither searches nor imports FreeCAD, Tkinter or matplotlib.
+The FreeCAD modules are searched with importing_freecad.importing_freecad() if they can not be imported directly.
+Use it in the other modules with: from .lazy_import import Part, Base
+"""
+
+################################################################
+# import
+################################################################
+
+import os
+import sys, argparse
+import importlib
+import subprocess
+import six
+#
+from . import importing_freecad
+from . import design_help # just for get_effective_args()
+
+################################################################
+# global variable
+################################################################
+
+# the modules that a 2D job must not import
+heavy_module_names = ('FreeCAD', 'Part', 'Drawing', 'importDXF', 'tkinter', 'Tkinter', 'matplotlib')
+# maximal time to import cnc25d.cnc25d_api (seconds)
+import_time_budget = 2.0
+
+################################################################
+# Lazy_Module
+################################################################
+
+class Lazy_Module(object):
+  """ placeholder of a module imported at the first access to one of its attributes
+  """
+  def __init__(self, ai_module_name, ai_attribute_name=None, ai_freecad=False):
+    """ ai_module_name: name of the module to import
+        ai_attribute_name: if not None, the placeholder stands for this attribute of the module (e.g. Base of FreeCAD)
+        ai_freecad: if True, the FreeCAD library is searched with importing_freecad() before the import
+    """
+    object.__setattr__(self, 'lazy_module_name', ai_module_name)
+    object.__setattr__(self, 'lazy_attribute_name', ai_attribute_name)
+    object.__setattr__(self, 'lazy_freecad', ai_freecad)
+    object.__setattr__(self, 'lazy_module', None)
+
+  def lazy_load(self):
+    """ import the module if needed and return it
+    """
+    if(self.lazy_module is None):
+      if(self.lazy_freecad):
+        try:
+          module = importlib.import_module(self.lazy_module_name)
+        except ImportError: # FreeCAD is not in sys.path
+          importing_freecad.importing_freecad()
+          module = importlib.import_module(self.lazy_module_name)
+      else:
+        module = importlib.import_module(self.lazy_module_name)
+      if(self.lazy_attribute_name is not None):
+        module = getattr(module, self.lazy_attribute_name)
+      object.__setattr__(self, 'lazy_module', module)
+    return(self.lazy_module)
+
+  def is_loaded(self):
+    """ check if the module has been imported
+    """
+    r_loaded = (self.lazy_module is not None)
+    return(r_loaded)
+
+  def __getattr__(self, ai_name):
+    return(getattr(self.lazy_load(), ai_name))
+
+  def __setattr__(self, ai_name, ai_value):
+    setattr(self.lazy_load(), ai_name, ai_value)
+
+  def __repr__(self):
+    name = self.lazy_module_name
+    if(self.lazy_attribute_name is not None):
+      name = "{:s}.{:s}".format(name, self.lazy_attribute_name)
+    r_repr = "<lazy module {:s} ({:s})>".format(name, 'loaded' if self.is_loaded() else 'not loaded')
+    return(r_repr)
+
+################################################################
+# the lazy modules
+################################################################
+
+Part = Lazy_Module('Part', ai_freecad=True)
+Base = Lazy_Module('FreeCAD', 'Base', ai_freecad=True)
+importDXF = Lazy_Module('importDXF', ai_freecad=True)
+Drawing = Lazy_Module('Drawing', ai_freecad=True)
+tkinter = Lazy_Module('six.moves.tkinter')
+pyplot = Lazy_Module('matplotlib.pyplot')
+
+################################################################
+# lazy_import testing
+################################################################
+
+import_time_script = """
+import sys, time
+t0 = time.time()
+import cnc25d.cnc25d_api
+t1 = time.time()
+print("import_time: " + repr(t1-t0))
+print("heavy_modules: " + ' '.join([m for m in {:s} if m in sys.modules]))
+"""
+
+def import_time(ai_repeat_nb=3):
+  """ import cnc25d.cnc25d_api in new Python processes
+      It returns the tuple (minimal import time in seconds, list of the heavy modules imported)
+  """
+  script = import_time_script.format(repr(heavy_module_names))
+  package_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # import this cnc25d and not an installed one
+  times = []
+  heavy_modules = []
+  for i in range(ai_repeat_nb):
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=package_parent_dir).decode('ascii', 'replace')
+    for line in output.splitlines(): # the other lines are printed by cnc25d
+      if(line.startswith('import_time: ')):
+        times.append(float(line.split()[1]))
+      elif(line.startswith('heavy_modules: ')):
+        heavy_modules = line.split()[1:]
+  r_import_time = (min(times), heavy_modules)
+  return(r_import_time)
+
+def lazy_import_test1():
+  """ benchmark the import of cnc25d.cnc25d_api and check that FreeCAD, Tkinter and matplotlib are not imported
+  """
+  r_test = 1
+  (t, heavy_modules) = import_time()
+  six.print_(("import cnc25d.cnc25d_api: {:0.3f} s (budget {:0.3f} s)  heavy modules imported: {:s}".format(t, import_time_budget, ' '.join(heavy_modules) if heavy_modules else 'none')))
+  if(len(heavy_modules)>0):
+    six.print_(("ERR701: Error, the import of cnc25d.cnc25d_api imports {:s}".format(' '.join(heavy_modules))))
+    r_test = 0
+  if(t>import_time_budget):
+    six.print_(("ERR702: Error, the import of cnc25d.cnc25d_api takes {:0.3f} s, more than {:0.3f} s".format(t, import_time_budget)))
+    r_test = 0
+  return(r_test)
+
+################################################################
+# lazy_import command line interface
+################################################################
+
+def lazy_import_cli(ai_args=""):
+  """ command line interface of lazy_import.py when it is used in standalone
+  """
+  li_parser = argparse.ArgumentParser(description='Benchmark the import of cnc25d.cnc25d_api.')
+  li_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It measures the import time of cnc25d.cnc25d_api and checks that FreeCAD, Tkinter and matplotlib are not imported.')
+  effective_args = design_help.get_effective_args(ai_args)
+  li_args = li_parser.parse_args(effective_args)
+  r_li = 1
+  if(li_args.sw_test1):
+    r_li = lazy_import_test1()
+  return(r_li)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  lazy_import_cli("--test1")
+
@@ -0,0 +1,264 @@
+# offscreen_backend.py
+# renders the frames of a Two_Canvas simulation into PNG or SVG files without display
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+offscreen_backend.py renders the frames of a canvas-graphic function into PNG or SVG files.
+The canvas-graphic function is the callback given to Two_Canvas.add_canvas_graphic_function(),
+for example the ones of gear_profile.gear_profile_simulation_graphics() or outline_backends.figure_simple_display_graphics().
+No display server is required: the SVG files are written as text and the PNG files with the matplotlib Agg backend.
+The frames are distributed over a pool of worker processes when the fork start method is available.
+"""
+
+################################################################
+# import
+################################################################
+
+import os
+import sys, argparse
+import multiprocessing
+import six
+#
+from . import design_help # just for get_effective_args()
+from . import display_backend
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+offscreen_canvas_size = (800, 800) # (width, height) in pixel
+offscreen_margin = 20 # pixel
+offscreen_background = 'white'
+offscreen_dpi = 100
+# the rendering job shared with the forked worker processes (a closure can not be pickled)
+offscreen_job = None
+
+################################################################
+# frame rendering
+################################################################
+
+def frame_items(ai_canvas_graphic_function, ai_rotation_direction, ai_angle_position, ai_scale_coef, ai_overlay):
+  """ compute a frame and return the list of canvas items (item_type, coordinates, options) like Two_Canvas
+  """
+  canvas_graphics = display_backend.scale_outline(ai_canvas_graphic_function(ai_rotation_direction, ai_angle_position), ai_scale_coef)
+  if(display_backend.lod_pixel_tolerance is not None):
+    (canvas_graphics, input_point_nb, output_point_nb) = display_backend.decimate_outline(canvas_graphics, display_backend.lod_pixel_tolerance)
+  r_items = display_backend.canvas_items(canvas_graphics, ai_overlay)
+  return(r_items)
+
+def write_frame_svg(ai_items, ai_filename, ai_canvas_size):
+  """ write the canvas items of a frame in a SVG file
+  """
+  (width, height) = ai_canvas_size
+  with open(ai_filename, 'w') as svg_file:
+    svg_file.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+    svg_file.write('<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{:d}" height="{:d}">\n'.format(width, height))
+    svg_file.write('<rect width="100%" height="100%" fill="{:s}"/>\n'.format(offscreen_background))
+    for (item_type, coordinates, options) in ai_items:
+      option = dict(options)
+      points = ' '.join("{:0.2f},{:0.2f}".format(coordinates[2*i], coordinates[2*i+1]) for i in range(len(coordinates)//2))
+      if(item_type=='line'):
+        svg_file.write('<polyline points="{:s}" fill="none" stroke="{:s}" stroke-width="{:s}"/>\n'.format(points, option['fill'], str(option['width'])))
+      else:
+        svg_file.write('<polygon points="{:s}" fill="{:s}" stroke="{:s}" stroke-width="{:s}"/>\n'.format(points, option['fill'], option['outline'], str(option['width'])))
+    svg_file.write('</svg>\n')
+
+def write_frame_png(ai_items, ai_filename, ai_canvas_size):
+  """ rasterize the canvas items of a frame in a PNG file with the matplotlib Agg backend
+  """
+  # matplotlib is imported here because it is only needed for the PNG files
+  import matplotlib.figure
+  import matplotlib.patches
+  import matplotlib.collections
+  from matplotlib.backends.backend_agg import FigureCanvasAgg
+  (width, height) = ai_canvas_size
+  fig = matplotlib.figure.Figure(figsize=(float(width)/offscreen_dpi, float(height)/offscreen_dpi), dpi=offscreen_dpi, facecolor=offscreen_background)
+  FigureCanvasAgg(fig)
+  ax = fig.add_axes((0, 0, 1, 1))
+  ax.set_xlim(0, width)
+  ax.set_ylim(height, 0) # the y-axis of a canvas points downward
+  ax.set_axis_off()
+  segments = []
+  colors = []
+  widths = []
+  for (item_type, coordinates, options) in ai_items:
+    option = dict(options)
+    points = [(coordinates[2*i], coordinates[2*i+1]) for i in range(len(coordinates)//2)]
+    if(item_type=='line'):
+      segments.append(points)
+      colors.append(option['fill'])
+      widths.append(option['width'])
+    else:
+      ax.add_patch(matplotlib.patches.Polygon(points, closed=True, facecolor=option['fill'], edgecolor=option['outline'], linewidth=option['width']))
+  ax.add_collection(matplotlib.collections.LineCollection(segments, colors=colors, linewidths=widths))
+  fig.savefig(ai_filename, dpi=offscreen_dpi, facecolor=offscreen_background)
+
+def offscreen_render_frame(ai_frame_idx):
+  """ render the frame ai_frame_idx of offscreen_job
+      It returns the tuple (exit_code, filename). The exit_code is set if the computation has called sys.exit()
+  """
+  (canvas_graphic_function, filename_template, angle_start, angle_step, rotation_direction, scale_coef, canvas_size, overlay) = offscreen_job
+  filename = filename_template.format(ai_frame_idx)
+  try:
+    items = frame_items(canvas_graphic_function, rotation_direction, angle_start+ai_frame_idx*angle_step, scale_coef, overlay)
+    if(filename.endswith('.svg')):
+      write_frame_svg(items, filename, canvas_size)
+    else:
+      write_frame_png(items, filename, canvas_size)
+  except SystemExit as e: # a SystemExit would kill the worker and block the pool
+    sys.stdout.flush()
+    return((e.code, filename))
+  sys.stdout.flush()
+  return((None, filename))
+
+################################################################
+# API function
+################################################################
+
+def offscreen_render(ai_canvas_graphic_function, ai_frame_nb, ai_filename_template, ai_angle_start=0, ai_angle_step=None, ai_rotation_direction=1, ai_canvas_size=None, ai_overlay=1, ai_worker_nb=None):
+  """ render ai_frame_nb frames of a canvas-graphic function into the files ai_filename_template.format(frame_index)
+      The suffix of ai_filename_template selects the format: .png or .svg
+      The angle position of the frame i is ai_angle_start+i*ai_angle_step (default: the fast speed of Two_Canvas)
+      Like Two_Canvas, the scale is computed with the first frame and kept for the other frames.
+      It returns the list of the written files
+  """
+  global offscreen_job
+  angle_step = ai_angle_step
+  if(angle_step is None):
+    angle_step = display_backend.g_fast_angle_speed
+  canvas_size = ai_canvas_size
+  if(canvas_size is None):
+    canvas_size = offscreen_canvas_size
+  worker_nb = ai_worker_nb
+  if(worker_nb is None):
+    worker_nb = multiprocessing.cpu_count()
+  if(not (ai_filename_template.endswith('.png') or ai_filename_template.endswith('.svg'))):
+    six.print_(("ERR661: Error, the file name template {:s} must end with .png or .svg".format(ai_filename_template)))
+    sys.exit(2)
+  if(ai_filename_template.format(0)==ai_filename_template.format(1)):
+    six.print_(("ERR662: Error, the file name template {:s} must contain a field for the frame index like {{:04d}}".format(ai_filename_template)))
+    sys.exit(2)
+  output_dir = os.path.dirname(ai_filename_template.format(0))
+  if(output_dir!=''):
+    design_help.mkdir_p(output_dir)
+  # scale coefficient of the first frame
+  outline_extremum = display_backend.find_outline_extremum(ai_canvas_graphic_function(ai_rotation_direction, ai_angle_start))
+  scale_coef = display_backend.compute_scale_coef(outline_extremum, (canvas_size[0], canvas_size[1], offscreen_margin, offscreen_margin))
+  offscreen_job = (ai_canvas_graphic_function, ai_filename_template, ai_angle_start, angle_step, ai_rotation_direction, scale_coef, canvas_size, ai_overlay)
+  six.print_(("Render {:d} frames in {:s}".format(ai_frame_nb, ai_filename_template)))
+  sys.stdout.flush()
+  frame_indices = list(range(ai_frame_nb))
+  try:
+    if((worker_nb<2)or(ai_frame_nb<2)or(not 'fork' in multiprocessing.get_all_start_methods())or(design_help.interpretor_is_freecad())):
+      results = [offscreen_render_frame(i) for i in frame_indices]
+    else:
+      # the forked workers inherit offscreen_job
+      pool = multiprocessing.get_context('fork').Pool(min(worker_nb, ai_frame_nb))
+      try:
+        results = pool.map(offscreen_render_frame, frame_indices)
+      finally:
+        pool.close()
+        pool.join()
+  finally:
+    offscreen_job = None
+  r_files = []
+  for (exit_code, filename) in results:
+    if(exit_code is not None):
+      six.print_(("ERR663: Error in the computation of the frame {:s}".format(filename)))
+      sys.exit(exit_code)
+    r_files.append(filename)
+  return(r_files)
+
+################################################################
+# offscreen_backend testing
+################################################################
+
+def offscreen_backend_test1():
+  """ render a rotating figure in SVG and PNG files
+  """
+  from . import cnc_outline # for the test figure
+  from . import outline_backends
+  r_test = 1
+  l_output_dir = "test_output/offscreen_backend_test1"
+  crenel = [(0,0,0), (40,0,2), (40,10,2), (50,10,2), (50,0,2), (100,0,3), (120,-15,100,-30,3), (0,-30,-2), (0,0,0)]
+  figure = [cnc_outline.cnc_cut_outline(crenel, "offscreen_backend_test1", True), (60, -10, 5)]
+  overlay = [cnc_outline.ideal_outline(crenel, "offscreen_backend_test1")]
+  canvas_graphic_function = outline_backends.figure_simple_display_graphics(figure, overlay)
+  for suffix in ('svg', 'png'):
+    t0 = time.time()
+    files = offscreen_render(canvas_graphic_function, 8, "{:s}/frame_{{:02d}}.{:s}".format(l_output_dir, suffix), ai_angle_step=20)
+    t1 = time.time()
+    six.print_(("{:s}: {:d} frames in {:0.3f} s".format(suffix, len(files), t1-t0)))
+    for filename in files:
+      if(not os.path.isfile(filename)):
+        six.print_(("ERR664: Error, the frame file {:s} has not been written".format(filename)))
+        r_test = 0
+  return(r_test)
+
+################################################################
+# offscreen_backend command line interface
+################################################################
+
+def offscreen_backend_cli(ai_args=""):
+  """ command line interface of offscreen_backend.py when it is used in standalone
+  """
+  ob_parser = argparse.ArgumentParser(description='Render the frames of a simulation into PNG or SVG files without display.')
+  ob_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It renders a rotating figure in SVG and PNG files.')
+  ob_parser.add_argument('--gear_profile','--gp', action='store', default='', dest='sw_gear_profile',
+    help="Render the simulation of the gear_profile defined by this argument string, for example: --gear_profile '--gear_tooth_nb 17 --second_gear_tooth_nb 21'")
+  ob_parser.add_argument('--frame_nb','--fn', action='store', type=int, default=20, dest='sw_frame_nb',
+    help='Number of rendered frames. The default 20 frames with the default angle_step is one tooth pitch of the gear_profile simulation.')
+  ob_parser.add_argument('--angle_step','--as', action='store', type=float, default=display_backend.g_fast_angle_speed, dest='sw_angle_step',
+    help='Angle position increment between two frames (in the unit of the Two_Canvas angle position).')
+  ob_parser.add_argument('--rotation_direction','--rd', action='store', type=int, default=1, dest='sw_rotation_direction',
+    help='Rotation direction of the simulation: 1 or -1.')
+  ob_parser.add_argument('--output_file_template','--oft', action='store', default='test_output/offscreen/frame_{:04d}.png', dest='sw_output_file_template',
+    help='File name of the frames with a field for the frame index. The suffix .png or .svg selects the format.')
+  ob_parser.add_argument('--canvas_size','--cs', action='store', nargs=2, type=int, default=offscreen_canvas_size, dest='sw_canvas_size',
+    help='Width and height of the frames in pixel.')
+  ob_parser.add_argument('--worker_nb','--wn', action='store', type=int, default=None, dest='sw_worker_nb',
+    help='Number of worker processes. Default: the number of CPUs.')
+  effective_args = design_help.get_effective_args(ai_args)
+  ob_args = ob_parser.parse_args(effective_args)
+  r_ob = 1
+  if(ob_args.sw_test1):
+    r_ob = offscreen_backend_test1()
+  if(ob_args.sw_gear_profile!=''):
+    from . import gear_profile # here to avoid a circular import
+    my_gp = gear_profile.gear_profile()
+    my_gp.apply_cli(ob_args.sw_gear_profile)
+    (canvas_graphic_function, info_txt, mpl_curves) = gear_profile.gear_profile_simulation_graphics(my_gp.get_constraint())
+    frame_files = offscreen_render(canvas_graphic_function, ob_args.sw_frame_nb, ob_args.sw_output_file_template, 0, ob_args.sw_angle_step, ob_args.sw_rotation_direction, tuple(ob_args.sw_canvas_size), 1, ob_args.sw_worker_nb)
+    six.print_(("The {:d} frames are written in:".format(len(frame_files))))
+    for f in frame_files:
+      six.print_(("  {:s}".format(f)))
+  return(r_ob)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  offscreen_backend_cli("--test1")
+
@@ -0,0 +1,562 @@
+# outline_array.py
+# compact numpy storage of the cnc25d outlines
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+outline_array.py provides the class OutlineArray, an alternative storage of the format-A, format-B and format-C outlines.
+The end points, the arc middle points and the router_bit radius (or tangent) are stored in numpy arrays instead of lists of tuples.
+An OutlineArray behaves like the list of segments it represents, so it can be used by all the functions expecting an outline.
+The transformations (shift_xy, rotate, reverse) work on the complete arrays and share the unchanged arrays with the parent outline.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+ # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import sys, argparse
+import six
+import numpy
+#
+from . import design_help # just for get_effective_args()
+#
+import time # for the tests
+
+################################################################
+# OutlineArray
+################################################################
+
+def read_only(ai_array):
+  """ set the numpy array ai_array read-only, so it can be shared between several outlines
+  """
+  ai_array.setflags(write=False)
+  return(ai_array)
+
+class OutlineArray(object):
+  """
+  An outline stored in numpy arrays:
+  outline_format: 0 for a format-B circle, 1 for a format-B general outline, 2 for a format-A or format-C outline (as cnc_outline.check_outline_format())
+  point: array (N,2) of the end points. The first point is the start point. For a circle, it contains the center.
+  middle: array (N,2) of the arc middle points. Set to nan for the start point and the line segments.
+  arc: boolean array (N) True for the arc segments
+  value: array (N) of the third value of a format-A (router_bit request) or format-C (tangent) point. It's the radius for a circle and None for a format-B general outline.
+  The arrays are read-only because they might be shared with other outlines.
+  """
+  __slots__ = ('outline_format', 'point', 'middle', 'arc', 'value')
+
+  def __init__(self, ai_outline_format, ai_point, ai_middle, ai_arc, ai_value):
+    """ create an OutlineArray from numpy arrays. Use outline_to_array() to create it from a list of segments
+    """
+    self.outline_format = ai_outline_format
+    self.point = read_only(ai_point)
+    self.middle = read_only(ai_middle)
+    self.arc = read_only(ai_arc)
+    self.value = ai_value
+    if(ai_value is not None):
+      self.value = read_only(ai_value)
+
+  def __len__(self):
+    """ number of segments (including the start point) or 3 for a circle
+    """
+    if(self.outline_format==0):
+      r_len = 3
+    else:
+      r_len = len(self.point)
+    return(r_len)
+
+  def segment(self, ai_idx):
+    """ return the segment ai_idx as tuple like in the list format
+    """
+    (x, y) = self.point[ai_idx].tolist()
+    if(self.arc[ai_idx]):
+      (mx, my) = self.middle[ai_idx].tolist()
+      r_segment = (mx, my, x, y)
+    else:
+      r_segment = (x, y)
+    if(self.outline_format==2):
+      r_segment += (self.value[ai_idx].item(),)
+    return(r_segment)
+
+  def __getitem__(self, ai_idx):
+    """ return the segment ai_idx as tuple (or a coordinate for a circle)
+        A slice returns an OutlineArray sharing the arrays of the parent outline
+    """
+    if(isinstance(ai_idx, slice)):
+      if(self.outline_format==0):
+        r_item = self.to_list()[ai_idx]
+      else:
+        value = None
+        if(self.value is not None):
+          value = self.value[ai_idx]
+        r_item = OutlineArray(self.outline_format, self.point[ai_idx], self.middle[ai_idx], self.arc[ai_idx], value)
+    elif(self.outline_format==0):
+      r_item = (self.point[0,0].item(), self.point[0,1].item(), self.value[0].item())[ai_idx]
+    else:
+      if(ai_idx<0):
+        ai_idx += len(self.point)
+      if((ai_idx<0)or(ai_idx>=len(self.point))):
+        raise IndexError("OutlineArray index out of range")
+      r_item = self.segment(ai_idx)
+    return(r_item)
+
+  def __iter__(self):
+    """ iterate over the segments like over a list of segments
+    """
+    return(iter(self.to_list()))
+
+  def __repr__(self):
+    return("OutlineArray({:s})".format(repr(self.to_list())))
+
+  def to_list(self):
+    """ convert the OutlineArray into the list format (list of tuples, or a tuple of three floats for a circle)
+    """
+    if(self.outline_format==0):
+      r_list = (self.point[0,0].item(), self.point[0,1].item(), self.value[0].item())
+    else:
+      xy = self.point.tolist()
+      mxy = self.middle.tolist()
+      arc = self.arc.tolist()
+      if(self.value is None):
+        r_list = [tuple(m+p) if a else tuple(p) for (p, m, a) in zip(xy, mxy, arc)]
+      else:
+        r_list = [tuple(m+p+[v]) if a else tuple(p+[v]) for (p, m, a, v) in zip(xy, mxy, arc, self.value.tolist())]
+    return(r_list)
+
+  def nbytes(self):
+    """ memory used by the numpy arrays
+    """
+    r_nbytes = self.point.nbytes + self.middle.nbytes + self.arc.nbytes
+    if(self.value is not None):
+      r_nbytes += self.value.nbytes
+    return(r_nbytes)
+
+  def is_closed(self):
+    """ check if the outline is closed like cnc_outline.cnc_cut_outline() does
+    """
+    r_closed = False
+    if(self.outline_format!=0):
+      r_closed = bool((self.point[0,0]==self.point[-1,0])and(self.point[0,1]==self.point[-1,1]))
+    return(r_closed)
+
+  def shift_xy(self, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient):
+    """ array version of cnc_outline.outline_shift_xy()
+    """
+    if(self.outline_format==0):
+      if(abs(ai_x_coefficient)!=abs(ai_y_coefficient)):
+        six.print_(("WARN358: Warning, circle is scaled with different scale along x and y! {:0.2f} {:0.2f}".format(ai_x_coefficient, ai_y_coefficient)))
+      point = numpy.array([[ai_x_offset+ai_x_coefficient*self.point[0,0], ai_y_offset+ai_y_coefficient*self.point[0,1]]])
+      r_outline = OutlineArray(0, point, self.middle, self.arc, self.value)
+    else:
+      if((ai_x_coefficient==0)or(ai_y_coefficient==0)):
+        six.print_(("ERR439: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient)))
+        sys.exit(2)
+      i_outline = self
+      if((ai_x_coefficient*ai_y_coefficient)<0):
+        i_outline = self.reverse()
+      offset = numpy.array([ai_x_offset, ai_y_offset], dtype=float)
+      coefficient = numpy.array([ai_x_coefficient, ai_y_coefficient], dtype=float)
+      point = offset+coefficient*i_outline.point
+      middle = offset+coefficient*i_outline.middle
+      r_outline = OutlineArray(i_outline.outline_format, point, middle, i_outline.arc, i_outline.value)
+    return(r_outline)
+
+  def rotate(self, ai_ox, ai_oy, ai_rotation_angle):
+    """ array version of cnc_outline.outline_rotate()
+    """
+    cos_a = math.cos(ai_rotation_angle)
+    sin_a = math.sin(ai_rotation_angle)
+    def rotate_points(ai_points):
+      ix = ai_points[:,0]-ai_ox
+      iy = ai_points[:,1]-ai_oy
+      r_points = numpy.empty_like(ai_points)
+      r_points[:,0] = ai_ox+ix*cos_a-iy*sin_a
+      r_points[:,1] = ai_oy+ix*sin_a+iy*cos_a
+      return(r_points)
+    middle = self.middle
+    if(self.outline_format!=0):
+      middle = rotate_points(self.middle)
+    r_outline = OutlineArray(self.outline_format, rotate_points(self.point), middle, self.arc, self.value)
+    return(r_outline)
+
+  def reverse(self):
+    """ array version of cnc_outline.outline_reverse()
+    """
+    if(self.outline_format==0):
+      return(self)
+    point = self.point[::-1] # view
+    middle = numpy.empty_like(self.middle)
+    middle[0] = numpy.nan
+    middle[1:] = self.middle[:0:-1]
+    arc = numpy.empty_like(self.arc)
+    arc[0] = False
+    arc[1:] = self.arc[:0:-1]
+    value = self.value
+    if(value is not None):
+      value = self.value[::-1] # view
+      # move the router_bit request if the outline is closed
+      if(self.is_closed()):
+        if(value[0]!=0):
+          six.print_(("WARN567: Warning, the last router_bit request of the closed outline is not set to zero: {:0.2f}".format(value[0])))
+        value = value.copy()
+        value[0] = value[-1]
+        value[-1] = 0
+    r_outline = OutlineArray(self.outline_format, point, middle, arc, value)
+    return(r_outline)
+
+  def close(self):
+    """ array version of cnc_outline.outline_close(). It returns a new OutlineArray
+    """
+    r_outline = self
+    if(self.outline_format!=0):
+      if(self.is_closed()):
+        print("WARN421: Warning, the outline is already closed!")
+      else:
+        point = numpy.vstack((self.point, self.point[0:1]))
+        middle = numpy.vstack((self.middle, [[numpy.nan, numpy.nan]]))
+        arc = numpy.append(self.arc, False)
+        value = self.value
+        if(value is not None):
+          value = numpy.append(self.value, 0.0)
+        r_outline = OutlineArray(self.outline_format, point, middle, arc, value)
+    return(r_outline)
+
+  def transform(self, ai_matrix):
+    """ apply the affine transformation ai_matrix=(a, b, c, d, e, f): x'=a*x+b*y+c  y'=d*x+e*y+f
+        The outline is reversed if the transformation changes the orientation. The radius of a circle is kept.
+    """
+    (a, b, c, d, e, f) = ai_matrix
+    def transform_points(ai_points):
+      r_points = numpy.empty_like(ai_points)
+      r_points[:,0] = a*ai_points[:,0]+b*ai_points[:,1]+c
+      r_points[:,1] = d*ai_points[:,0]+e*ai_points[:,1]+f
+      return(r_points)
+    if(self.outline_format==0):
+      r_outline = OutlineArray(0, transform_points(self.point), self.middle, self.arc, self.value)
+    else:
+      i_outline = self
+      if((a*e-b*d)<0):
+        i_outline = self.reverse()
+      r_outline = OutlineArray(i_outline.outline_format, transform_points(i_outline.point), transform_points(i_outline.middle), i_outline.arc, i_outline.value)
+    return(r_outline)
+
+################################################################
+# TransformedOutline
+################################################################
+
+identity_matrix = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+def shift_matrix(ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient):
+  """ affine matrix of cnc_outline.outline_shift_xy()
+  """
+  r_matrix = (ai_x_coefficient, 0.0, ai_x_offset, 0.0, ai_y_coefficient, ai_y_offset)
+  return(r_matrix)
+
+def rotate_matrix(ai_ox, ai_oy, ai_rotation_angle):
+  """ affine matrix of cnc_outline.outline_rotate()
+  """
+  cos_a = math.cos(ai_rotation_angle)
+  sin_a = math.sin(ai_rotation_angle)
+  r_matrix = (cos_a, -sin_a, ai_ox-ai_ox*cos_a+ai_oy*sin_a, sin_a, cos_a, ai_oy-ai_ox*sin_a-ai_oy*cos_a)
+  return(r_matrix)
+
+def compose_matrix(ai_matrix2, ai_matrix1):
+  """ affine matrix of the transformation ai_matrix1 followed by ai_matrix2
+  """
+  (a1, b1, c1, d1, e1, f1) = ai_matrix1
+  (a2, b2, c2, d2, e2, f2) = ai_matrix2
+  r_matrix = (a2*a1+b2*d1, a2*b1+b2*e1, a2*c1+b2*f1+c2, d2*a1+e2*d1, d2*b1+e2*e1, d2*c1+e2*f1+f2)
+  return(r_matrix)
+
+class TransformedOutline(object):
+  """
+  An outline with a pending affine transformation.
+  The shift, flip and rotation are composed into one 2x3 matrix and the outline is computed only once, when it is read.
+  It behaves like the transformed outline, so it can be used by all the functions expecting an outline.
+  """
+  __slots__ = ('outline', 'matrix', 'applied')
+
+  def __init__(self, ai_outline, ai_matrix=identity_matrix):
+    """ ai_outline: list of segments, OutlineArray or TransformedOutline
+    """
+    if(isinstance(ai_outline, TransformedOutline)):
+      self.outline = ai_outline.outline
+      self.matrix = compose_matrix(ai_matrix, ai_outline.matrix)
+    else:
+      self.outline = ai_outline
+      self.matrix = ai_matrix
+    self.applied = None
+
+  @property
+  def outline_format(self):
+    """ outline format code of cnc_outline.check_outline_format()
+    """
+    if(isinstance(self.outline, OutlineArray)):
+      r_format = self.outline.outline_format
+    elif(not isinstance(self.outline[0], (tuple, list))):
+      r_format = 0
+    else:
+      r_format = len(self.outline[0])-1
+    return(r_format)
+
+  def apply_array(self):
+    """ return the transformed outline as OutlineArray
+    """
+    r_outline = outline_to_array(self.outline).transform(self.matrix)
+    return(r_outline)
+
+  def apply(self):
+    """ compute the transformed outline with the type of the original outline. The result is computed only once
+    """
+    if(self.applied is None):
+      self.applied = self.apply_array()
+      if(not isinstance(self.outline, OutlineArray)):
+        self.applied = self.applied.to_list()
+    return(self.applied)
+
+  def __len__(self):
+    return(len(self.outline))
+
+  def __getitem__(self, ai_idx):
+    return(self.apply()[ai_idx])
+
+  def __iter__(self):
+    return(iter(self.apply()))
+
+  def __repr__(self):
+    return("TransformedOutline({:s})".format(repr(self.to_list())))
+
+  def to_list(self):
+    """ convert the transformed outline into the list format
+    """
+    return(outline_to_list(self.apply()))
+
+  def convert_like_outline(self, ai_outline):
+    """ return ai_outline (an OutlineArray) with the type of the original outline
+    """
+    r_outline = ai_outline
+    if(not isinstance(self.outline, OutlineArray)):
+      r_outline = ai_outline.to_list()
+    return(r_outline)
+
+  def shift_xy(self, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient):
+    """ compose cnc_outline.outline_shift_xy() with the pending transformation
+    """
+    if(self.outline_format==0):
+      if(abs(ai_x_coefficient)!=abs(ai_y_coefficient)):
+        six.print_(("WARN358: Warning, circle is scaled with different scale along x and y! {:0.2f} {:0.2f}".format(ai_x_coefficient, ai_y_coefficient)))
+    elif((ai_x_coefficient==0)or(ai_y_coefficient==0)):
+      six.print_(("ERR439: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient)))
+      sys.exit(2)
+    r_outline = TransformedOutline(self, shift_matrix(ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient))
+    return(r_outline)
+
+  def rotate(self, ai_ox, ai_oy, ai_rotation_angle):
+    """ compose cnc_outline.outline_rotate() with the pending transformation
+    """
+    r_outline = TransformedOutline(self, rotate_matrix(ai_ox, ai_oy, ai_rotation_angle))
+    return(r_outline)
+
+  def reverse(self):
+    """ cnc_outline.outline_reverse() of the transformed outline
+    """
+    r_outline = self.convert_like_outline(self.apply_array().reverse())
+    return(r_outline)
+
+  def close(self):
+    """ cnc_outline.outline_close() of the transformed outline
+    """
+    r_outline = self.convert_like_outline(self.apply_array().close())
+    return(r_outline)
+
+def transform_figure(ai_figure, ai_matrix):
+  """ return the figure with the pending transformation ai_matrix on each outline
+  """
+  r_figure = [TransformedOutline(ol, ai_matrix) for ol in ai_figure]
+  return(r_figure)
+
+################################################################
+# conversion functions
+################################################################
+
+def outline_to_array(ai_outline):
+  """ convert an outline of format-A, format-B or format-C into an OutlineArray
+      The int coordinates are converted into float
+  """
+  if(isinstance(ai_outline, OutlineArray)):
+    return(ai_outline)
+  if(isinstance(ai_outline, TransformedOutline)):
+    return(ai_outline.apply_array())
+  if(not isinstance(ai_outline, (tuple, list))):
+    print("ERR937: Error, ai_outline must be a list or a tuple")
+    sys.exit(2)
+  if(len(ai_outline)==0):
+    print("ERR075: Error, ai_outline should not be empty!")
+    sys.exit(2)
+  if(not isinstance(ai_outline[0], (tuple, list))): # circle
+    if(len(ai_outline)!=3):
+      six.print_(("ERR758: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_outline))))
+      sys.exit(2)
+    r_outline = OutlineArray(0, numpy.array([ai_outline[0:2]], dtype=float), numpy.empty((0,2)), numpy.empty(0, dtype=bool), numpy.array([ai_outline[2]], dtype=float))
+    return(r_outline)
+  outline_format = len(ai_outline[0])-1
+  if((outline_format!=1)and(outline_format!=2)):
+    six.print_(("ERR457: Error, the first point has an unexpected number of items {:d}".format(len(ai_outline[0]))))
+    sys.exit(2)
+  point_nb = len(ai_outline)
+  point = numpy.empty((point_nb, 2))
+  middle = numpy.empty((point_nb, 2))
+  arc = numpy.zeros(point_nb, dtype=bool)
+  value = None
+  if(outline_format==2):
+    value = numpy.empty(point_nb)
+  for i in range(point_nb):
+    segment = ai_outline[i]
+    len_segment = len(segment)
+    if(len_segment==outline_format+1):
+      point[i] = segment[0:2]
+      middle[i] = numpy.nan
+    elif((len_segment==outline_format+3)and(i>0)):
+      middle[i] = segment[0:2]
+      point[i] = segment[2:4]
+      arc[i] = True
+    else:
+      six.print_(("ERR563: Error, the segment {:d} is defined with an unexpected number of float {:d}".format(i, len_segment)))
+      sys.exit(2)
+    if(outline_format==2):
+      value[i] = segment[-1]
+  r_outline = OutlineArray(outline_format, point, middle, arc, value)
+  return(r_outline)
+
+def outline_to_list(ai_outline):
+  """ convert an OutlineArray or a TransformedOutline into a list of segments. A list of segments is returned unchanged
+  """
+  r_outline = ai_outline
+  if(isinstance(ai_outline, (OutlineArray, TransformedOutline))):
+    r_outline = ai_outline.to_list()
+  return(r_outline)
+
+def figure_to_array(ai_figure):
+  """ convert all outlines of a figure into OutlineArray
+  """
+  r_figure = [outline_to_array(ol) for ol in ai_figure]
+  return(r_figure)
+
+################################################################
+# outline_array testing
+################################################################
+
+def list_size(ai_outline):
+  """ approximative memory used by a list of segments
+  """
+  if(not isinstance(ai_outline[0], (tuple, list))):
+    return(sys.getsizeof(ai_outline)+sum(sys.getsizeof(v) for v in ai_outline))
+  r_size = sys.getsizeof(ai_outline)
+  for segment in ai_outline:
+    r_size += sys.getsizeof(segment)+sum(sys.getsizeof(v) for v in segment)
+  return(r_size)
+
+def outline_array_test1():
+  """ check the lossless conversion and compare the transformations with the list versions of cnc_outline.py
+  """
+  from . import cnc_outline # here to avoid a circular import
+  r_test = 1
+  ol_A = [(0,0,1), (20,0,2), (25,5,20,10,1), (0,10,0), (-5,5,0,0,0)]
+  ol_B = [(0,0), (20,0), (25,5,20,10), (0,10), (-5,5,0,0)]
+  ol_C = [(0,0,0.1), (20,0,0.2), (0,10,0.3)]
+  circle = (3,4,5)
+  for ol in (ol_A, ol_B, ol_C, circle):
+    ola = outline_to_array(ol)
+    if(ola.to_list()!=(list(ol) if isinstance(ol, list) else ol)):
+      six.print_(("ERR311: Error, outline_to_array() is not lossless for {:s}".format(str(ol))))
+      r_test = 0
+    if(cnc_outline.check_outline_format(ola)!=cnc_outline.check_outline_format(ol)):
+      six.print_(("ERR312: Error, check_outline_format() differs for {:s}".format(str(ol))))
+      r_test = 0
+    transforms = (
+      (cnc_outline.outline_shift_xy, (3.0, 2.0, -4.0, 0.5)),
+      (cnc_outline.outline_shift_xy, (3.0, -1.0, -4.0, 1.0)),
+      (cnc_outline.outline_rotate, (1.0, 2.0, 0.3)),
+      (cnc_outline.outline_reverse, ()))
+    for (fct, args) in transforms:
+      ref = fct(ol, *args)
+      new = fct(ola, *args).to_list()
+      if(isinstance(ref, list)):
+        ref = [tuple(s) for s in ref]
+      if(ref!=new):
+        six.print_(("ERR313: Error, {:s} differs for {:s}: {:s} {:s}".format(fct.__name__, str(ol), str(ref), str(new))))
+        r_test = 0
+    # composed transformations
+    ref = cnc_outline.outline_shift_xy(cnc_outline.outline_rotate(cnc_outline.outline_shift_xy(ol, 3.0, -1.0, -4.0, 1.0), 1.0, 2.0, 0.3), 2.0, 1.0, 1.0, 1.0)
+    new = cnc_outline.outline_shift_xy(cnc_outline.outline_rotate(cnc_outline.outline_shift_xy(TransformedOutline(ol), 3.0, -1.0, -4.0, 1.0), 1.0, 2.0, 0.3), 2.0, 1.0, 1.0, 1.0)
+    (ref_a, new_a) = (outline_to_array(ref), outline_to_array(new))
+    max_diff = max(numpy.max(numpy.abs(ref_a.point-new_a.point)), numpy.max(numpy.abs(numpy.nan_to_num(ref_a.middle)-numpy.nan_to_num(new_a.middle)), initial=0))
+    if(max_diff>1e-9):
+      six.print_(("ERR314: Error, TransformedOutline differs for {:s}: {:s} {:s}".format(str(ol), str(ref), str(new.to_list()))))
+      r_test = 0
+  # memory and speed comparison
+  big_ol = [(0.0, 0.0, 1.0)]
+  for i in range(1, 10000):
+    if(i%2):
+      big_ol.append((float(i), 1.0, 1.0))
+    else:
+      big_ol.append((i-0.5, 2.0, float(i), 0.0, 1.0))
+  big_ola = outline_to_array(big_ol)
+  t0 = time.time()
+  cnc_outline.outline_rotate(big_ol, 1.0, 2.0, 0.3)
+  t1 = time.time()
+  cnc_outline.outline_rotate(big_ola, 1.0, 2.0, 0.3)
+  t2 = time.time()
+  six.print_(("memory: list {:d} bytes  OutlineArray {:d} bytes".format(list_size(big_ol), big_ola.nbytes())))
+  six.print_(("outline_rotate: list {:0.4f} s  OutlineArray {:0.4f} s".format(t1-t0, t2-t1)))
+  return(r_test)
+
+################################################################
+# outline_array command line interface
+################################################################
+
+def outline_array_cli(ai_args=""):
+  """ command line interface of outline_array.py when it is used in standalone
+  """
+  oa_parser = argparse.ArgumentParser(description='Test the OutlineArray class.')
+  oa_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It checks the conversions and the transformations of OutlineArray.')
+  effective_args = design_help.get_effective_args(ai_args)
+  oa_args = oa_parser.parse_args(effective_args)
+  r_oa = 1
+  if(oa_args.sw_test1):
+    r_oa = outline_array_test1()
+  return(r_oa)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  # cnc_outline checks the outline types with the classes of the imported module cnc25d.outline_array, not with the classes of __main__
+  from cnc25d import outline_array
+  outline_array.outline_array_cli("--test1")
+
@@ -35,9 +35,7 @@ outline_backends.py provides a common API to create lines, arcs and circles with
 # header for Python / FreeCAD compatibility
 ################################################################
 
-from . import importing_freecad
 import six
-importing_freecad.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -47,16 +45,18 @@ importing_freecad.importing_freecad()
 # import
 ################################################################
 
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 import math
 import sys, argparse
 import svgwrite
 from dxfwrite import DXFEngine
-from six.moves import tkinter
+from .lazy_import import tkinter
 import time # for time.sleep to help Tkinter to finish properly
 from . import display_backend
 from . import cnc_outline # just used in figure_simple_display() for cnc_outline.outline_rotate, closed(), check_outline_format() and ideal_outline()
+from . import outline_array
+from .cnc_outline import arc_3_points_to_radius_center_angles, Arc_Geometry_Outline, outline_arc_geometry, segment_arc_geometry, normalize_angle, arc_geometry_transform # the arc geometry is computed by cnc_outline
 from . import export_2d # just for test enhancement
 from . import design_help # just for get_effective_args() and mkdir_p
 
@@ -69,14 +69,35 @@ unit_circle_resolution = 12 #6
 #default_dxf_layer_name = 'CNC25D'
 global_epsilon_length = math.pi/1000
 global_epsilon_angle = math.pi/10000
+freecad_single_face = True # extrude the holes of figure_to_freecad_25d_part() as inner wires of one face
 
 ################################################################
 # ******** sub-functions for the API ***********
 ################################################################
 
-def complete_circle(ai_center, ai_radius, ai_resolution):
+def chord_angle_resolution(ai_radius, ai_chord_tolerance):
+  """ Return the largest step angle such as the distance between an arc of radius ai_radius and its chord is smaller than ai_chord_tolerance
+  """
+  if(ai_chord_tolerance<=0):
+    six.print_(("ERR822: Error, the chord tolerance {:0.3f} is negative or null!".format(ai_chord_tolerance)))
+    sys.exit(2)
+  r_angle = math.pi # sagitta of a half-circle
+  if(ai_chord_tolerance<ai_radius):
+    r_angle = 2*math.acos(1-ai_chord_tolerance/ai_radius)
+  return(r_angle)
+
+def pixel_chord_tolerance(ai_pixel_error, ai_scale_coef):
+  """ Convert a maximal error in pixel into a chord tolerance in the outline unit
+      ai_scale_coef is the tuple (lx, kx, ly, ky) of display_backend.compute_scale_coef()
+  """
+  (lx, kx, ly, ky) = ai_scale_coef
+  r_tolerance = ai_pixel_error/max(abs(lx), abs(ly))
+  return(r_tolerance)
+
+def complete_circle(ai_center, ai_radius, ai_resolution, ai_chord_tolerance=None):
   """ Generate a list of points that creates a circle with the resolution ai_resolution.
       ai_resolution sets the mamximum number of intermediate points to create
+      If ai_chord_tolerance is set, the number of points is computed to keep the distance between the circle and the polyline smaller than ai_chord_tolerance
   """
   r_points = []
   # calculation of the angle resolution:
@@ -84,147 +105,30 @@ def complete_circle(ai_center, ai_radius, ai_resolution):
     six.print_(("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution)))
     sys.exit(2)
   #print("dbg424: ai_radius:", ai_radius)
-  circle_resolution = int(ai_resolution * ai_radius) # circle resolution increase with the radius
+  if(ai_chord_tolerance is None):
+    circle_resolution = int(ai_resolution * ai_radius) # circle resolution increase with the radius
+  else:
+    circle_resolution = max(3, int(math.ceil(2*math.pi/chord_angle_resolution(ai_radius, ai_chord_tolerance)))) # circle resolution increase with the curvature
   angle_resolution = 2*math.pi/circle_resolution
   # create the list of points
   for i in range(circle_resolution):
     r_points.append([ai_center[0]+ai_radius*math.cos(i*angle_resolution), ai_center[1]+ai_radius*math.sin(i*angle_resolution)])
   return(r_points)
 
-def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
-  """ From three points (A,B,C: equivalent to 6 floats) computes the radius, the center (I) and the angles ((Ix,IA), (Ix,IB), (Ix,IC)) of the arc passing through A, B and C
-  """
-  # interpretation of the three points
-  ptax = ai_start[0]
-  ptay = ai_start[1]
-  ptbx = ai_middle[0]
-  ptby = ai_middle[1]
-  ptcx = ai_end[0]
-  ptcy = ai_end[1]
-  #print("dbg501: pta: {:6.01f}  {:6.01f}".format(ptax, ptay))
-  #print("dbg502: ptb: {:6.01f}  {:6.01f}".format(ptbx, ptby))
-  #print("dbg503: ptc: {:6.01f}  {:6.01f}".format(ptcx, ptcy))
-  # epsilon definiton to be tolerant to calculation imprecision
-  #epsilon = math.pi/1000 # can be used to compare radian and sine
-  length_epsilon = global_epsilon_length # to speed up run time
-  angle_epsilon = global_epsilon_angle # to speed up run time
-  #print("dbg747: length_epsilon:", length_epsilon)
-  # check
-  if((ptax==ptbx)and(ptay==ptby)):
-    print("ERR807: Error, point_A and point_B are identical!")
-    sys.exit(2)
-  if((ptbx==ptcx)and(ptby==ptcy)):
-    print("ERR808: Error, point_B and point_C are identical!")
-    sys.exit(2)
-  if((ptax==ptcx)and(ptay==ptcy)):
-    print("ERR809: Error, point_A and point_C are identical!")
-    sys.exit(2)
-  ## check the documentation for the explanation of the following calculation
-  # length of [AB] and [BC]
-  lab = math.sqrt((ptbx-ptax)**2+(ptby-ptay)**2)
-  lbc = math.sqrt((ptcx-ptbx)**2+(ptcy-ptby)**2)
-  if(lab<length_epsilon):
-    print("ERR811: Error, A and B are almost identical")
-    six.print_(("dbg559: pta={:0.2f} {:0.2f}  ptb={:0.2f} {:0.2f}  ptc={:0.2f} {:0.2f}".format(ptax, ptay, ptbx, ptby, ptcx, ptcy)))
-    sys.exit(2)
-  if(lbc<length_epsilon):
-    print("ERR812: Error, B and C are almost identical")
-    sys.exit(2)
-  # calculation of cos(e), cos(f), sin(e) and sin(f)
-  cos_e = (ptbx-ptax)/lab
-  cos_f = (ptcx-ptbx)/lbc
-  sin_e = (ptby-ptay)/lab
-  sin_f = (ptcy-ptby)/lbc
-  #print("dbg304: cos_e: ", cos_e)
-  #print("dbg305: sin_e: ", sin_e)
-  #print("dbg306: cos_f: ", cos_f)
-  #print("dbg307: sin_f: ", sin_f)
-  is_colinear = (math.copysign(1, sin_e)*cos_e)-(math.copysign(1,sin_f)*cos_f)
-  #print("dbg556: is_colinear:", is_colinear)
-  if(abs(is_colinear)<angle_epsilon):
-    #print("ERR810: Error, A, B, C are colinear. Arc can not be created!")
-    #sys.exit(2)
-    if(lab>100*length_epsilon):
-      pass # to let comment the following warning
-      #print("WARN810: Arc ABC is replaced by the line AC, because A,B,C are colinear!")
-      #print("dbg559: A= {:0.2f} {:0.2f}  B= {:0.2f} {:0.2f}  C= {:0.2f} {:0.2f}".format(ptax, ptay, ptbx, ptby, ptcx, ptcy))
-      #print("dbg558: is_colinear:", is_colinear)
-      #print("dbg557: lab:", lab)
-    r_a3ptrca = (0, 0, 0, 0, 0, 0, 0, 0, 0)
-    return(r_a3ptrca)
-  # Calculation of M and N
-  ptmx = (ptax+ptbx)/2
-  ptmy = (ptay+ptby)/2
-  ptnx = (ptbx+ptcx)/2
-  ptny = (ptby+ptcy)/2
-  #print("dbg134: ptmx:", ptmx)
-  #print("dbg135: ptmy:", ptmy)
-  #print("dbg136: ptnx:", ptnx)
-  #print("dbg137: ptny:", ptny)
-  # calculation of I
-  lix = cos_e*sin_f-cos_f*sin_e
-  kix = sin_f*(cos_e*ptmx+sin_e*ptmy)-sin_e*(cos_f*ptnx+sin_f*ptny)
-  liy = sin_e*cos_f-sin_f*cos_e
-  kiy = cos_f*(cos_e*ptmx+sin_e*ptmy)-cos_e*(cos_f*ptnx+sin_f*ptny)
-  if(abs(lix)<angle_epsilon):
-    print("ERR813: Error, A, B and C are almost colinear. Arc can not be created!")
-    sys.exit(2)
-  if(abs(liy)<angle_epsilon):
-    print("ERR814: Error, A, B and C are almost colinear. Arc can not be created!")
-    sys.exit(2)
-  #print("dbg124: lix:", lix)
-  #print("dbg125: kix:", kix)
-  #print("dbg126: liy:", liy)
-  #print("dbg127: kiy:", kiy)
-  ptix = kix / lix
-  ptiy = kiy / liy
-  #print("dbg505: pti: {:6.02f}  {:6.02f}".format(ptix, ptiy))
-  # length of [IA], [IB] and [IC]
-  lia = math.sqrt((ptax-ptix)**2+(ptay-ptiy)**2)
-  lib = math.sqrt((ptbx-ptix)**2+(ptby-ptiy)**2)
-  lic = math.sqrt((ptcx-ptix)**2+(ptcy-ptiy)**2)
-  if(abs(lib-lia)>length_epsilon):
-    #print("dbg404: lia:", lia)
-    #print("dbg405: lib:", lib)
-    print("ERR815: I is not equidistant from A and B!")
-    sys.exit(2)
-  if(abs(lic-lib)>length_epsilon):
-    #print("dbg402: lib:", lib)
-    #print("dbg403: lic:", lic)
-    print("ERR816: I is not equidistant from B and C!")
-    sys.exit(2)
-  # calculation of the angle u=(Ix, IA) , v=(Ix, IB) and w=(Ix, IC)
-  u = math.atan2(ptay-ptiy, ptax-ptix)
-  v = math.atan2(ptby-ptiy, ptbx-ptix)
-  w = math.atan2(ptcy-ptiy, ptcx-ptix)
-  # calculation of the angle uv=(IA, IB), uw=(IA, IC) vw=(IB, IC)
-  uv = math.fmod(v-u+4*math.pi, 2*math.pi)
-  uw = math.fmod(w-u+4*math.pi, 2*math.pi)
-  vw = math.fmod(w-v+4*math.pi, 2*math.pi)
-  # check arc direction
-  ccw_ncw = 1
-  if(uw>uv):
-    #print("dbg874: arc of circle direction: counter clock wise (CCW)")
-    ccw_ncw = 1
-  else:
-    #print("dbg875: arc of circle direction: clock wise (CW)")
-    ccw_ncw = 0
-    uv = uv - 2*math.pi
-    vw = vw - 2*math.pi
-    uw = uw - 2*math.pi
-  r_a3ptrca = (lia, ptix, ptiy, u, v, w, uv, vw, uw)
-  return(r_a3ptrca)
-
-def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution):
+def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution, ai_chord_tolerance=None, ai_arc_geometry=None):
   """ From three points (list of 6 floats) creates a polyline (list of 2*n floats) representing the arc of circle defined by the three points
       ai_resolution sets the maximum number of intermediate points to create
+      If ai_chord_tolerance is set, the number of points is computed to keep the distance between the arc and the polyline smaller than ai_chord_tolerance
+      ai_arc_geometry is the optional result of arc_3_points_to_radius_center_angles() if it is already known
   """
   ### precision
   #epsilon = math.pi/1000 # can be used to compare radian and sine
   #length_epsilon = global_epsilon_length # to speed up run time
   #angle_epsilon = global_epsilon_angle # to speed up run time
   ### get radius, center and angles
-  (lia, ptix, ptiy, u, v, w, uv, vw, uw) = arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end)
+  if(ai_arc_geometry is None):
+    ai_arc_geometry = arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end)
+  (lia, ptix, ptiy, u, v, w, uv, vw, uw) = ai_arc_geometry
   ### colinear case
   if(lia==0):
     r_polyline = (ai_start, ai_end)
@@ -235,8 +139,11 @@ def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution):
     six.print_(("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution)))
     sys.exit(2)
   #print("dbg414: arc radius: lia:", lia)
-  circle_resolution = ai_resolution * lia # angle resolution increase with the radius
-  ar = 2*math.pi/circle_resolution
+  if(ai_chord_tolerance is None):
+    circle_resolution = ai_resolution * lia # angle resolution increase with the radius
+    ar = 2*math.pi/circle_resolution
+  else:
+    ar = chord_angle_resolution(lia, ai_chord_tolerance) # angle resolution increase with the curvature
   # number of intermediate point between A and B and step angle
   abip = int(abs(uv)/ar)
   absa = uv/(abip+1)
@@ -327,7 +234,7 @@ def outline_arc_line_with_svgwrite(ai_segments, ai_outline_closed):
       #svg_line.stroke('black', width=1)
       svg_outline.append(svg_line)
     elif(segment_type=='arc'):
-      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = arc_3_points_to_radius_center_angles(point_start, point_mid, point_end)
+      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = segment_arc_geometry(ai_segments, i+1, point_start, point_mid, point_end)
       large_arc_flag = 0
       if(abs(uw)>math.pi):
         large_arc_flag = 1
@@ -382,7 +289,7 @@ def outline_arc_line_with_dxfwrite(ai_segments, ai_outline_closed):
       dxf_line = DXFEngine.line(start=point_start, end=point_end)
       dxf_outline.append(dxf_line)
     elif(segment_type=='arc'):
-      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = arc_3_points_to_radius_center_angles(point_start, point_mid, point_end)
+      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = segment_arc_geometry(ai_segments, i+1, point_start, point_mid, point_end)
       u2 = u
       w2 = u + uw
       if(uw<0):
@@ -406,7 +313,7 @@ def outline_arc_line_with_dxfwrite(ai_segments, ai_outline_closed):
   r_outline = dxf_outline
   return(r_outline)
 
-def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
+def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed, ai_chord_tolerance=None):
   """ Transform the arcs and lines outlines into tkinter lines
   """
   tkline_points = [tuple((ai_segments[0][0], ai_segments[0][1]))]
@@ -433,7 +340,7 @@ def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
       tkinter_line = (point_start[0], point_start[1], point_end[0], point_end[1])
       tkline_outline.append(tkinter_line)
     elif(segment_type=='arc'):
-      arc_polyline = arc_of_circle(point_start, point_mid, point_end, unit_circle_resolution)
+      arc_polyline = arc_of_circle(point_start, point_mid, point_end, unit_circle_resolution, ai_chord_tolerance, segment_arc_geometry(ai_segments, i+1, point_start, point_mid, point_end))
       arc_polyline_tk = []
       for i in range(len(arc_polyline)-1):
         arc_polyline_tk.append((arc_polyline[i][0], arc_polyline[i][1], arc_polyline[i+1][0], arc_polyline[i+1][1]))
@@ -441,10 +348,10 @@ def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
   r_outline = tuple(tkline_outline)
   return(r_outline)
 
-def outline_circle_with_tkinter(ai_center, ai_radius):
+def outline_circle_with_tkinter(ai_center, ai_radius, ai_chord_tolerance=None):
   """ Transform the circle outline into tkinter lines
   """
-  circle_points = complete_circle(ai_center, ai_radius, unit_circle_resolution)
+  circle_points = complete_circle(ai_center, ai_radius, unit_circle_resolution, ai_chord_tolerance)
   circle_polyline_tk = []
   for i in range(len(circle_points)-1):
     circle_polyline_tk.append((circle_points[i][0], circle_points[i][1], circle_points[i+1][0], circle_points[i+1][1]))
@@ -452,9 +359,10 @@ def outline_circle_with_tkinter(ai_center, ai_radius):
   r_outline = tuple(circle_polyline_tk)
   return(r_outline)
 
-def outline_circle(ai_center, ai_radius, ai_backend):
+def outline_circle(ai_center, ai_radius, ai_backend, ai_chord_tolerance=None):
   """ Generates a circle according to the selected backend.
       Possible backend: freecad, mozman dxfwrite, mozman svgwrite, Tkinter.
+      ai_chord_tolerance is only used by the backends that approximate the circle with lines (Tkinter)
   """
   #r_outline = ''
   # check the radius
@@ -472,7 +380,7 @@ def outline_circle(ai_center, ai_radius, ai_backend):
     dxf_circle = DXFEngine.circle(radius=ai_radius, center=(ai_center[0], ai_center[1]))
     r_outline = [dxf_circle] # circle wrapped in list to help the integration in the function write_figure_in_dxf()
   elif(ai_backend=='tkinter'):
-    r_outline = outline_circle_with_tkinter(ai_center, ai_radius)
+    r_outline = outline_circle_with_tkinter(ai_center, ai_radius, ai_chord_tolerance)
   return(r_outline)
 
 ################################################################
@@ -481,9 +389,12 @@ def outline_circle(ai_center, ai_radius, ai_backend):
 
 ### outline level function
 
-def outline_arc_line(ai_segments, ai_backend):
+def outline_arc_line(ai_segments, ai_backend, ai_chord_tolerance=None):
   """ Generates the arcs and lines outline according to the selected backend
       Possible backend: freecad, mozman dxfwrite, mozman svgwrite, Tkinter.
+      The backends approximating the arcs with lines (Tkinter) use ai_chord_tolerance:
+      if None, the number of points of an arc increases with its radius (unit_circle_resolution),
+      else it is the maximal distance between an arc and its polyline (use pixel_chord_tolerance() for a maximal error in pixel)
       ai_segments is a list of segments (ie line or arc)
       If ai_segments is a list/tuple of list/tuple, it's a list of segments (ie line or arc)
       a segment starts from the last point of the previous segment.
@@ -499,6 +410,8 @@ def outline_arc_line(ai_segments, ai_backend):
   r_outline = ''
   #print("dbg204: len(ai_segments):", len(ai_segments))
   #print("dbg205: ai_backend:", ai_backend)
+  # an OutlineArray is converted into the list format
+  ai_segments = outline_array.outline_to_list(ai_segments)
   # check is ai_segments is a list or a tuple
   if(not isinstance(ai_segments, (tuple, list))):
     print("ERR337: Error, ai_segments must be a list or a tuple")
@@ -535,25 +448,25 @@ def outline_arc_line(ai_segments, ai_backend):
     elif(ai_backend=='dxfwrite'):
       r_outline = outline_arc_line_with_dxfwrite(outline_B, outline_closed)
     elif(ai_backend=='tkinter'):
-      r_outline = outline_arc_line_with_tkinter(outline_B, outline_closed)
+      r_outline = outline_arc_line_with_tkinter(outline_B, outline_closed, ai_chord_tolerance)
   else: # circle outline
     if(len(ai_segments)!=3):
       six.print_(("ERR658: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_segments))))
       six.print_(("dbg368: ai_segments:", ai_segments))
       sys.exit(2)
-    r_outline = outline_circle((ai_segments[0], ai_segments[1]), ai_segments[2], ai_backend)
+    r_outline = outline_circle((ai_segments[0], ai_segments[1]), ai_segments[2], ai_backend, ai_chord_tolerance)
   return(r_outline)
 
 # inherited from display_backend
 Two_Canvas = display_backend.Two_Canvas
+Frame_Cache = display_backend.Frame_Cache
+Curve_Table = display_backend.Curve_Table
 
 ### figure level functions
 
-def figure_simple_display(ai_figure, ai_overlay_figure=[], ai_parameter_info=""):
-  """ Display the figure with red lines in the Tkinter Two_Canvas GUI
-      If you want a finer control on the way outlines are displayed (color, width, overlay), you need to work at the outline level (not figure level)
+def figure_simple_display_graphics(ai_figure, ai_overlay_figure=[], ai_chord_tolerance=None):
+  """ create the canvas-graphic function of figure_simple_display() used by Two_Canvas or by offscreen_backend
   """
-  print("Figure simple display with Tkinter")
   # convert all outlines in format-B
   # graphic layer
   graphic_figure = []
@@ -575,9 +488,6 @@ def figure_simple_display(ai_figure, ai_overlay_figure=[], ai_parameter_info="")
     else:
       overlay_figure.append(i_outline)
     i += 1
-  # start GUI
-  tk_root = tkinter.Tk()
-  fsd_canvas = Two_Canvas(tk_root)
   # callback function for display_backend
   def sub_fsd_canvas_graphics(ai_rotation_direction, ai_angle_position):
     # angle position
@@ -586,12 +496,24 @@ def figure_simple_display(ai_figure, ai_overlay_figure=[], ai_parameter_info="")
     r_canvas_graphics = []
     for ol in overlay_figure:
       rotated_ol = cnc_outline.outline_rotate(ol, 0, 0, l_angle_position) # rotation of center (0,0) and angle l_angle_position
-      r_canvas_graphics.append(('overlay_lines', outline_arc_line(rotated_ol, 'tkinter'), 'orange', 2))
+      r_canvas_graphics.append(('overlay_lines', outline_arc_line(rotated_ol, 'tkinter', ai_chord_tolerance), 'orange', 2))
     for ol in graphic_figure:
       rotated_ol = cnc_outline.outline_rotate(ol, 0, 0, l_angle_position) # rotation of center (0,0) and angle l_angle_position
-      r_canvas_graphics.append(('graphic_lines', outline_arc_line(rotated_ol, 'tkinter'), 'red', 1))
+      r_canvas_graphics.append(('graphic_lines', outline_arc_line(rotated_ol, 'tkinter', ai_chord_tolerance), 'red', 1))
     return(r_canvas_graphics)
   # end of callback function
+  return(sub_fsd_canvas_graphics)
+
+def figure_simple_display(ai_figure, ai_overlay_figure=[], ai_parameter_info="", ai_chord_tolerance=None):
+  """ Display the figure with red lines in the Tkinter Two_Canvas GUI
+      If you want a finer control on the way outlines are displayed (color, width, overlay), you need to work at the outline level (not figure level)
+      ai_chord_tolerance selects the arc approximation of outline_arc_line()
+  """
+  print("Figure simple display with Tkinter")
+  sub_fsd_canvas_graphics = figure_simple_display_graphics(ai_figure, ai_overlay_figure, ai_chord_tolerance)
+  # start GUI
+  tk_root = tkinter.Tk()
+  fsd_canvas = Two_Canvas(tk_root)
   fsd_canvas.add_canvas_graphic_function(sub_fsd_canvas_graphics)
   fsd_canvas.add_parameter_info(ai_parameter_info)
   tk_root.mainloop()
@@ -624,6 +546,231 @@ def write_figure_in_dxf(ai_figure, ai_filename):
   object_dxf.save()
   return(0)
 
+################################################################
+# ******** streaming SVG writer ***************
+################################################################
+
+svg_stream_buffer_size = 1<<16 # size of the write buffer of the SVG file
+
+def svg_number(ai_value):
+  """ format a coordinate for the SVG path data
+  """
+  r_txt = "{:.10g}".format(ai_value)
+  return(r_txt)
+
+def stream_outline(ai_segments, ai_error_msg_id):
+  """ prepare an outline for the streaming writers
+      It returns the tuple (circle, segments): circle is True for a format-B circle. A format-A outline is converted in format-B.
+  """
+  r_segments = outline_array.outline_to_list(ai_segments)
+  outline_type = cnc_outline.check_outline_format(r_segments)
+  if(outline_type==0):
+    if(r_segments[2]<=0):
+      six.print_(("ERR409: Error, the radius {:0.3f} is negative or null!".format(r_segments[2])))
+      sys.exit(2)
+  elif(outline_type==2):
+    print("WARN231: warning, format-A or format-C used in outline_arc_line() and must be converted in format-B with ideal_outline()")
+    r_segments = cnc_outline.ideal_outline(r_segments, ai_error_msg_id)
+  r_stream_outline = ((outline_type==0), r_segments)
+  return(r_stream_outline)
+
+def write_outline_in_svg_stream(ai_segments, ai_file):
+  """ write a format-B outline as one SVG path (or circle) in the file object ai_file
+      The arcs are written with the native SVG A command, so nothing is approximated
+  """
+  (circle, ai_segments) = stream_outline(ai_segments, "write_outline_in_svg_stream")
+  if(circle):
+    ai_file.write('<circle cx="{:s}" cy="{:s}" r="{:s}" />\n'.format(svg_number(ai_segments[0]), svg_number(ai_segments[1]), svg_number(ai_segments[2])))
+    return(0)
+  outline_closed = ((ai_segments[0][0]==ai_segments[-1][-2])and(ai_segments[0][1]==ai_segments[-1][-1]))
+  segment_nb = len(ai_segments)-1
+  ai_file.write('<path d="M{:s},{:s}'.format(svg_number(ai_segments[0][0]), svg_number(ai_segments[0][1])))
+  point_start = (ai_segments[0][0], ai_segments[0][1])
+  for i in range(segment_nb):
+    segment = ai_segments[i+1]
+    point_end = (segment[-2], segment[-1])
+    if(outline_closed and (i==segment_nb-1)):
+      point_end = (ai_segments[0][0], ai_segments[0][1])
+    if(len(segment)==4):
+      point_mid = (segment[0], segment[1])
+      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = segment_arc_geometry(ai_segments, i+1, point_start, point_mid, point_end)
+      if(lia==0): # the three points are colinear
+        ai_file.write(' L{:s},{:s}'.format(svg_number(point_end[0]), svg_number(point_end[1])))
+      else:
+        large_arc_flag = 0
+        if(abs(uw)>math.pi):
+          large_arc_flag = 1
+        sweep_flag = 1
+        if(uw<0):
+          sweep_flag = 0
+        ai_file.write(' A{:s},{:s} 0 {:d},{:d} {:s},{:s}'.format(svg_number(lia), svg_number(lia), large_arc_flag, sweep_flag, svg_number(point_end[0]), svg_number(point_end[1])))
+    else:
+      ai_file.write(' L{:s},{:s}'.format(svg_number(point_end[0]), svg_number(point_end[1])))
+    point_start = point_end
+  if(outline_closed):
+    ai_file.write(' Z')
+  ai_file.write('" />\n')
+  return(0)
+
+def write_figure_in_svg_stream(ai_figure, ai_filename):
+  """ Generate the SVG file ai_filename from the figure ai_figure (list of format B outline) without svgwrite
+      Each outline is written as one path directly in the buffered file, so the memory use doesn't depend on the size of the figure
+  """
+  six.print_(("Generate the SVG file {:s}".format(ai_filename)))
+  with open(ai_filename, 'w', svg_stream_buffer_size) as svg_file:
+    svg_file.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+    svg_file.write('<svg baseProfile="full" height="100%" version="1.1" width="100%" xmlns="http://www.w3.org/2000/svg">\n')
+    svg_file.write('<g fill="none" stroke="black" stroke-width="1">\n')
+    for i_ol in ai_figure:
+      write_outline_in_svg_stream(i_ol, svg_file)
+    svg_file.write('</g>\n</svg>\n')
+  return(0)
+
+################################################################
+# ******** streaming DXF writer ***************
+################################################################
+
+dxf_stream_buffer_size = 1<<16 # size of the write buffer of the DXF file
+dxf_stream_layer = '0'
+dxf_stream_first_handle = 0x100 # handle of the first entity. The lower handles are used by the tables, the blocks and the objects
+dxf_stream_model_space_handle = '1F' # handle of the BLOCK_RECORD *Model_Space, owner of the entities
+# minimal DXF R2000 (AC1015) structure required by AutoCAD and the strict DXF readers: one line per table, record, block or object
+dxf_stream_r2000_header = "0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1015\n9\n$HANDSEED\n5\n{:s}\n9\n$INSUNITS\n70\n4\n0\nENDSEC\n0\nSECTION\n2\nCLASSES\n0\nENDSEC\n"
+dxf_stream_r2000_tables = (
+  "0\nSECTION\n2\nTABLES\n"
+  "0\nTABLE\n2\nVPORT\n5\n8\n330\n0\n100\nAcDbSymbolTable\n70\n0\n0\nENDTAB\n"
+  "0\nTABLE\n2\nLTYPE\n5\n5\n330\n0\n100\nAcDbSymbolTable\n70\n3\n"
+  "0\nLTYPE\n5\n14\n330\n5\n100\nAcDbSymbolTableRecord\n100\nAcDbLinetypeTableRecord\n2\nByBlock\n70\n0\n3\n\n72\n65\n73\n0\n40\n0.0\n"
+  "0\nLTYPE\n5\n15\n330\n5\n100\nAcDbSymbolTableRecord\n100\nAcDbLinetypeTableRecord\n2\nByLayer\n70\n0\n3\n\n72\n65\n73\n0\n40\n0.0\n"
+  "0\nLTYPE\n5\n16\n330\n5\n100\nAcDbSymbolTableRecord\n100\nAcDbLinetypeTableRecord\n2\nContinuous\n70\n0\n3\nSolid line\n72\n65\n73\n0\n40\n0.0\n"
+  "0\nENDTAB\n"
+  "0\nTABLE\n2\nLAYER\n5\n2\n330\n0\n100\nAcDbSymbolTable\n70\n1\n"
+  "0\nLAYER\n5\n10\n330\n2\n100\nAcDbSymbolTableRecord\n100\nAcDbLayerTableRecord\n2\n0\n70\n0\n62\n7\n6\nContinuous\n"
+  "0\nENDTAB\n"
+  "0\nTABLE\n2\nSTYLE\n5\n3\n330\n0\n100\nAcDbSymbolTable\n70\n1\n"
+  "0\nSTYLE\n5\n11\n330\n3\n100\nAcDbSymbolTableRecord\n100\nAcDbTextStyleTableRecord\n2\nStandard\n70\n0\n40\n0.0\n41\n1.0\n50\n0.0\n71\n0\n42\n2.5\n3\ntxt\n4\n\n"
+  "0\nENDTAB\n"
+  "0\nTABLE\n2\nVIEW\n5\n6\n330\n0\n100\nAcDbSymbolTable\n70\n0\n0\nENDTAB\n"
+  "0\nTABLE\n2\nUCS\n5\n7\n330\n0\n100\nAcDbSymbolTable\n70\n0\n0\nENDTAB\n"
+  "0\nTABLE\n2\nAPPID\n5\n9\n330\n0\n100\nAcDbSymbolTable\n70\n1\n"
+  "0\nAPPID\n5\n12\n330\n9\n100\nAcDbSymbolTableRecord\n100\nAcDbRegAppTableRecord\n2\nACAD\n70\n0\n"
+  "0\nENDTAB\n"
+  "0\nTABLE\n2\nDIMSTYLE\n5\nA\n330\n0\n100\nAcDbSymbolTable\n70\n1\n100\nAcDbDimStyleTable\n71\n1\n340\n27\n"
+  "0\nDIMSTYLE\n105\n27\n330\nA\n100\nAcDbSymbolTableRecord\n100\nAcDbDimStyleTableRecord\n2\nStandard\n70\n0\n340\n11\n"
+  "0\nENDTAB\n"
+  "0\nTABLE\n2\nBLOCK_RECORD\n5\n1\n330\n0\n100\nAcDbSymbolTable\n70\n2\n"
+  "0\nBLOCK_RECORD\n5\n1F\n330\n1\n100\nAcDbSymbolTableRecord\n100\nAcDbBlockTableRecord\n2\n*Model_Space\n"
+  "0\nBLOCK_RECORD\n5\n1B\n330\n1\n100\nAcDbSymbolTableRecord\n100\nAcDbBlockTableRecord\n2\n*Paper_Space\n"
+  "0\nENDTAB\n"
+  "0\nENDSEC\n")
+dxf_stream_r2000_blocks = (
+  "0\nSECTION\n2\nBLOCKS\n"
+  "0\nBLOCK\n5\n20\n330\n1F\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockBegin\n2\n*Model_Space\n70\n0\n10\n0.0\n20\n0.0\n30\n0.0\n3\n*Model_Space\n1\n\n"
+  "0\nENDBLK\n5\n21\n330\n1F\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockEnd\n"
+  "0\nBLOCK\n5\n1C\n330\n1B\n100\nAcDbEntity\n67\n1\n8\n0\n100\nAcDbBlockBegin\n2\n*Paper_Space\n70\n0\n10\n0.0\n20\n0.0\n30\n0.0\n3\n*Paper_Space\n1\n\n"
+  "0\nENDBLK\n5\n1D\n330\n1B\n100\nAcDbEntity\n67\n1\n8\n0\n100\nAcDbBlockEnd\n"
+  "0\nENDSEC\n")
+dxf_stream_r2000_objects = (
+  "0\nSECTION\n2\nOBJECTS\n"
+  "0\nDICTIONARY\n5\nC\n330\n0\n100\nAcDbDictionary\n281\n1\n3\nACAD_GROUP\n350\nD\n"
+  "0\nDICTIONARY\n5\nD\n330\nC\n100\nAcDbDictionary\n281\n1\n"
+  "0\nENDSEC\n")
+
+def dxf_number(ai_value):
+  """ format a coordinate for the DXF group values
+  """
+  r_txt = "{:.10g}".format(ai_value)
+  return(r_txt)
+
+def outline_bulge(ai_segments):
+  """ return the list of vertices (x, y, bulge) of a format-B general outline
+      The bulge of a vertex is tan(arc_angle/4) of the arc starting at this vertex (0 for a line, positive for counter clock wise)
+      If the outline is closed, the last point (equal to the first one) is not included
+  """
+  outline_closed = ((ai_segments[0][0]==ai_segments[-1][-2])and(ai_segments[0][1]==ai_segments[-1][-1]))
+  segment_nb = len(ai_segments)-1
+  r_vertices = []
+  point_start = (ai_segments[0][0], ai_segments[0][1])
+  for i in range(segment_nb):
+    segment = ai_segments[i+1]
+    point_end = (segment[-2], segment[-1])
+    if(outline_closed and (i==segment_nb-1)):
+      point_end = (ai_segments[0][0], ai_segments[0][1])
+    bulge = 0
+    if(len(segment)==4):
+      (lia, ptix, ptiy, u, v, w, uv, vw, uw) = segment_arc_geometry(ai_segments, i+1, point_start, (segment[0], segment[1]), point_end)
+      if(lia!=0): # not colinear
+        bulge = math.tan(uw/4)
+    r_vertices.append((point_start[0], point_start[1], bulge))
+    point_start = point_end
+  if(not outline_closed):
+    r_vertices.append((point_start[0], point_start[1], 0))
+  return(r_vertices)
+
+def write_outline_in_dxf_stream(ai_segments, ai_file, ai_handle):
+  """ write a format-B outline as one LWPOLYLINE (or CIRCLE) entity with the handle ai_handle in the file object ai_file
+  """
+  (circle, ai_segments) = stream_outline(ai_segments, "write_outline_in_dxf_stream")
+  entity_head = "5\n{:X}\n330\n{:s}\n100\nAcDbEntity\n8\n{:s}\n".format(ai_handle, dxf_stream_model_space_handle, dxf_stream_layer)
+  if(circle):
+    ai_file.write("0\nCIRCLE\n{:s}100\nAcDbCircle\n10\n{:s}\n20\n{:s}\n30\n0\n40\n{:s}\n".format(entity_head, dxf_number(ai_segments[0]), dxf_number(ai_segments[1]), dxf_number(ai_segments[2])))
+    return(0)
+  outline_closed = ((ai_segments[0][0]==ai_segments[-1][-2])and(ai_segments[0][1]==ai_segments[-1][-1]))
+  vertices = outline_bulge(ai_segments)
+  polyline_flag = 0
+  if(outline_closed):
+    polyline_flag = 1
+  ai_file.write("0\nLWPOLYLINE\n{:s}100\nAcDbPolyline\n90\n{:d}\n70\n{:d}\n".format(entity_head, len(vertices), polyline_flag))
+  for (x, y, bulge) in vertices:
+    ai_file.write("10\n{:s}\n20\n{:s}\n".format(dxf_number(x), dxf_number(y)))
+    if(bulge!=0):
+      ai_file.write("42\n{:s}\n".format(dxf_number(bulge)))
+  return(0)
+
+def write_figure_in_dxf_stream(ai_figure, ai_filename):
+  """ Generate the DXF file ai_filename from the figure ai_figure (list of format B outline) without dxfwrite
+      Each outline is written as one LWPOLYLINE with the arcs encoded as bulges, directly in the buffered file
+      The file is a DXF R2000 with the minimal tables, blocks and objects, and a handle for each entity
+  """
+  six.print_(("Generate the DXF file {:s}".format(ai_filename)))
+  with open(ai_filename, 'w', dxf_stream_buffer_size) as dxf_file:
+    dxf_file.write(dxf_stream_r2000_header.format("{:X}".format(dxf_stream_first_handle+len(ai_figure))))
+    dxf_file.write(dxf_stream_r2000_tables)
+    dxf_file.write(dxf_stream_r2000_blocks)
+    dxf_file.write("0\nSECTION\n2\nENTITIES\n")
+    for (i, i_ol) in enumerate(ai_figure):
+      write_outline_in_dxf_stream(i_ol, dxf_file, dxf_stream_first_handle+i)
+    dxf_file.write("0\nENDSEC\n")
+    dxf_file.write(dxf_stream_r2000_objects)
+    dxf_file.write("0\nEOF\n")
+  return(0)
+
+def wires_may_overlap(ai_wires):
+  """ check with a sweep of the bounding boxes if two wires of the list ai_wires may overlap
+  """
+  boxes = sorted([(w.BoundBox.XMin, w.BoundBox.XMax, w.BoundBox.YMin, w.BoundBox.YMax) for w in ai_wires])
+  active = []
+  for (x_min, x_max, y_min, y_max) in boxes:
+    active = [b for b in active if (b[1]>=x_min)]
+    for b in active:
+      if((b[3]>=y_min)and(b[2]<=y_max)):
+        return(True)
+    active.append((x_min, x_max, y_min, y_max))
+  return(False)
+
+def freecad_face_with_holes(ai_outer_wire, ai_inner_wires):
+  """ return the face made of the outer wire and the inner wires or None if the holes overlap or are not inside the outer wire
+  """
+  r_face = None
+  if(not wires_may_overlap(ai_inner_wires)):
+    face = Part.Face([ai_outer_wire]+ai_inner_wires)
+    # the area of the face validates that the holes are inside the outer wire
+    outer_area = Part.Face(ai_outer_wire).Area
+    expected_area = outer_area - sum([Part.Face(w).Area for w in ai_inner_wires])
+    if(face.isValid() and (abs(face.Area-expected_area)<=1e-6*outer_area)):
+      r_face = face
+  return(r_face)
+
 def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
   """ the first outline of the figure ai_figure is the outer line of the part
       the other outlines are holes in the part
@@ -650,12 +797,21 @@ def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
         six.print_(("WARN504: Warning, the outline {:d} is not closed! Only wire can be extruded.".format(oli+1)))
   # create the FreeCAD part
   if(face_nwire): # generate a real solid part
-    outer_face = Part.Face(Part.Wire(outline_arc_line(ai_figure[0], 'freecad').Edges))
-    outer_solid = outer_face.extrude(Base.Vector(0,0,ai_extrude_height)) # straight linear extrusion
-    if(outline_nb>1): # holes need to be cut from outer_solid
+    outer_wire = Part.Wire(outline_arc_line(ai_figure[0], 'freecad').Edges)
+    inner_wires = []
+    for i in range(outline_nb-1):
+      inner_wires.append(Part.Wire(outline_arc_line(ai_figure[i+1], 'freecad').Edges))
+    # fast path: one face with the holes as inner wires and a single extrusion
+    face_with_holes = None
+    if(freecad_single_face and (outline_nb>1)):
+      face_with_holes = freecad_face_with_holes(outer_wire, inner_wires)
+    if(face_with_holes is not None):
+      r_part = face_with_holes.extrude(Base.Vector(0,0,ai_extrude_height)) # straight linear extrusion
+    elif(outline_nb>1): # holes need to be cut from outer_solid
+      outer_solid = Part.Face(outer_wire).extrude(Base.Vector(0,0,ai_extrude_height)) # straight linear extrusion
       inner_solid = []
       for i in range(outline_nb-1):
-        inner_face = Part.Face(Part.Wire(outline_arc_line(ai_figure[i+1], 'freecad').Edges))
+        inner_face = Part.Face(inner_wires[i])
         inner_solid.append(inner_face.extrude(Base.Vector(0,0,ai_extrude_height+2*remove_skin_extra))) # straight linear extrusion
       #inner_hole = Part.makeCompound(inner_solid) # not satisfying result with overlap holes
       inner_hole = inner_solid[0]
@@ -664,7 +820,7 @@ def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
       inner_hole.translate(Base.Vector(0,0,-remove_skin_extra))
       r_part = outer_solid.cut(inner_hole)
     else:
-      r_part = outer_solid
+      r_part = Part.Face(outer_wire).extrude(Base.Vector(0,0,ai_extrude_height)) # straight linear extrusion
   else: # generate a simple extrusion of wires
     wire_part = []
     for i in range(outline_nb):
@@ -845,6 +1001,114 @@ def outline_arc_line_test1():
   r_test = 1
   return(r_test)
 
+def outline_arc_line_test2():
+  """ Compare the number of points and the chord error of the two arc approximations of the tkinter backend
+  """
+  r_test = 1
+  l_chord_tolerance = 0.01
+  print("radius  | radius-based: points  chord-error | chord-tolerance: points  chord-error")
+  for radius in (0.5, 5.0, 50.0, 500.0, 5000.0):
+    result = []
+    for chord_tolerance in (None, l_chord_tolerance):
+      circle_points = complete_circle((0, 0), radius, unit_circle_resolution, chord_tolerance)
+      chord_error = radius*(1-math.cos(math.pi/len(circle_points)))
+      result.extend([len(circle_points), chord_error])
+    six.print_(("{:7.1f} | {:20d} {:12.6f} | {:23d} {:12.6f}".format(radius, *result)))
+    if(result[3]>l_chord_tolerance):
+      six.print_(("ERR823: Error, the chord error {:0.6f} is bigger than the tolerance {:0.6f}".format(result[3], l_chord_tolerance)))
+      r_test = 0
+  # arc approximation
+  radius = 200.0
+  arc = [[radius, 0], [radius*math.cos(0.1), radius*math.sin(0.1), radius*math.cos(0.2), radius*math.sin(0.2)]]
+  arc_tk = outline_arc_line(arc, 'tkinter', l_chord_tolerance)
+  chord_error = max([radius-math.sqrt(((x1+x2)/2.0)**2+((y1+y2)/2.0)**2) for (x1, y1, x2, y2) in arc_tk])
+  six.print_(("arc of radius {:0.1f}: radius-based {:d} lines, chord-tolerance {:d} lines with chord error {:0.6f}".format(radius, len(outline_arc_line(arc, 'tkinter')), len(arc_tk), chord_error)))
+  if(chord_error>l_chord_tolerance):
+    six.print_(("ERR824: Error, the arc chord error {:0.6f} is bigger than the tolerance {:0.6f}".format(chord_error, l_chord_tolerance)))
+    r_test = 0
+  return(r_test)
+
+def outline_arc_line_test3():
+  """ Compare write_figure_in_svg_stream() with write_figure_in_svg()
+  """
+  r_test = 1
+  l_output_dir = "test_output"
+  design_help.mkdir_p(l_output_dir)
+  # a figure with many arcs and lines
+  crenel = [(0,0,0), (40,0,2), (40,10,2), (50,10,2), (50,0,2), (100,0,3), (120,-15,100,-30,3), (0,-30,-2), (0,0,0)]
+  crenel_B = cnc_outline.cnc_cut_outline(crenel, "outline_arc_line_test3", True)
+  figure = []
+  for i in range(400):
+    figure.append(cnc_outline.outline_shift_xy(crenel_B, 150*(i%20), 1, 50*(i//20), 1))
+  figure.append((-20, -20, 5))
+  t0 = time.time()
+  write_figure_in_svg(figure, "{:s}/obt3_svgwrite.svg".format(l_output_dir))
+  t1 = time.time()
+  write_figure_in_svg_stream(figure, "{:s}/obt3_stream.svg".format(l_output_dir))
+  t2 = time.time()
+  six.print_(("write_figure_in_svg: {:0.3f} s  write_figure_in_svg_stream: {:0.3f} s".format(t1-t0, t2-t1)))
+  # the arc flags must be the ones of the svgwrite backend
+  flags_svgwrite = []
+  for element in outline_arc_line(crenel_B, 'svgwrite'):
+    if(isinstance(element, svgwrite.path.Path)):
+      flags_svgwrite.append(element.commands[0].split()[-2])
+  stream = six.StringIO()
+  write_outline_in_svg_stream(crenel_B, stream)
+  flags_stream = [cmd.split()[2] for cmd in stream.getvalue().split(' A')[1:]]
+  if(flags_stream!=flags_svgwrite):
+    six.print_(("ERR825: Error, the arc flags differ: {:s} {:s}".format(str(flags_stream), str(flags_svgwrite))))
+    r_test = 0
+  return(r_test)
+
+def outline_arc_line_test4():
+  """ Compare write_figure_in_dxf_stream() with write_figure_in_dxf() and check the bulges
+  """
+  r_test = 1
+  l_output_dir = "test_output"
+  design_help.mkdir_p(l_output_dir)
+  crenel = [(0,0,0), (40,0,2), (40,10,2), (50,10,2), (50,0,2), (100,0,3), (120,-15,100,-30,3), (0,-30,-2), (0,0,0)]
+  crenel_B = cnc_outline.cnc_cut_outline(crenel, "outline_arc_line_test4", True)
+  figure = []
+  for i in range(400):
+    figure.append(cnc_outline.outline_shift_xy(crenel_B, 150*(i%20), 1, 50*(i//20), 1))
+  figure.append((-20, -20, 5))
+  t0 = time.time()
+  write_figure_in_dxf(figure, "{:s}/obt4_dxfwrite.dxf".format(l_output_dir))
+  t1 = time.time()
+  write_figure_in_dxf_stream(figure, "{:s}/obt4_stream.dxf".format(l_output_dir))
+  t2 = time.time()
+  six.print_(("write_figure_in_dxf: {:0.3f} s  write_figure_in_dxf_stream: {:0.3f} s".format(t1-t0, t2-t1)))
+  # the middle of the arc rebuilt from the bulge must be on the circle
+  max_diff = 0
+  for ol in (crenel_B, cnc_outline.outline_reverse(crenel_B)):
+    vertices = outline_bulge(ol)
+    for i in range(len(vertices)):
+      (ax, ay, bulge) = vertices[i]
+      (bx, by, next_bulge) = vertices[(i+1)%len(vertices)]
+      if(bulge!=0):
+        sagitta = bulge*math.sqrt((bx-ax)**2+(by-ay)**2)/2
+        mx = (ax+bx)/2+sagitta*(by-ay)/math.sqrt((bx-ax)**2+(by-ay)**2)
+        my = (ay+by)/2-sagitta*(bx-ax)/math.sqrt((bx-ax)**2+(by-ay)**2)
+        (lia, ptix, ptiy, u, v, w, uv, vw, uw) = arc_3_points_to_radius_center_angles((ax, ay), ol[i+1][0:2], (bx, by))
+        max_diff = max(max_diff, abs(math.sqrt((mx-ptix)**2+(my-ptiy)**2)-lia))
+  six.print_(("bulge check: max_diff {:0.3e}".format(max_diff)))
+  if(max_diff>1e-9):
+    six.print_(("ERR826: Error, the bulges don't match the arcs: {:0.6f}".format(max_diff)))
+    r_test = 0
+  # the handles of the R2000 file must be unique and smaller than $HANDSEED
+  with open("{:s}/obt4_stream.dxf".format(l_output_dir), 'r') as dxf_file:
+    lines = dxf_file.read().split('\n')
+  groups = list(zip(lines[0::2], lines[1::2]))
+  handseed_idx = groups.index(('9', '$HANDSEED'))+1
+  handseed = int(groups[handseed_idx][1], 16)
+  handles = [int(value, 16) for (code, value) in groups[handseed_idx+1:] if code in ('5', '105')]
+  entity_nb = len([1 for (code, value) in groups if (code, value) in (('0', 'LWPOLYLINE'), ('0', 'CIRCLE'))])
+  six.print_(("DXF R2000 check: {:d} handles  $HANDSEED {:X}  {:d} entities".format(len(handles), handseed, entity_nb)))
+  if((len(set(handles))!=len(handles))or(max(handles)>=handseed)or(entity_nb!=len(figure))):
+    six.print_(("ERR827: Error, the handles of the DXF file are not unique or not smaller than $HANDSEED"))
+    r_test = 0
+  return(r_test)
+
 ################################################################
 # ******** command line interface ***********
 ################################################################
@@ -855,12 +1119,24 @@ def outline_backends_cli(ai_args=""):
   ob_parser = argparse.ArgumentParser(description='Test the outline_backends API.')
   ob_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
     help='Run outline_arc_line_test1()')
+  ob_parser.add_argument('--test2','--t2', action='store_true', default=False, dest='sw_test2',
+    help='Run outline_arc_line_test2(): compare the arc approximations of the tkinter backend')
+  ob_parser.add_argument('--test3','--t3', action='store_true', default=False, dest='sw_test3',
+    help='Run outline_arc_line_test3(): compare the streaming SVG writer with svgwrite')
+  ob_parser.add_argument('--test4','--t4', action='store_true', default=False, dest='sw_test4',
+    help='Run outline_arc_line_test4(): compare the streaming DXF writer with dxfwrite')
   effective_args = design_help.get_effective_args(ai_args)
   ob_args = ob_parser.parse_args(effective_args)
   r_obc = 0
   print("dbg111: start testing outline_backends.py")
   if(ob_args.sw_test1):
     r_obc = outline_arc_line_test1()
+  if(ob_args.sw_test2):
+    r_obc = outline_arc_line_test2()
+  if(ob_args.sw_test3):
+    r_obc = outline_arc_line_test3()
+  if(ob_args.sw_test4):
+    r_obc = outline_arc_line_test4()
   print("dbg999: end of script")
   return(r_obc)
 
@@ -28,9 +28,7 @@ positioning.py provides help functions to place 3D parts in an assembly
 # header for Python / FreeCAD compatibility
 ################################################################
 
-from . import importing_freecad
 import six
-importing_freecad.importing_freecad()
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -39,10 +37,11 @@ importing_freecad.importing_freecad()
 # import
 ################################################################
 
-import Part
-from FreeCAD import Base
+from .lazy_import import Part
+from .lazy_import import Base
 import math
 import sys, argparse
+import numpy
 from . import design_help # just for get_effective_args()
 
 ################################################################
@@ -97,6 +96,70 @@ def place_plank(ai_plank_solid, ai_x_length, ai_y_width, ai_z_height, ai_flip, a
   r_placed_plank.translate(Base.Vector(ai_translate_x, ai_translate_y, ai_translate_z))
   return(r_placed_plank)
 
+def rotation_matrix(ai_axis, ai_angle):
+  """ matrix of the rotation of ai_angle degrees around the unit vector ai_axis, with the FreeCAD convention of Shape.rotate()
+      the rounding errors of the multiples of 90 degrees are removed
+  """
+  (ux, uy, uz) = ai_axis
+  a = math.radians(ai_angle)
+  (c, s) = (math.cos(a), math.sin(a))
+  r_matrix = numpy.array([
+    [c+ux*ux*(1-c), ux*uy*(1-c)-uz*s, ux*uz*(1-c)+uy*s],
+    [uy*ux*(1-c)+uz*s, c+uy*uy*(1-c), uy*uz*(1-c)-ux*s],
+    [uz*ux*(1-c)-uy*s, uz*uy*(1-c)+ux*s, c+uz*uz*(1-c)]])
+  r_matrix[numpy.abs(r_matrix)<1e-12] = 0
+  return(r_matrix)
+
+def place_plank_matrix(ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z):
+  """ return the tuple (matrix, vector) of the transformation applied by place_plank(): placed_point = matrix*point + vector
+      It lets place the figures of a plank without FreeCAD
+  """
+  transformations = []
+  # flip
+  flip_center = (ai_x_length/2.0, ai_y_width/2.0, ai_z_height/2.0)
+  if(ai_flip=='i'):
+    pass
+  elif(ai_flip=='x'):
+    transformations.append((flip_center, (1,0,0), 180))
+  elif(ai_flip=='y'):
+    transformations.append((flip_center, (0,1,0), 180))
+  elif(ai_flip=='z'):
+    transformations.append((flip_center, (0,0,1), 180))
+  else:
+    six.print_(("ERR505: Error, the flip value %s doesn't exist! Use only: i,x,y,z."%ai_flip))
+    sys.exit(2)
+  # orientation
+  translation = (0, 0, 0)
+  if(ai_orientation=='xy'):
+    pass
+  elif(ai_orientation=='xz'):
+    transformations.append(((0,0,0), (1,0,0), 90))
+    translation = (0, ai_z_height, 0)
+  elif(ai_orientation=='yx'):
+    transformations.append(((0,0,0), (0,0,1), 90))
+    translation = (ai_y_width, 0, 0)
+  elif(ai_orientation=='yz'):
+    transformations.append(((0,0,0), (0,0,1), 90))
+    transformations.append(((0,0,0), (0,1,0), 90))
+  elif(ai_orientation=='zx'):
+    transformations.append(((0,0,0), (0,1,0), -90))
+    transformations.append(((0,0,0), (0,0,1), -90))
+  elif(ai_orientation=='zy'):
+    transformations.append(((0,0,0), (0,1,0), -90))
+    translation = (ai_z_height, 0, 0)
+  else:
+    six.print_(("ERR506: Error, the orientation value %s doesn't exist! Use only: xz,xy,yx,yz,zx,zy."%ai_orientation))
+    sys.exit(2)
+  r_matrix = numpy.identity(3)
+  r_vector = numpy.zeros(3)
+  for (center, axis, angle) in transformations:
+    rot = rotation_matrix(axis, angle)
+    c = numpy.array(center, dtype=float)
+    r_matrix = rot.dot(r_matrix)
+    r_vector = rot.dot(r_vector-c)+c
+  r_vector += numpy.array(translation, dtype=float)+numpy.array((ai_translate_x, ai_translate_y, ai_translate_z), dtype=float)
+  return((r_matrix, r_vector))
+
 ################################################################
 # API testing
 ################################################################
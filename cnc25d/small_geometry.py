@@ -966,6 +966,81 @@ def unstable_smooth_outline_b_curve(ai_polyline, ai_initial_tangent, ai_precisio
   # return
   return(r_outline)
 
+def smooth_segment_c_curve(ai_polyline, ai_idx, ai_precision, ai_router_bit_request, ai_error_msg_id):
+  """
+  Compute the two arcs (or the line) joining the points ai_idx and ai_idx+1 of the format C outline ai_polyline.
+  It is the loop body of sub_smooth_outline_c_curve() and it returns the list of the new segments.
+  """
+  i = ai_idx
+  radian_epsilon = ai_precision
+  r_outline = []
+  # error message
+  i_error_msg_id = "{:s}.{:d}".format(ai_error_msg_id, i)
+  # check the validity of the new segment
+  segment_len = len(ai_polyline[i+1])
+  if(segment_len!=3):
+    six.print_(("ERR629: Error in {:s}, the ai_polyline segment length must be exactly 3. Currently: {:d}".format(i_error_msg_id, segment_len)))
+    sys.exit(2)
+  # geometrical data
+  AX = ai_polyline[i][0]
+  AY = ai_polyline[i][1]
+  xAt = ai_polyline[i][2]
+  EX = ai_polyline[i+1][0]
+  EY = ai_polyline[i+1][1]
+  xEt = ai_polyline[i+1][2]
+  # calculation of the inclination of AE
+  lAE = math.sqrt((EX-AX)**2+(EY-AY)**2)
+  xAE = math.atan2((EY-AY)/lAE, (EX-AX)/lAE)
+  # calculation of the inclination of AC
+  AtAE = math.fmod(xAt-xAE+5*math.pi, 2*math.pi)-math.pi # angle (AE, tangent) between [-pi,pi]
+  xAC = math.fmod(xAE + AtAE/2 + 5*math.pi, 2*math.pi) - math.pi
+  AClx = math.sin(xAC)
+  ACly = -1*math.cos(xAC)
+  ACk = -1*(AClx*AX+ACly*AY)
+  # calculation of the inclination of EC
+  EtEA = math.fmod(xEt-xAE+5*math.pi, 2*math.pi)-math.pi # angle (AE, tangent) between [-pi,pi]
+  xEC = math.fmod(xAE+math.pi + EtEA/2 + 5*math.pi, 2*math.pi) - math.pi
+  EClx = math.sin(xEC)
+  ECly = -1*math.cos(xEC)
+  ECk = -1*(EClx*EX+ECly*EY)
+  # check if the segment must be an arc or a line
+  if(abs(AtAE)>math.pi/2):
+    six.print_(("ERR639: Error in {:s}, the angle between AC and the tangent xAt is larger than pi/2. It doesn't look like a feasible curbe. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt)))
+    sys.exit(2)
+  if(abs(EtEA)>math.pi/2):
+    six.print_(("ERR638: Error in {:s}, the angle between EC and the tangent et is larger than pi/2. It doesn't look like a feasible curbe. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt)))
+    sys.exit(2)
+  if(abs(AtAE)>math.pi/3):
+    six.print_(("WARN649: Warning in {:s}, AC and the tangent xAt are doing a large angle. Add itermediate points to remove this warning. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt)))
+  if(abs(EtEA)>math.pi/3):
+    six.print_(("WARN648: Warning in {:s}, EC and the tangent xEt are doing a large angle. Add itermediate points to remove this warning. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt)))
+  if((abs(AtAE)<radian_epsilon)or(abs(EtEA)<radian_epsilon)):
+    six.print_(("WARN659: Warning in {:s}, (xAC, xAt) or (xEC, xEt) are almost identical. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f}  xEt={:0.2f} ".format(i_error_msg_id, xAC, xAt, xEC, xEt)))
+    r_outline.append((EX, EY)) # create a line-segment
+  elif((AtAE*EtEA)>0):
+    six.print_(("WARN669: Warning in {:s}, xAt and xEt are not one the side of (AE). It look like an inflexion. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f} xEt={:0.2f} ".format(i_error_msg_id, xAC, xAt, xEC, xEt)))
+    r_outline.append((EX, EY)) # create a line-segment
+  else:
+    # C intersection of (AC) and (EC). it is the junction point between the two arcs
+    (CX, CY, line_line_intersection_status) = line_line_intersection((AClx, ACly, ACk),(EClx, ECly, ECk), ai_error_msg_id)
+    if(line_line_intersection_status==2):
+      six.print_(("ERR324: Error in {:s}, AC and EC are collinear!".format(ai_error_msg_id)))
+      sys.exit(2)
+    (BX, BY, xCt) = curve_arc(AX, AY, CX, CY, xAt, ai_router_bit_request, i_error_msg_id)
+    if(abs(math.fmod(xCt-xAE+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
+      six.print_(("ERR325: Error in {:s}, the first arc tangent in C is not parallel to AE! xCt={:0.2f} xAE={:0.2f}".format(ai_error_msg_id, xCt, xAE)))
+      sys.exit(2)
+    (DX, DY, xEt2) = curve_arc(CX, CY, EX, EY, xAE, ai_router_bit_request, i_error_msg_id)
+    if(abs(math.fmod(xEt2-xEt+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
+      six.print_(("ERR326: Error in {:s}, the second arc tangent in E is different from xEt! xEt={:0.2f} xEt2={:0.2f}".format(ai_error_msg_id, xEt, xEt2)))
+      sys.exit(2)
+    r_outline.append((BX, BY, CX, CY)) # create the first arc-segment
+    r_outline.append((DX, DY, EX, EY)) # create the second arc-segment
+    #print("dbg048: BX {:0.3f}  BY {:0.3f}  CX {:0.3f}  CY {:0.3f}  DX {:0.3f}  DY {:0.3f}  EX {:0.3f}  EY {:0.3f}".format(BX, BY, CX, CY, DX, DY, EX, EY))
+    #print("fbg049: r_outline:", r_outline)
+  # return
+  return(r_outline)
+
 def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request, ai_error_msg_id):
   """
   This function computes a serie of 2N arcs that pass through the (N+1) points defined by the N line-segments of ai_polyline.
@@ -1000,70 +1075,7 @@ def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request,
   r_outline.append((ai_polyline[0][0], ai_polyline[0][1])) # first-point
   # processing incrementation
   for i in range(point_nb-1):
-    # error message
-    i_error_msg_id = "{:s}.{:d}".format(ai_error_msg_id, i)
-    # check the validity of the new segment
-    segment_len = len(ai_polyline[i+1])
-    if(segment_len!=3):
-      six.print_(("ERR629: Error in {:s}, the ai_polyline segment length must be exactly 3. Currently: {:d}".format(i_error_msg_id, segment_len)))
-      sys.exit(2)
-    # geometrical data
-    AX = ai_polyline[i][0]
-    AY = ai_polyline[i][1]
-    xAt = ai_polyline[i][2]
-    EX = ai_polyline[i+1][0]
-    EY = ai_polyline[i+1][1]
-    xEt = ai_polyline[i+1][2]
-    # calculation of the inclination of AE
-    lAE = math.sqrt((EX-AX)**2+(EY-AY)**2)
-    xAE = math.atan2((EY-AY)/lAE, (EX-AX)/lAE)
-    # calculation of the inclination of AC
-    AtAE = math.fmod(xAt-xAE+5*math.pi, 2*math.pi)-math.pi # angle (AE, tangent) between [-pi,pi]
-    xAC = math.fmod(xAE + AtAE/2 + 5*math.pi, 2*math.pi) - math.pi
-    AClx = math.sin(xAC)
-    ACly = -1*math.cos(xAC)
-    ACk = -1*(AClx*AX+ACly*AY)
-    # calculation of the inclination of EC
-    EtEA = math.fmod(xEt-xAE+5*math.pi, 2*math.pi)-math.pi # angle (AE, tangent) between [-pi,pi]
-    xEC = math.fmod(xAE+math.pi + EtEA/2 + 5*math.pi, 2*math.pi) - math.pi
-    EClx = math.sin(xEC)
-    ECly = -1*math.cos(xEC)
-    ECk = -1*(EClx*EX+ECly*EY)
-    # check if the segment must be an arc or a line
-    if(abs(AtAE)>math.pi/2):
-      six.print_(("ERR639: Error in {:s}, the angle between AC and the tangent xAt is larger than pi/2. It doesn't look like a feasible curbe. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt)))
-      sys.exit(2)
-    if(abs(EtEA)>math.pi/2):
-      six.print_(("ERR638: Error in {:s}, the angle between EC and the tangent et is larger than pi/2. It doesn't look like a feasible curbe. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt)))
-      sys.exit(2)
-    if(abs(AtAE)>math.pi/3):
-      six.print_(("WARN649: Warning in {:s}, AC and the tangent xAt are doing a large angle. Add itermediate points to remove this warning. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt)))
-    if(abs(EtEA)>math.pi/3):
-      six.print_(("WARN648: Warning in {:s}, EC and the tangent xEt are doing a large angle. Add itermediate points to remove this warning. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt)))
-    if((abs(AtAE)<radian_epsilon)or(abs(EtEA)<radian_epsilon)):
-      six.print_(("WARN659: Warning in {:s}, (xAC, xAt) or (xEC, xEt) are almost identical. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f}  xEt={:0.2f} ".format(i_error_msg_id, xAC, xAt, xEC, xEt)))
-      r_outline.append((EX, EY)) # create a line-segment
-    elif((AtAE*EtEA)>0):
-      six.print_(("WARN669: Warning in {:s}, xAt and xEt are not one the side of (AE). It look like an inflexion. A line is generated for this segment. xAC={:0.2f}  xAt={:0.2f} xEC={:0.2f} xEt={:0.2f} ".format(i_error_msg_id, xAC, xAt, xEC, xEt)))
-      r_outline.append((EX, EY)) # create a line-segment
-    else:
-      # C intersection of (AC) and (EC). it is the junction point between the two arcs
-      (CX, CY, line_line_intersection_status) = line_line_intersection((AClx, ACly, ACk),(EClx, ECly, ECk), ai_error_msg_id)
-      if(line_line_intersection_status==2):
-        six.print_(("ERR324: Error in {:s}, AC and EC are collinear!".format(ai_error_msg_id)))
-        sys.exit(2)
-      (BX, BY, xCt) = curve_arc(AX, AY, CX, CY, xAt, ai_router_bit_request, i_error_msg_id)
-      if(abs(math.fmod(xCt-xAE+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
-        six.print_(("ERR325: Error in {:s}, the first arc tangent in C is not parallel to AE! xCt={:0.2f} xAE={:0.2f}".format(ai_error_msg_id, xCt, xAE)))
-        sys.exit(2)
-      (DX, DY, xEt2) = curve_arc(CX, CY, EX, EY, xAE, ai_router_bit_request, i_error_msg_id)
-      if(abs(math.fmod(xEt2-xEt+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
-        six.print_(("ERR326: Error in {:s}, the second arc tangent in E is different from xEt! xEt={:0.2f} xEt2={:0.2f}".format(ai_error_msg_id, xEt, xEt2)))
-        sys.exit(2)
-      r_outline.append((BX, BY, CX, CY)) # create the first arc-segment
-      r_outline.append((DX, DY, EX, EY)) # create the second arc-segment
-      #print("dbg048: BX {:0.3f}  BY {:0.3f}  CX {:0.3f}  CY {:0.3f}  DX {:0.3f}  DY {:0.3f}  EX {:0.3f}  EY {:0.3f}".format(BX, BY, CX, CY, DX, DY, EX, EY))
-      #print("fbg049: r_outline:", r_outline)
+    r_outline.extend(smooth_segment_c_curve(ai_polyline, i, radian_epsilon, ai_router_bit_request, ai_error_msg_id))
   # return
   return(r_outline)
 
@@ -0,0 +1,661 @@
+# stl_backend.py
+# writes the straight extrusion of a figure in a binary STL file without FreeCAD
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+stl_backend.py extrudes a figure like outline_backends.figure_to_freecad_25d_part() and writes the mesh in a binary STL file.
+The first outline of the figure is the outer line of the part, the other outlines are holes.
+The outlines are approximated by polylines (chord tolerance), the face with holes is triangulated
+by ear clipping after bridging the holes to the outer polygon, and the side walls are added.
+Like the cut of figure_to_freecad_25d_part(), the overlapping holes are fused, the holes crossing the outer outline
+make notches and the outlines outside of the outer outline (for example the other parts of a layout figure) are ignored.
+Neither FreeCAD nor OpenCascade are used: these boolean operations are computed on the polygons.
+"""
+
+################################################################
+# import
+################################################################
+
+import sys, argparse
+import math
+import six
+import numpy
+#
+from . import design_help # just for get_effective_args() and mkdir_p()
+from . import cnc_outline # just for check_outline_format()
+from . import outline_backends # just for outline_arc_line()
+#
+import time # for the tests
+
+################################################################
+# global variable
+################################################################
+
+# maximal distance between an arc and its polyline in the STL mesh
+stl_chord_tolerance = 0.01 # mm
+# the vertices closer than stl_epsilon_length are merged
+stl_epsilon_length = 1e-9 # mm
+
+################################################################
+# polygons
+################################################################
+
+def outline_polygon(ai_outline, ai_chord_tolerance):
+  """ approximate a closed outline (format-B or circle) by a polygon
+      it returns a (n,2) numpy array without the closing point and without consecutive duplicated points
+  """
+  lines = numpy.array(outline_backends.outline_arc_line(ai_outline, 'tkinter', ai_chord_tolerance), dtype=float)
+  points = lines[:,0:2]
+  keep = numpy.hypot(*(numpy.roll(points, -1, axis=0)-points).T)>stl_epsilon_length
+  r_points = points[keep]
+  if(len(r_points)<3):
+    six.print_(("ERR671: Error, the outline is approximated by only {:d} points".format(len(r_points))))
+    sys.exit(2)
+  return(r_points)
+
+def polygon_area(ai_points):
+  """ signed area of a polygon: positive if counter-clockwise
+  """
+  x = ai_points[:,0]
+  y = ai_points[:,1]
+  r_area = 0.5*numpy.sum(x*numpy.roll(y, -1)-numpy.roll(x, -1)*y)
+  return(r_area)
+
+def oriented_polygon(ai_points, ai_ccw):
+  """ return the polygon ai_points counter-clockwise if ai_ccw else clockwise
+  """
+  r_points = ai_points
+  if((polygon_area(ai_points)>0)!=ai_ccw):
+    r_points = ai_points[::-1]
+  return(r_points)
+
+################################################################
+# polygon boolean operations
+################################################################
+
+def polygon_box(ai_points):
+  """ bounding box (x_min, y_min, x_max, y_max) of a polygon
+  """
+  r_box = (ai_points[:,0].min(), ai_points[:,1].min(), ai_points[:,0].max(), ai_points[:,1].max())
+  return(r_box)
+
+def box_overlap(ai_box1, ai_box2):
+  """ check if two bounding boxes overlap
+  """
+  r_overlap = (ai_box1[0]<=ai_box2[2])and(ai_box2[0]<=ai_box1[2])and(ai_box1[1]<=ai_box2[3])and(ai_box2[1]<=ai_box1[3])
+  return(r_overlap)
+
+def points_in_polygon(ai_points, ai_polygon):
+  """ even-odd test of the (n,2) array of points ai_points against the polygon ai_polygon
+      it returns a boolean array of length n
+  """
+  x0 = ai_polygon[:,0][None,:]
+  y0 = ai_polygon[:,1][None,:]
+  x1 = numpy.roll(ai_polygon[:,0], -1)[None,:]
+  y1 = numpy.roll(ai_polygon[:,1], -1)[None,:]
+  r_inside = numpy.zeros(len(ai_points), dtype=bool)
+  for k in range(0, len(ai_points), 1024): # by chunks to limit the memory
+    x = ai_points[k:k+1024,0][:,None]
+    y = ai_points[k:k+1024,1][:,None]
+    crossing = ((y0>y)!=(y1>y))
+    ix = x0+(y-y0)*(x1-x0)/numpy.where(y1!=y0, y1-y0, 1.0)
+    r_inside[k:k+1024] = (numpy.sum(crossing&(x<ix), axis=1)%2)==1
+  return(r_inside)
+
+def ring_crossings(ai_ring_a, ai_ring_b):
+  """ proper crossings of the edges of the polygons ai_ring_a and ai_ring_b
+      it returns the arrays (edge index in a, edge index in b, position on the edge of a, position on the edge of b)
+      the positions are in ]0,1[ ; the contacts at the vertices are not reported
+  """
+  a0 = ai_ring_a
+  da = numpy.roll(ai_ring_a, -1, axis=0)-a0
+  b0 = ai_ring_b
+  db = numpy.roll(ai_ring_b, -1, axis=0)-b0
+  # only the edges inside the bounding box of the other polygon
+  (bx_min, by_min, bx_max, by_max) = polygon_box(ai_ring_b)
+  (ax_min, ay_min, ax_max, ay_max) = polygon_box(ai_ring_a)
+  ia = numpy.nonzero((numpy.maximum(a0[:,0], a0[:,0]+da[:,0])>=bx_min)&(numpy.minimum(a0[:,0], a0[:,0]+da[:,0])<=bx_max)
+    &(numpy.maximum(a0[:,1], a0[:,1]+da[:,1])>=by_min)&(numpy.minimum(a0[:,1], a0[:,1]+da[:,1])<=by_max))[0]
+  ib = numpy.nonzero((numpy.maximum(b0[:,0], b0[:,0]+db[:,0])>=ax_min)&(numpy.minimum(b0[:,0], b0[:,0]+db[:,0])<=ax_max)
+    &(numpy.maximum(b0[:,1], b0[:,1]+db[:,1])>=ay_min)&(numpy.minimum(b0[:,1], b0[:,1]+db[:,1])<=ay_max))[0]
+  if((len(ia)==0)or(len(ib)==0)):
+    return((ia, ib, numpy.zeros(0), numpy.zeros(0)))
+  (dax, day) = (da[ia,0][:,None], da[ia,1][:,None])
+  (dbx, dby) = (db[ib,0][None,:], db[ib,1][None,:])
+  dx = b0[ib,0][None,:]-a0[ia,0][:,None]
+  dy = b0[ib,1][None,:]-a0[ia,1][:,None]
+  den = dax*dby-day*dbx
+  safe_den = numpy.where(den!=0, den, 1.0)
+  t = (dx*dby-dy*dbx)/safe_den
+  u = (dx*day-dy*dax)/safe_den
+  crossing = (den!=0)&(t>0)&(t<1)&(u>0)&(u<1)
+  (i, j) = numpy.nonzero(crossing)
+  r_crossings = (ia[i], ib[j], t[i,j], u[i,j])
+  return(r_crossings)
+
+def polygon_difference(ai_outer, ai_holes):
+  """ boundary of the region inside the counter-clockwise polygon ai_outer and outside all the clockwise polygons ai_holes
+      The edges are split at their crossings and an edge is kept if its middle is on the boundary of the region.
+      It returns the list of the rings of the region: counter-clockwise for the outer lines, clockwise for the holes,
+      or None if the kept edges can not be chained (degenerated contacts between the polygons)
+  """
+  rings = [ai_outer]+list(ai_holes)
+  boxes = [polygon_box(ring) for ring in rings]
+  splits = [[[] for e in range(len(ring))] for ring in rings]
+  for a in range(len(rings)):
+    for b in range(a+1, len(rings)):
+      if(not box_overlap(boxes[a], boxes[b])):
+        continue
+      (ea, eb, ta, tb) = ring_crossings(rings[a], rings[b])
+      for k in range(len(ea)):
+        pa = rings[a][ea[k]]
+        pb = rings[a][(ea[k]+1)%len(rings[a])]
+        point = (float(pa[0]+ta[k]*(pb[0]-pa[0])), float(pa[1]+ta[k]*(pb[1]-pa[1]))) # the same point for both edges
+        splits[a][ea[k]].append((ta[k], point))
+        splits[b][eb[k]].append((tb[k], point))
+  # split edges
+  edge_ring = []
+  edge_start = []
+  edge_end = []
+  for r in range(len(rings)):
+    ring = rings[r]
+    for e in range(len(ring)):
+      points = [tuple(ring[e].tolist())] + [pt for (t, pt) in sorted(splits[r][e])] + [tuple(ring[(e+1)%len(ring)].tolist())]
+      for k in range(len(points)-1):
+        edge_ring.append(r)
+        edge_start.append(points[k])
+        edge_end.append(points[k+1])
+  edge_ring = numpy.array(edge_ring)
+  middle = (numpy.array(edge_start)+numpy.array(edge_end))/2
+  keep = (edge_ring==0)|points_in_polygon(middle, ai_outer)
+  for h in range(1, len(rings)):
+    keep &= ~(points_in_polygon(middle, rings[h])&(edge_ring!=h))
+  # chain the kept edges
+  kept = numpy.nonzero(keep)[0].tolist()
+  next_edges = {}
+  for k in kept:
+    next_edges.setdefault(edge_start[k], []).append(k)
+  used = set()
+  r_rings = []
+  for k in kept:
+    if(k in used):
+      continue
+    ring = []
+    edge = k
+    while(edge is not None):
+      used.add(edge)
+      ring.append(edge_start[edge])
+      candidates = [c for c in next_edges.get(edge_end[edge], []) if c not in used]
+      last_end = edge_end[edge]
+      edge = candidates[0] if candidates else None
+    if(last_end!=ring[0]):
+      return(None)
+    if(len(ring)>2):
+      r_rings.append(numpy.array(ring))
+  return(r_rings)
+
+def figure_polygons(ai_outer, ai_holes):
+  """ region of the counter-clockwise polygon ai_outer minus the union of the clockwise polygons ai_holes
+      like the cut of figure_to_freecad_25d_part(): the holes outside of ai_outer are ignored, the holes inside
+      an other hole are ignored, and the holes crossing ai_outer or an other hole are merged with polygon_difference()
+      It returns the list of the tuples (outer polygon, list of hole polygons) of the connected parts of the region
+  """
+  outer_box = polygon_box(ai_outer)
+  # holes inside or crossing the outer polygon
+  holes = []
+  crossing_outer = []
+  for hole in ai_holes:
+    if(not box_overlap(polygon_box(hole), outer_box)):
+      continue # outside
+    if(len(ring_crossings(hole, ai_outer)[0])>0):
+      crossing_outer.append(len(holes))
+      holes.append(hole)
+    elif(points_in_polygon(hole[:1], ai_outer)[0]):
+      holes.append(hole)
+    # else outside: like the cut of FreeCAD, it doesn't change the part
+  # relations between the holes
+  boxes = numpy.array([polygon_box(hole) for hole in holes]).reshape(-1, 4)
+  overlap = ((boxes[:,None,0]<=boxes[None,:,2])&(boxes[None,:,0]<=boxes[:,None,2])
+    &(boxes[:,None,1]<=boxes[None,:,3])&(boxes[None,:,1]<=boxes[:,None,3]))
+  contained = set()
+  crossing = set(crossing_outer)
+  for (i, j) in zip(*numpy.nonzero(numpy.triu(overlap, 1))):
+    if((i in contained)or(j in contained)):
+      continue
+    if(len(ring_crossings(holes[i], holes[j])[0])>0):
+      crossing.update((i, j))
+    elif(points_in_polygon(holes[i][:1], holes[j])[0]):
+      contained.add(i)
+    elif(points_in_polygon(holes[j][:1], holes[i])[0]):
+      contained.add(j)
+  crossing -= contained
+  simple_holes = [holes[k] for k in range(len(holes)) if ((k not in contained)and(k not in crossing))]
+  if(len(crossing)==0):
+    return([(ai_outer, simple_holes)])
+  rings = polygon_difference(ai_outer, [holes[k] for k in sorted(crossing)])
+  if(rings is None):
+    six.print_(("WARN677: Warning, the contacts between the outer outline and the holes are degenerated. {:d} crossing holes are ignored".format(len(crossing))))
+    return([(ai_outer, simple_holes)])
+  outers = [ring for ring in rings if polygon_area(ring)>0]
+  outers.sort(key=lambda ring: polygon_area(ring))
+  r_polygons = [(ring, []) for ring in outers]
+  for hole in [ring for ring in rings if polygon_area(ring)<0]+simple_holes:
+    for (outer, outer_holes) in r_polygons: # the smallest outer polygon that contains the hole
+      if(points_in_polygon(hole[:1], outer)[0]):
+        outer_holes.append(hole)
+        break
+  return(r_polygons)
+
+################################################################
+# triangulation
+################################################################
+
+def bridge_hole(ai_points, ai_ring, ai_hole):
+  """ insert the hole ai_hole (list of point index, clockwise) in the ring ai_ring (list of point index, counter-clockwise)
+      with a bridge from the right-most point of the hole to a visible point of the ring (David Eberly method)
+      it returns the new ring
+  """
+  hole_idx = numpy.array(ai_hole)
+  k = int(numpy.argmax(ai_points[hole_idx,0]))
+  (mx, my) = ai_points[ai_hole[k]]
+  ring_idx = numpy.array(ai_ring)
+  a = ai_points[ring_idx]
+  b = ai_points[numpy.roll(ring_idx, -1)]
+  # intersections of the ring edges with the ray starting at M to +x
+  crossing = ((a[:,1]<=my)&(b[:,1]>my))|((b[:,1]<=my)&(a[:,1]>my))
+  dy = numpy.where(crossing, b[:,1]-a[:,1], 1.0)
+  ix = a[:,0]+(my-a[:,1])*(b[:,0]-a[:,0])/dy
+  crossing &= (ix>=mx)
+  if(not numpy.any(crossing)):
+    six.print_(("ERR672: Error, the hole with the point ({:0.3f}, {:0.3f}) is not inside the outer outline".format(mx, my)))
+    sys.exit(2)
+  e = int(numpy.argmin(numpy.where(crossing, ix, numpy.inf)))
+  qx = ix[e]
+  # candidate P: the end of the intersected edge with the largest x
+  p = e if(a[e,0]>=b[e,0]) else (e+1)%len(ai_ring)
+  if(qx>mx):
+    # the ring points inside the triangle (M, I, P) hide P: take the one with the smallest angle to the ray
+    (px, py) = ai_points[ai_ring[p]]
+    (tx, ty) = (ai_points[ring_idx,0], ai_points[ring_idx,1])
+    def side(x1, y1, x2, y2):
+      return((x2-x1)*(ty-y1)-(y2-y1)*(tx-x1))
+    s1 = side(mx, my, qx, my)
+    s2 = side(qx, my, px, py)
+    s3 = side(px, py, mx, my)
+    inside = (((s1>=0)&(s2>=0)&(s3>=0))|((s1<=0)&(s2<=0)&(s3<=0)))&(tx>mx)
+    inside[p] = False
+    if(numpy.any(inside)):
+      tan = numpy.where(inside, numpy.abs(ty-my)/numpy.where(inside, tx-mx, 1.0), numpy.inf)
+      dist = numpy.where(inside, numpy.hypot(tx-mx, ty-my), numpy.inf)
+      p = int(numpy.lexsort((dist, tan))[0])
+  # a bridged point appears several times in the ring: take the occurrence whose angle contains M
+  pi = ai_ring[p]
+  for j in range(len(ai_ring)):
+    if(ai_ring[j]==pi):
+      if(locally_inside(ai_points, ai_ring[j-1], pi, ai_ring[(j+1)%len(ai_ring)], (mx, my))):
+        p = j
+        break
+  r_ring = ai_ring[:p+1] + ai_hole[k:] + ai_hole[:k+1] + ai_ring[p:]
+  return(r_ring)
+
+def cross_product(ai_points, ai_a, ai_b, ai_c):
+  """ z of (b-a)^(c-b): positive if a, b, c turn to the left
+  """
+  (ax, ay) = ai_points[ai_a]
+  (bx, by) = ai_points[ai_b]
+  (cx, cy) = ai_points[ai_c]
+  r_cross = (bx-ax)*(cy-by)-(by-ay)*(cx-bx)
+  return(r_cross)
+
+def locally_inside(ai_points, ai_prev, ai_a, ai_next, ai_m):
+  """ check if the point ai_m is inside the angle of the counter-clockwise ring at the point ai_a
+  """
+  (ax, ay) = ai_points[ai_a]
+  (px, py) = ai_points[ai_prev]
+  (nx, ny) = ai_points[ai_next]
+  (mx, my) = ai_m
+  left_prev = ((ax-px)*(my-ay)-(ay-py)*(mx-ax))>=0
+  left_next = ((nx-ax)*(my-ay)-(ny-ay)*(mx-ax))>=0
+  if(cross_product(ai_points, ai_prev, ai_a, ai_next)>=0): # convex
+    r_inside = left_prev and left_next
+  else: # reflex
+    r_inside = left_prev or left_next
+  return(r_inside)
+
+def ear_clipping(ai_points, ai_ring):
+  """ triangulate the counter-clockwise ring ai_ring (list of point index, a point can appear several times)
+      the reflex points are hashed in a grid to check quickly that no point is inside an ear
+      it returns the list of triangles (3-tuples of point index, counter-clockwise)
+  """
+  pts = [tuple(pt) for pt in ai_points.tolist()]
+  node_nb = len(ai_ring)
+  pt_of = list(ai_ring)
+  prev = [(i-1)%node_nb for i in range(node_nb)]
+  nxt = [(i+1)%node_nb for i in range(node_nb)]
+  # grid of the reflex nodes
+  (x_min, y_min) = ai_points.min(axis=0)
+  (x_max, y_max) = ai_points.max(axis=0)
+  cell = max(math.sqrt((x_max-x_min)*(y_max-y_min)/node_nb), (x_max-x_min+y_max-y_min)/node_nb, stl_epsilon_length)
+  grid = {}
+  reflex = [False]*node_nb
+  def turn(i):
+    (ax, ay) = pts[pt_of[prev[i]]]
+    (bx, by) = pts[pt_of[i]]
+    (cx, cy) = pts[pt_of[nxt[i]]]
+    return((bx-ax)*(cy-by)-(by-ay)*(cx-bx))
+  def cell_key(i):
+    (x, y) = pts[pt_of[i]]
+    return((int((x-x_min)//cell), int((y-y_min)//cell)))
+  def update_reflex(i):
+    is_reflex = (turn(i)<=0)
+    if(is_reflex!=reflex[i]):
+      reflex[i] = is_reflex
+      if(is_reflex):
+        grid.setdefault(cell_key(i), set()).add(i)
+      else:
+        grid[cell_key(i)].discard(i)
+  def remove_node(i):
+    if(reflex[i]):
+      grid[cell_key(i)].discard(i)
+      reflex[i] = False
+    nxt[prev[i]] = nxt[i]
+    prev[nxt[i]] = prev[i]
+  def is_ear(i):
+    if(turn(i)<=0):
+      return(False)
+    (ax, ay) = a = pts[pt_of[prev[i]]]
+    (bx, by) = b = pts[pt_of[i]]
+    (cx, cy) = c = pts[pt_of[nxt[i]]]
+    (i_min, j_min) = (int((min(ax, bx, cx)-x_min)//cell), int((min(ay, by, cy)-y_min)//cell))
+    (i_max, j_max) = (int((max(ax, bx, cx)-x_min)//cell), int((max(ay, by, cy)-y_min)//cell))
+    for gi in range(i_min, i_max+1):
+      for gj in range(j_min, j_max+1):
+        for n in grid.get((gi, gj), ()):
+          q = pts[pt_of[n]]
+          if((q==a)or(q==b)or(q==c)):
+            continue
+          (qx, qy) = q
+          if(((bx-ax)*(qy-ay)-(by-ay)*(qx-ax)>=0)and((cx-bx)*(qy-by)-(cy-by)*(qx-bx)>=0)and((ax-cx)*(qy-cy)-(ay-cy)*(qx-cx)>=0)):
+            return(False)
+    return(True)
+  for i in range(node_nb):
+    update_reflex(i)
+  r_triangles = []
+  remaining_nb = node_nb
+  node = 0
+  stop = node
+  stuck_pass = 0
+  while(remaining_nb>2):
+    p = prev[node]
+    n = nxt[node]
+    if(is_ear(node)or(stuck_pass>1)):
+      if(stuck_pass>1):
+        six.print_(("WARN671: Warning, the polygon is not simple, a triangle is forced at the point ({:0.3f}, {:0.3f})".format(*pts[pt_of[node]])))
+      if(turn(node)>0):
+        r_triangles.append((pt_of[p], pt_of[node], pt_of[n]))
+      remove_node(node)
+      remaining_nb -= 1
+      update_reflex(p)
+      update_reflex(n)
+      node = n
+      stop = node
+      stuck_pass = 0
+      continue
+    node = n
+    if(node==stop):
+      # no ear found in a full turn: remove the flat points (collinear points and spikes) that create no triangle
+      stuck_pass += 1
+      if(stuck_pass==1):
+        i = node
+        for k in range(remaining_nb):
+          n = nxt[i]
+          if((remaining_nb>2)and(abs(turn(i))<=stl_epsilon_length**2)):
+            p = prev[i]
+            remove_node(i)
+            remaining_nb -= 1
+            update_reflex(p)
+            update_reflex(n)
+            stuck_pass = 0
+          i = n
+        node = i
+        stop = node
+  return(r_triangles)
+
+def triangulate_polygon_with_holes(ai_outer, ai_holes):
+  """ triangulate the polygon ai_outer (counter-clockwise (n,2) array) with the holes ai_holes (list of clockwise (n,2) arrays)
+      it returns the tuple (points, triangles) with points a (n,2) array and triangles a (m,3) array of point index
+  """
+  r_points = numpy.concatenate([ai_outer]+list(ai_holes))
+  ring = list(range(len(ai_outer)))
+  holes = []
+  offset = len(ai_outer)
+  for hole in ai_holes:
+    holes.append(list(range(offset, offset+len(hole))))
+    offset += len(hole)
+  # the holes are bridged from right to left
+  holes.sort(key=lambda h: -r_points[h,0].max())
+  for hole in holes:
+    ring = bridge_hole(r_points, ring, hole)
+  r_triangles = numpy.array(ear_clipping(r_points, ring), dtype=numpy.int64).reshape(-1, 3)
+  return((r_points, r_triangles))
+
+################################################################
+# extrusion
+################################################################
+
+def figure_to_stl_triangles(ai_figure, ai_height, ai_chord_tolerance=None):
+  """ mesh the straight extrusion of the figure ai_figure of height ai_height
+      the first outline is the outer line of the part, the other outlines are holes
+      it returns a (m,3,3) numpy array of triangles (three vertices (x,y,z) ordered counter-clockwise seen from the outside)
+  """
+  chord_tolerance = ai_chord_tolerance
+  if(chord_tolerance is None):
+    chord_tolerance = stl_chord_tolerance
+  if(len(ai_figure)<1):
+    six.print_(("ERR673: Error, the figure doesn't contain any outlines!"))
+    sys.exit(2)
+  for oli in range(len(ai_figure)):
+    ol = ai_figure[oli]
+    if(cnc_outline.check_outline_format(ol)==2):
+      six.print_(("ERR674: Error, the outline {:d} is in format-A. Use cnc_cut_figure() or ideal_figure() first".format(oli+1)))
+      sys.exit(2)
+    if(isinstance(ol[0], (list, tuple))and((ol[0][0]!=ol[-1][-2])or(ol[0][1]!=ol[-1][-1]))):
+      six.print_(("ERR675: Error, the outline {:d} is not closed! It can not be extruded in a STL file.".format(oli+1)))
+      sys.exit(2)
+  outer = oriented_polygon(outline_polygon(ai_figure[0], chord_tolerance), True)
+  holes = [oriented_polygon(outline_polygon(ol, chord_tolerance), False) for ol in ai_figure[1:]]
+  h = float(ai_height)
+  r_triangles = []
+  walls = []
+  for (part_outer, part_holes) in figure_polygons(outer, holes):
+    (points, triangles) = triangulate_polygon_with_holes(part_outer, part_holes)
+    z0 = numpy.zeros((len(points), 1))
+    bottom_points = numpy.hstack((points, z0))
+    top_points = numpy.hstack((points, z0+h))
+    r_triangles.extend([top_points[triangles], bottom_points[triangles[:,::-1]]])
+    walls.extend([part_outer]+part_holes)
+  # side walls: the outer is counter-clockwise and the holes clockwise, so the walls face outwards
+  for ring in walls:
+    a = ring
+    b = numpy.roll(ring, -1, axis=0)
+    za = numpy.zeros((len(ring), 1))
+    (a0, b0, a1, b1) = (numpy.hstack((a, za)), numpy.hstack((b, za)), numpy.hstack((a, za+h)), numpy.hstack((b, za+h)))
+    r_triangles.append(numpy.stack((a0, b0, b1), axis=1))
+    r_triangles.append(numpy.stack((a0, b1, a1), axis=1))
+  r_triangles = numpy.concatenate(r_triangles)
+  return(r_triangles)
+
+def write_stl(ai_triangles, ai_filename, ai_header='Cnc25D'):
+  """ write the (m,3,3) array of triangles ai_triangles in the binary STL file ai_filename
+  """
+  stl_dtype = numpy.dtype([('normal', '<f4', (3,)), ('vertex', '<f4', (3, 3)), ('attribute', '<u2')])
+  facets = numpy.zeros(len(ai_triangles), dtype=stl_dtype)
+  normal = numpy.cross(ai_triangles[:,1]-ai_triangles[:,0], ai_triangles[:,2]-ai_triangles[:,0])
+  norm = numpy.linalg.norm(normal, axis=1)
+  facets['normal'] = normal/numpy.where(norm>0, norm, 1.0)[:,None]
+  facets['vertex'] = ai_triangles
+  header = ai_header.encode('ascii', 'replace')[:80].ljust(80, b' ')
+  with open(ai_filename, 'wb') as ofh:
+    ofh.write(header)
+    ofh.write(numpy.array([len(facets)], dtype='<u4').tobytes())
+    ofh.write(facets.tobytes())
+  return(len(facets))
+
+def write_figure_in_stl(ai_figure, ai_height, ai_filename, ai_chord_tolerance=None):
+  """ write the straight extrusion of the figure ai_figure of height ai_height in the binary STL file ai_filename
+      the first outline is the outer line of the part, the other outlines are holes
+  """
+  triangles = figure_to_stl_triangles(ai_figure, ai_height, ai_chord_tolerance)
+  r_facet_nb = write_stl(triangles, ai_filename, "Cnc25D extrusion of {:d} outlines, height {:0.3f}".format(len(ai_figure), ai_height))
+  return(r_facet_nb)
+
+def read_stl(ai_filename):
+  """ read a binary STL file and return the (m,3,3) array of triangles
+  """
+  with open(ai_filename, 'rb') as ifh:
+    data = ifh.read()
+  facet_nb = int(numpy.frombuffer(data[80:84], dtype='<u4')[0])
+  stl_dtype = numpy.dtype([('normal', '<f4', (3,)), ('vertex', '<f4', (3, 3)), ('attribute', '<u2')])
+  facets = numpy.frombuffer(data[84:84+50*facet_nb], dtype=stl_dtype)
+  r_triangles = facets['vertex'].astype(float)
+  return(r_triangles)
+
+def mesh_volume(ai_triangles):
+  """ volume enclosed by a closed mesh of triangles oriented counter-clockwise seen from the outside
+  """
+  r_volume = numpy.sum(numpy.einsum('ij,ij->i', ai_triangles[:,0], numpy.cross(ai_triangles[:,1], ai_triangles[:,2])))/6.0
+  return(r_volume)
+
+def mesh_open_edge_nb(ai_triangles):
+  """ number of edges that are not shared by exactly two triangles in opposite directions (0 for a watertight mesh)
+  """
+  edges = numpy.concatenate([ai_triangles[:,[0,1]], ai_triangles[:,[1,2]], ai_triangles[:,[2,0]]])
+  keys = [tuple(e.ravel()) for e in edges]
+  count = {}
+  for k in keys:
+    count[k] = count.get(k, 0)+1
+  r_nb = 0
+  for k in keys:
+    if(count.get(k[3:]+k[:3], 0)!=count[k]):
+      r_nb += 1
+  return(r_nb)
+
+################################################################
+# stl_backend testing
+################################################################
+
+def stl_backend_test1(ai_output_dir='test_output'):
+  """ extrude figures with holes, check the volume and the watertightness of the meshes
+  """
+  r_test = 1
+  design_help.mkdir_p(ai_output_dir)
+  # a square with a rounded corner, a square hole and three circle holes
+  fig1 = [
+    [[0,0], [100,0], [100,70], [95,95,70,100], [0,100], [0,0]],
+    [[10,10], [10,40], [40,40], [40,10], [10,10]],
+    (70, 30, 15),
+    (30, 70, 15),
+    (70, 70, 10)]
+  arc_radius = math.sqrt(21.25**2+8.75**2) # circle passing by (100,70), (95,95) and (70,100)
+  arc_half_angle = math.asin(15*math.sqrt(2)/arc_radius)
+  arc_segment_area = arc_radius**2*(arc_half_angle-math.sin(arc_half_angle)*math.cos(arc_half_angle))
+  area1 = 100*100-30*30/2+arc_segment_area-30*30-math.pi*(15**2+15**2+10**2)
+  # a gear-like outline with many holes
+  tooth_nb = 60
+  def polar(r, a):
+    return([r*math.cos(a), r*math.sin(a)])
+  gear = [polar(100, 0)]
+  for i in range(tooth_nb):
+    a = 2*math.pi*i/tooth_nb
+    da = 2*math.pi/tooth_nb
+    gear.append(polar(110, a+0.1*da))
+    gear.append(polar(110, a+0.25*da)+polar(110, a+0.4*da))
+    gear.append(polar(100, a+0.5*da))
+    gear.append(polar(100, a+0.75*da)+polar(100, a+da))
+  gear[-1][2:4] = gear[0]
+  fig2 = [gear]
+  for i in range(12):
+    for r in (30, 60, 85):
+      a = 2*math.pi*(i+r/100.0)/12
+      fig2.append((r*math.cos(a), r*math.sin(a), 5))
+  # a plate with two overlapping holes and a hole crossing the outer outline: the holes are fused like with FreeCAD
+  fig3 = [
+    [[0,0], [100,0], [100,100], [0,100], [0,0]],
+    (40, 50, 15),
+    (55, 50, 15),
+    (100, 20, 10)]
+  (r, d) = (15.0, 15.0)
+  lens_area = 2*r**2*math.acos(d/(2*r))-d/2*math.sqrt(4*r**2-d**2)
+  area3 = 100*100-(2*math.pi*r**2-lens_area)-math.pi*10**2/2
+  # a layout of two parts like the part_list figures: the outlines outside of the first part are ignored
+  fig4 = [
+    [[0,0], [50,0], [50,50], [0,50], [0,0]],
+    (25, 25, 10),
+    [[60,0], [110,0], [110,50], [60,50], [60,0]],
+    (85, 25, 10)]
+  area4 = 50*50-math.pi*10**2
+  for (fig_name, fig, height, area_ref) in (('square', fig1, 20.0, area1), ('gear', fig2, 10.0, None), ('overlap', fig3, 5.0, area3), ('layout', fig4, 5.0, area4)):
+    t0 = time.time()
+    output_filename = "{:s}/stl_backend_test1_{:s}.stl".format(ai_output_dir, fig_name)
+    facet_nb = write_figure_in_stl(fig, height, output_filename)
+    t1 = time.time()
+    triangles = read_stl(output_filename)
+    volume = mesh_volume(triangles)
+    open_edge_nb = mesh_open_edge_nb(figure_to_stl_triangles(fig, height))
+    if(area_ref is None): # the holes are separated: the reference is the difference of the polygon areas
+      outer = outline_polygon(fig[0], stl_chord_tolerance)
+      volume_ref = height*(abs(polygon_area(outer))-sum([abs(polygon_area(outline_polygon(ol, stl_chord_tolerance))) for ol in fig[1:]]))
+      volume_tolerance = 1e-4
+    else:
+      volume_ref = height*area_ref
+      volume_tolerance = 1e-3 # approximation of the arcs with stl_chord_tolerance
+    six.print_(("{:s}: {:d} facets  volume {:0.3f}  reference volume {:0.3f}  open edges {:d}  in {:0.3f} s".format(fig_name, facet_nb, volume, volume_ref, open_edge_nb, t1-t0)))
+    if((abs(volume-volume_ref)>volume_tolerance*volume_ref)or(open_edge_nb!=0)):
+      six.print_(("ERR676: Error, the mesh of {:s} is not a closed extrusion of the figure".format(fig_name)))
+      r_test = 0
+  return(r_test)
+
+################################################################
+# stl_backend command line interface
+################################################################
+
+def stl_backend_cli(ai_args=""):
+  """ command line interface of stl_backend.py when it is used in standalone
+  """
+  sb_parser = argparse.ArgumentParser(description='Test the FreeCAD-free STL writer of stl_backend.py.')
+  sb_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='It extrudes figures with holes in STL files and checks the meshes.')
+  sb_parser.add_argument('--output_dir','--od', action='store', default='test_output', dest='sw_output_dir',
+    help='Directory of the generated STL files. Default: test_output')
+  effective_args = design_help.get_effective_args(ai_args)
+  sb_args = sb_parser.parse_args(effective_args)
+  r_sb = 1
+  if(sb_args.sw_test1):
+    r_sb = stl_backend_test1(sb_args.sw_output_dir)
+  return(r_sb)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  stl_backend_cli("--test1")
+
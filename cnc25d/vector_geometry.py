@@ -0,0 +1,474 @@
+# vector_geometry.py
+# numpy versions of the small_geometry.py functions working on arrays of points
+# created by the Cnc25D contributors on 2026/10/18
+#
+# (C) Copyright 2026 the Cnc25D contributors
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+vector_geometry.py provides the Euclid geometry functions of small_geometry.py for arrays of points.
+Each function follows step by step the recipe of its scalar twin, but instead of printing a warning or exiting on an error, it returns a boolean array r_ok.
+The elements with r_ok==False must be recomputed with the scalar functions, that print the warnings and errors.
+"""
+
+################################################################
+# import
+################################################################
+
+import math
+import numpy
+
+################################################################
+# global variable
+################################################################
+
+radian_epsilon = math.pi/1000
+
+################################################################
+# helper functions
+################################################################
+
+def as_array(ai_values):
+  """ convert a list of floats into a numpy array of floats
+  """
+  r_array = numpy.asarray(ai_values, dtype=float)
+  return(r_array)
+
+def length(ai_dx, ai_dy):
+  """ vectorized version of math.sqrt(ai_dx**2+ai_dy**2)
+  """
+  r_length = numpy.sqrt(ai_dx**2+ai_dy**2)
+  return(r_length)
+
+def angle_mod(ai_angle, ai_offset):
+  """ vectorized version of math.fmod(ai_angle+ai_offset, 2*math.pi)
+  """
+  r_angle = numpy.fmod(ai_angle+ai_offset, 2*math.pi)
+  return(r_angle)
+
+################################################################
+# functions similar to small_geometry.py
+################################################################
+
+def arc_center_radius(AX, AY, BX, BY, CX, CY):
+  """ Compute the center of the arcs defined by the three points A,B and C
+  """
+  AB = length(BX-AX, BY-AY)
+  BC = length(CX-BX, CY-BY)
+  AC = length(CX-AX, CY-AY)
+  r_ok = (AB>=radian_epsilon)&(BC>=radian_epsilon)&(AC>=radian_epsilon)
+  # calculation of M and N
+  MX = (AX+BX)/2
+  MY = (AY+BY)/2
+  NX = (BX+CX)/2
+  NY = (BY+CY)/2
+  # calculation of e and f
+  cos_e = (BX-AX)/AB
+  sin_e = (BY-AY)/AB
+  cos_f = (CX-BX)/BC
+  sin_f = (CY-BY)/BC
+  # calculation de I
+  ixl = cos_e*sin_f-cos_f*sin_e
+  iyl = sin_e*cos_f-sin_f*cos_e
+  ixk = sin_f*(cos_e*MX+sin_e*MY)-sin_e*(cos_f*NX+sin_f*NY)
+  iyk = cos_f*(cos_e*MX+sin_e*MY)-cos_e*(cos_f*NX+sin_f*NY)
+  r_ok &= (numpy.abs(ixl)>=radian_epsilon)&(numpy.abs(iyl)>=radian_epsilon)
+  IX = ixk/ixl
+  IY = iyk/iyl
+  # check than I is equidistant of A, B and C
+  IA = length(AX-IX, AY-IY)
+  IB = length(BX-IX, BY-IY)
+  IC = length(CX-IX, CY-IY)
+  r_ok &= (numpy.abs(IB-IA)<=radian_epsilon)&(numpy.abs(IC-IA)<=radian_epsilon)
+  # return
+  r_arc_center_radius = (IX, IY, IA, r_ok)
+  return(r_arc_center_radius)
+
+def arc_center_radius_angles(AX, AY, BX, BY, CX, CY):
+  """ Compute the center, radius and angles of the arcs defined by the three points A,B and C
+  """
+  (IX, IY, IA, r_ok) = arc_center_radius(AX, AY, BX, BY, CX, CY)
+  # calculation of the angle u=(Ix, IA) , v=(Ix, IB), w=(Ix, IC)
+  u = numpy.arctan2(AY-IY, AX-IX)
+  v = numpy.arctan2(BY-IY, BX-IX)
+  w = numpy.arctan2(CY-IY, CX-IX)
+  # calculation of the angle uv=(IA, IB), uw=(IA, IC)
+  uv = angle_mod(v-u, 4*math.pi)
+  uw = angle_mod(w-u, 4*math.pi)
+  # check arc direction: clock wise (CW) arcs get a negative uw
+  uw = numpy.where(uw>uv, uw, uw-2*math.pi)
+  # return
+  r_arc_center_radius_angles = (IX, IY, IA, uw, u, w, r_ok)
+  return(r_arc_center_radius_angles)
+
+def triangulation(AX, AY, ai_AC, BX, BY, ai_BC, DX, DY):
+  """ knowing the coordinates of A and B and the lengths AC and BC, returns the coordinates of C
+      C is placed on the same side as D compare to the line (AB)
+      The D_direction fallback of the scalar version is not implemented: those cases get r_ok==False
+  """
+  b = ai_AC
+  a = ai_BC
+  r_ok = (b>=radian_epsilon)&(a>=radian_epsilon)
+  # calculation of the length c=AB
+  c = length(BX-AX, BY-AY)
+  r_ok &= (c>=radian_epsilon)
+  # calculation of the angle A with the law of cosines
+  cos_BAC = (b**2+c**2-a**2)/(2*b*c)
+  r_ok &= (numpy.abs(cos_BAC)<=1)
+  BAC = numpy.arccos(numpy.clip(cos_BAC, -1, 1))
+  # calculation of the angle xAB and BAD
+  xAB = numpy.arctan2(BY-AY, BX-AX)
+  xAD = numpy.arctan2(DY-AY, DX-AX)
+  BAD = angle_mod(xAD-xAB, 5*math.pi) - math.pi
+  r_ok &= (numpy.abs(BAD)>=radian_epsilon)
+  # calculation of the coordinates of C
+  xAC = xAB + numpy.copysign(BAC, BAD)
+  CX = AX+b*numpy.cos(xAC)
+  CY = AY+b*numpy.sin(xAC)
+  # for verification, duplication of the calculation via B
+  cos_ABC = (a**2+c**2-b**2)/(2*a*c)
+  r_ok &= (numpy.abs(cos_ABC)<=1)
+  ABC = numpy.arccos(numpy.clip(cos_ABC, -1, 1))
+  xBA = numpy.arctan2(AY-BY, AX-BX)
+  xBD = numpy.arctan2(DY-BY, DX-BX)
+  ABD = angle_mod(xBD-xBA, 5*math.pi) - math.pi
+  r_ok &= (numpy.abs(ABD)>=radian_epsilon)
+  xBC = xBA + numpy.copysign(ABC, ABD)
+  CX2 = BX+a*numpy.cos(xBC)
+  CY2 = BY+a*numpy.sin(xBC)
+  r_ok &= (numpy.abs(CX2-CX)<=radian_epsilon)&(numpy.abs(CY2-CY)<=radian_epsilon)
+  # return
+  r_C = (CX, CY, r_ok)
+  return(r_C)
+
+def line_equation(AX, AY, BX, BY):
+  """ Given the coordinates of two points, it returns the three coefficient of the line equation, the length of the segment and the inclination
+  """
+  lAB = length(BX-AX, BY-AY)
+  r_ok = (lAB>=radian_epsilon)
+  xAB = numpy.arctan2(BY-AY, BX-AX)
+  ABlx = (BY-AY)/lAB
+  ABly = -(BX-AX)/lAB
+  ABk = -(ABlx*AX+ABly*AY)
+  # return
+  r_line_equation = (ABlx, ABly, ABk, lAB, xAB, r_ok)
+  return(r_line_equation)
+
+def line_distance_point(AX, AY, BX, BY, ai_q):
+  """ Given the two points A and B and the distance q, what are the coordinates of Q, distance of q from A and AB
+  """
+  lAB = length(BX-AX, BY-AY)
+  cos_xAB = (BX-AX)/lAB
+  sin_xAB = (BY-AY)/lAB
+  QX = AX-ai_q*sin_xAB
+  QY = AY+ai_q*cos_xAB
+  ABkQ = -(sin_xAB*QX-cos_xAB*QY)
+  # return
+  r_Q = (QX, QY, ABkQ)
+  return(r_Q)
+
+def line_point_projection(a, b, c, MX, MY):
+  """ Given the line equation of AB (a*x+b*y+c=0) and the coordinates of M (MX,MY), returns the coordinates of P, projection of M on AB
+  """
+  d = -(b*MX-a*MY)
+  PX = -(c*a+d*b)
+  PY = d*a-c*b
+  # return
+  r_P = (PX, PY)
+  return(r_P)
+
+def line_circle_intersection(a, b, c, IX, IY, ai_R, CX, CY):
+  """ Given the line equation (a*x+b*y+c=0) and the circle of center I and radius R, returns the intersection M
+      C define the side of the intersection
+      The D_direction fallback of the scalar version is not implemented: those cases get r_ok==False
+  """
+  (PX, PY) = line_point_projection(a, b, c, IX, IY)
+  (C2X, C2Y) = line_point_projection(a, b, c, CX, CY)
+  IP2 = (PX-IX)**2+(PY-IY)**2
+  r_ok = (numpy.sqrt(IP2)<=ai_R)
+  PM = numpy.sqrt(numpy.maximum(ai_R**2-IP2, 0))
+  C2P = length(PX-C2X, PY-C2Y)
+  r_ok &= (C2P>=radian_epsilon)
+  MX = PX+(C2X-PX)/C2P*PM
+  MY = PY+(C2Y-PY)/C2P*PM
+  # return
+  r_line_circle_intersection = (MX, MY, r_ok)
+  return(r_line_circle_intersection)
+
+def line_line_intersection(a1, b1, c1, a2, b2, c2):
+  """ Given the line equations (a*x+b*y+c=0) of the two lines (AB) and (CD), returns the intersection M
+  """
+  determinant = a1*b2-a2*b1
+  r_ok = (numpy.abs(determinant)>=radian_epsilon)
+  MX = (c2*b1-c1*b2)/determinant
+  MY = (c1*a2-c2*a1)/determinant
+  # return
+  r_line_line_intersection = (MX, MY, r_ok)
+  return(r_line_line_intersection)
+
+def sub_smooth_corner_line_arc(AX, AY, CX, CY, DX, DY, EX, EY, ai_router_bit_request):
+  """ compute the corner centers of smoothed line-arc corners
+  """
+  (AClx, ACly, ACkA, lAC, xAC, r_ok) = line_equation(AX, AY, CX, CY)
+  (JX, JY, R2, uw2, u2, w2, ok2) = arc_center_radius_angles(CX, CY, DX, DY, EX, EY)
+  r_ok &= ok2
+  # arc orientation
+  o2 = numpy.copysign(1, uw2)
+  # sign of the tangent angle
+  tangent_angle = angle_mod(u2+o2*math.pi/2-xAC, 7*math.pi) - math.pi
+  r_ok &= (numpy.abs(tangent_angle)>=radian_epsilon)
+  o3 = numpy.copysign(1, tangent_angle)
+  # calculation of IS and JS
+  Q1_plus = o3
+  R2_plus = o2*o3
+  (QX, QY, ACkQ) = line_distance_point(AX, AY, CX, CY, Q1_plus*ai_router_bit_request)
+  JS = R2-R2_plus*ai_router_bit_request
+  # calculation of the coordiantes of S, the center of the router_bit in the smooth corner
+  (SX, SY, ok3) = line_circle_intersection(AClx, ACly, ACkQ, JX, JY, JS, CX, CY)
+  r_ok &= ok3
+  # calculation of U, the projection of S on AC
+  (UX, UY) = line_point_projection(AClx, ACly, ACkA, SX, SY)
+  # calculation of the angles xSU and xSJ
+  xSU = numpy.arctan2(UY-SY, UX-SX)
+  xSJ = numpy.arctan2(JY-SY, JX-SX)+(1+R2_plus)/2*math.pi
+  router_bit_arc_uw = angle_mod(xSJ-xSU, 4*math.pi)
+  router_bit_arc_uw = numpy.where(o3<0, router_bit_arc_uw-2*math.pi, router_bit_arc_uw)
+  # return
+  r_sub_smooth_corner_line_arc = (SX, SY, UX, UY, xSU, xSJ, router_bit_arc_uw, r_ok)
+  return(r_sub_smooth_corner_line_arc)
+
+def sub_smooth_corner_arc_arc(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, ai_router_bit_request):
+  """ Compute the smooth corner centers for arc-arc corners
+  """
+  (IX, IY, R1, uw1, u1, w1, r_ok) = arc_center_radius_angles(AX, AY, BX, BY, CX, CY)
+  (JX, JY, R2, uw2, u2, w2, ok2) = arc_center_radius_angles(CX, CY, DX, DY, EX, EY)
+  r_ok &= ok2
+  # arc orientation
+  o1 = numpy.copysign(1, uw1)
+  o2 = numpy.copysign(1, uw2)
+  # sign of the tangent angle
+  tangent_angle = angle_mod(u2-w1+(o2-o1)*math.pi/2, 9*math.pi) - math.pi
+  r_ok &= (numpy.abs(tangent_angle)>=radian_epsilon)&(numpy.abs(tangent_angle)<=math.pi-radian_epsilon)
+  o3 = numpy.copysign(1, tangent_angle)
+  # calculation of IS and JS
+  R1_plus = o1*o3
+  R2_plus = o2*o3
+  IS = R1-R1_plus*ai_router_bit_request
+  JS = R2-R2_plus*ai_router_bit_request
+  # calculation of the coordiantes of S, the center of the router_bit in the smooth corner
+  (SX, SY, ok3) = triangulation(IX, IY, IS, JX, JY, JS, CX, CY)
+  r_ok &= ok3
+  # calculation of the angles xSI and xSJ
+  xSI = numpy.arctan2(IY-SY, IX-SX)+(1+R1_plus)/2*math.pi
+  xSJ = numpy.arctan2(JY-SY, JX-SX)+(1+R2_plus)/2*math.pi
+  router_bit_arc_uw = angle_mod(xSJ-xSI, 4*math.pi)
+  router_bit_arc_uw = numpy.where(o3<0, router_bit_arc_uw-2*math.pi, router_bit_arc_uw)
+  # return
+  r_sub_smooth_corner_arc_arc = (SX, SY, xSI, xSJ, router_bit_arc_uw, r_ok)
+  return(r_sub_smooth_corner_arc_arc)
+
+def sub_enlarge_corner_end(SX, SY, CX, CY, router_bit_arc_uw, ai_router_bit_request):
+  """ common part of sub_enlarge_corner_line_arc() and sub_enlarge_corner_arc_arc(): compute the points F, G and H
+  """
+  r_ok = (numpy.abs(router_bit_arc_uw)<=math.pi)&(numpy.abs(router_bit_arc_uw)>=radian_epsilon)
+  corner_orientation = numpy.copysign(1, router_bit_arc_uw)
+  (SClx, SCly, SCkS, lSC, xSC, ok2) = line_equation(SX, SY, CX, CY)
+  r_ok &= ok2
+  (FX, FY, ok3) = line_circle_intersection(SClx, SCly, SCkS, CX, CY, ai_router_bit_request, SX, SY)
+  r_ok &= ok3
+  (GX, GY, SCkG) = line_distance_point(FX, FY, CX, CY, -1*corner_orientation*ai_router_bit_request)
+  (HX, HY, SCkH) = line_distance_point(FX, FY, CX, CY,  1*corner_orientation*ai_router_bit_request)
+  # return
+  r_sub_enlarge_corner_end = ((SClx, SCly, SCkG, SCkH), FX, FY, GX, GY, HX, HY, r_ok)
+  return(r_sub_enlarge_corner_end)
+
+def enlarge_deep(MX, MY, GX, GY, CX, CY, FX, FY):
+  """ check if an arc-arc intersection must be calculated. Return the sign of the depth of M compare to G
+  """
+  tmp_deep_x = (MX-GX)*(CX-FX)
+  tmp_deep_y = (MY-GY)*(CY-FY)
+  r_deep = numpy.where(numpy.abs(tmp_deep_x)<numpy.abs(tmp_deep_y), numpy.copysign(1, tmp_deep_y), numpy.copysign(1, tmp_deep_x))
+  return(r_deep)
+
+def sub_enlarge_corner_line_arc(AX, AY, CX, CY, DX, DY, EX, EY, ai_router_bit_request):
+  """ Compute the points related to enlarged line-arc corners
+  """
+  (SX, SY, UX, UY, xSU, xSJ, router_bit_arc_uw, r_ok) = sub_smooth_corner_line_arc(AX, AY, CX, CY, DX, DY, EX, EY, ai_router_bit_request)
+  ((SClx, SCly, SCkG, SCkH), FX, FY, GX, GY, HX, HY, ok2) = sub_enlarge_corner_end(SX, SY, CX, CY, router_bit_arc_uw, ai_router_bit_request)
+  r_ok &= ok2
+  (AClx, ACly, ACkC, lAC, xAC, ok3) = line_equation(AX, AY, CX, CY)
+  (JX, JY, R2, uw2, u2, w2, ok4) = arc_center_radius_angles(CX, CY, DX, DY, EX, EY)
+  (MX, MY, ok5) = line_line_intersection(SClx, SCly, SCkG, AClx, ACly, ACkC)
+  (NX, NY, ok6) = line_circle_intersection(SClx, SCly, SCkH, JX, JY, R2, (HX+SX)/2, (HY+SY)/2)
+  r_ok &= ok3&ok4&ok5&ok6
+  MG_deep = enlarge_deep(MX, MY, GX, GY, CX, CY, FX, FY)
+  NH_deep = enlarge_deep(NX, NY, HX, HY, CX, CY, FX, FY)
+  # compute the arc-arc intersection
+  (KX, KY, ok7) = line_circle_intersection(AClx, ACly, ACkC, FX, FY, ai_router_bit_request, GX, GY)
+  (LX, LY, ok8) = triangulation(JX, JY, R2, FX, FY, ai_router_bit_request, HX, HY)
+  r_ok &= (ok7|(MG_deep<=0))&(ok8|(NH_deep<=0))
+  MKX = numpy.where(MG_deep>0, KX, MX)
+  MKY = numpy.where(MG_deep>0, KY, MY)
+  NLX = numpy.where(NH_deep>0, LX, NX)
+  NLY = numpy.where(NH_deep>0, LY, NY)
+  enlarge_type_request_1 = numpy.where(MG_deep>0, 2, 3)
+  enlarge_type_request_2 = numpy.where(NH_deep>0, 2, 3)
+  r_ok &= (length(NLX-MKX, NLY-MKY)>=radian_epsilon)
+  # return
+  r_sub_enlarge_corner_line_arc = (MKX, MKY, GX, GY, HX, HY, NLX, NLY, enlarge_type_request_1, enlarge_type_request_2, r_ok)
+  return(r_sub_enlarge_corner_line_arc)
+
+def sub_enlarge_corner_arc_arc(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, ai_router_bit_request):
+  """ Compute the points related to enlarged arc-arc corners
+  """
+  (SX, SY, xSI, xSJ, router_bit_arc_uw, r_ok) = sub_smooth_corner_arc_arc(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY, ai_router_bit_request)
+  ((SClx, SCly, SCkG, SCkH), FX, FY, GX, GY, HX, HY, ok2) = sub_enlarge_corner_end(SX, SY, CX, CY, router_bit_arc_uw, ai_router_bit_request)
+  r_ok &= ok2
+  (IX, IY, R1, uw1, u1, w1, ok3) = arc_center_radius_angles(AX, AY, BX, BY, CX, CY)
+  (JX, JY, R2, uw2, u2, w2, ok4) = arc_center_radius_angles(CX, CY, DX, DY, EX, EY)
+  (MX, MY, ok5) = line_circle_intersection(SClx, SCly, SCkG, IX, IY, R1, (GX+SX)/2, (GY+SY)/2)
+  (NX, NY, ok6) = line_circle_intersection(SClx, SCly, SCkH, JX, JY, R2, (HX+SX)/2, (HY+SY)/2)
+  r_ok &= ok3&ok4&ok5&ok6
+  MG_deep = enlarge_deep(MX, MY, GX, GY, CX, CY, FX, FY)
+  NH_deep = enlarge_deep(NX, NY, HX, HY, CX, CY, FX, FY)
+  # compute the arc-arc intersection
+  (KX, KY, ok7) = triangulation(IX, IY, R1, FX, FY, ai_router_bit_request, GX, GY)
+  (LX, LY, ok8) = triangulation(JX, JY, R2, FX, FY, ai_router_bit_request, HX, HY)
+  r_ok &= (ok7|(MG_deep<=0))&(ok8|(NH_deep<=0))
+  MKX = numpy.where(MG_deep>0, KX, MX)
+  MKY = numpy.where(MG_deep>0, KY, MY)
+  NLX = numpy.where(NH_deep>0, LX, NX)
+  NLY = numpy.where(NH_deep>0, LY, NY)
+  enlarge_type_request_1 = numpy.where(MG_deep>0, 2, 3)
+  enlarge_type_request_2 = numpy.where(NH_deep>0, 2, 3)
+  r_ok &= (length(NLX-MKX, NLY-MKY)>=radian_epsilon)
+  # return
+  r_sub_enlarge_corner_arc_arc = (MKX, MKY, GX, GY, HX, HY, NLX, NLY, enlarge_type_request_1, enlarge_type_request_2, r_ok)
+  return(r_sub_enlarge_corner_arc_arc)
+
+def curve_arc(AX, AY, CX, CY, At, ai_router_bit_request):
+  """ Given the start-points (A), the end-points (C) and the arc tangents (At) at (A), return the middle-points (B) and the arc tangents (Ct) at (C)
+  """
+  (AClx, ACly, ACk, lAC, xAC, r_ok) = line_equation(AX, AY, CX, CY)
+  # calcultion of I the middle of [AC]
+  IX = (AX+CX)/2
+  IY = (AY+CY)/2
+  # line equation of the bisection (OI) of [AC]
+  OIlx = ACly
+  OIly = -1*AClx
+  OIk = -1*(OIlx*IX+OIly*IY)
+  # line equation of (OA)
+  OAlx = numpy.cos(At)
+  OAly = numpy.sin(At)
+  OAk = -1*(OAlx*AX+OAly*AY)
+  # O intersection of (OI) and (OA). It's the center of the arc
+  (OX, OY, ok2) = line_line_intersection(OIlx, OIly, OIk, OAlx, OAly, OAk)
+  r_ok &= ok2
+  # verification of the distance OA and OC
+  lOA = length(AX-OX, AY-OY)
+  lOC = length(CX-OX, CY-OY)
+  r_ok &= (numpy.abs(lOC-lOA)<=radian_epsilon)&(lOA>=ai_router_bit_request)
+  # calculation of the angles (Ox, OA) and (Ox, OC)
+  xOA = numpy.arctan2((AY-OY)/lOA, (AX-OX)/lOA)
+  xOC = numpy.arctan2((CY-OY)/lOC, (CX-OX)/lOC)
+  # arc orientation = sign of the angle (At,AC)
+  AtAC = numpy.fmod(xAC-At+5*math.pi, 2*math.pi) - math.pi
+  # calculation of the angle AOC
+  AOC = numpy.where(AtAC>0, numpy.fmod(xOC-xOA+4*math.pi, 2*math.pi), -1*numpy.fmod(xOA-xOC+4*math.pi, 2*math.pi))
+  r_ok &= (numpy.abs(AOC)>=radian_epsilon)
+  # calculation of B
+  xOB = xOA + AOC/2
+  BX = OX+lOA*numpy.cos(xOB)
+  BY = OY+lOA*numpy.sin(xOB)
+  # calculation of the tangent inclination Ct in C
+  Ct = xOC + numpy.copysign(math.pi/2, AtAC)
+  # return
+  r_curve_arc = (BX, BY, Ct, r_ok)
+  return(r_curve_arc)
+
+def smooth_c_curve(AX, AY, xAt, EX, EY, xEt, ai_precision, ai_router_bit_request):
+  """ Compute the two arcs (A,B,C) and (C,D,E) joining the points A and E with the tangents xAt and xEt
+      r_line is 1 for the segments that must be a line because of ai_precision, 2 because of an inflexion and 0 for the arcs
+      The other segments that generate a warning get r_ok==False
+  """
+  # calculation of the inclination of AE
+  lAE = length(EX-AX, EY-AY)
+  r_ok = (lAE>0)
+  xAE = numpy.arctan2((EY-AY)/lAE, (EX-AX)/lAE)
+  # calculation of the inclination of AC
+  AtAE = numpy.fmod(xAt-xAE+5*math.pi, 2*math.pi)-math.pi
+  xAC = numpy.fmod(xAE + AtAE/2 + 5*math.pi, 2*math.pi) - math.pi
+  AClx = numpy.sin(xAC)
+  ACly = -1*numpy.cos(xAC)
+  ACk = -1*(AClx*AX+ACly*AY)
+  # calculation of the inclination of EC
+  EtEA = numpy.fmod(xEt-xAE+5*math.pi, 2*math.pi)-math.pi
+  xEC = numpy.fmod(xAE+math.pi + EtEA/2 + 5*math.pi, 2*math.pi) - math.pi
+  EClx = numpy.sin(xEC)
+  ECly = -1*numpy.cos(xEC)
+  ECk = -1*(EClx*EX+ECly*EY)
+  # only the segments without large angle
+  r_ok &= (numpy.abs(AtAE)<=math.pi/3)&(numpy.abs(EtEA)<=math.pi/3)
+  # line-segments
+  r_line = numpy.where((numpy.abs(AtAE)<ai_precision)|(numpy.abs(EtEA)<ai_precision), 1, numpy.where((AtAE*EtEA)>0, 2, 0))
+  # the arcs are only computed for the arc-segments
+  BX = numpy.full(len(lAE), numpy.nan)
+  (BY, CX, CY, DX, DY) = (BX.copy(), BX.copy(), BX.copy(), BX.copy(), BX.copy())
+  arc_idx = numpy.nonzero(r_ok&(r_line==0))[0]
+  if(len(arc_idx)>0):
+    (iAX, iAY, ixAt, iEX, iEY, ixEt, ixAE) = (AX[arc_idx], AY[arc_idx], xAt[arc_idx], EX[arc_idx], EY[arc_idx], xEt[arc_idx], xAE[arc_idx])
+    # C intersection of (AC) and (EC). it is the junction point between the two arcs
+    (iCX, iCY, ok2) = line_line_intersection(AClx[arc_idx], ACly[arc_idx], ACk[arc_idx], EClx[arc_idx], ECly[arc_idx], ECk[arc_idx])
+    (iBX, iBY, xCt, ok3) = curve_arc(iAX, iAY, iCX, iCY, ixAt, ai_router_bit_request)
+    ok2 &= ok3&(numpy.abs(numpy.fmod(xCt-ixAE+5*math.pi, 2*math.pi)-math.pi)<=ai_precision)
+    (iDX, iDY, xEt2, ok4) = curve_arc(iCX, iCY, iEX, iEY, ixAE, ai_router_bit_request)
+    ok2 &= ok4&(numpy.abs(numpy.fmod(xEt2-ixEt+5*math.pi, 2*math.pi)-math.pi)<=ai_precision)
+    r_ok[arc_idx] = ok2
+    (BX[arc_idx], BY[arc_idx], CX[arc_idx], CY[arc_idx], DX[arc_idx], DY[arc_idx]) = (iBX, iBY, iCX, iCY, iDX, iDY)
+  # return
+  r_smooth_c_curve = (BX, BY, CX, CY, DX, DY, xAC, xEC, r_line, r_ok)
+  return(r_smooth_c_curve)
+
+def arc_middle(AX, AY, BX, BY, CX, CY, DX, DY, EX, EY):
+  """ Compute the middle points of the arcs (A,B,C) with the new end points D and E
+  """
+  (IX, IY, arc_radius, uw, u, w, r_ok) = arc_center_radius_angles(AX, AY, BX, BY, CX, CY)
+  # check I is equidistant of A,B,C,D,E
+  IA = length(AX-IX, AY-IY)
+  ID = length(DX-IX, DY-IY)
+  IE = length(EX-IX, EY-IY)
+  r_ok &= (numpy.abs(ID-IA)<=radian_epsilon)&(numpy.abs(IE-IA)<=radian_epsilon)
+  # calculation of the angles d=(Ix, ID) and e=(Ix, IE)
+  d = numpy.arctan2(DY-IY, DX-IX)
+  e = numpy.arctan2(EY-IY, EX-IX)
+  # calculation of the angles ud=(IA, ID), ue=(IA, IE) and de=(ID, IE)
+  ccw = (uw>=0)
+  ud = numpy.where(ccw, angle_mod(d-u, 4*math.pi), -1*angle_mod(u-d, 4*math.pi))
+  ue = numpy.where(ccw, angle_mod(e-u, 4*math.pi), -1*angle_mod(u-e, 4*math.pi))
+  de = numpy.where(ccw, angle_mod(e-d, 4*math.pi), -1*angle_mod(d-e, 4*math.pi))
+  r_ok &= (numpy.abs(ud)<=2*math.pi-radian_epsilon)
+  r_ok &= (numpy.abs(uw)>=numpy.abs(ud)-radian_epsilon)&(numpy.abs(uw)>=numpy.abs(ue)-radian_epsilon)
+  r_ok &= (numpy.abs(ud)<=numpy.abs(ue))
+  # calculation of F
+  f = d + de/2
+  FX = IX+arc_radius*numpy.cos(f)
+  FY = IY+arc_radius*numpy.sin(f)
+  # return
+  r_middle_point = (FX, FY, r_ok)
+  return(r_middle_point)
+